@@ -14,6 +14,68 @@ def mexico_now():
 # DB NAME
 DB_NAME = "tortilleria"
 
+# DB TUNING (PRAGMAs SQLite aplicados a cada conexión)
+# pos-fast: WAL + synchronous=NORMAL, un corte de luz puede perder el último commit pero nunca corrompe la DB
+# durable: WAL + synchronous=FULL, cada commit hace fsync (más lento al cobrar)
+DB_TUNING_PROFILE = "pos-fast"
+
+DB_TUNING_PROFILES = {
+    "pos-fast": {
+        "pragmas": {
+            "journal_mode": "WAL",
+            "synchronous": "NORMAL",
+            "busy_timeout": 5000,           # ms esperando un lock antes de fallar
+            "cache_size": -32000,           # negativo = KiB (~32 MB)
+            "mmap_size": 268435456,         # 256 MB
+            "temp_store": "MEMORY",
+            "wal_autocheckpoint": 1000,     # páginas en el -wal antes de hacer checkpoint
+        },
+    },
+    "durable": {
+        "pragmas": {
+            "journal_mode": "WAL",
+            "synchronous": "FULL",
+            "busy_timeout": 10000,
+            "cache_size": -8000,
+            "mmap_size": 0,
+            "temp_store": "DEFAULT",
+            "wal_autocheckpoint": 500,
+        },
+    },
+}
+
+# BACKGROUND TASKS (consultas fuera del hilo de Tkinter)
+TASK_RUNNER_MAX_WORKERS = 4
+TASK_RUNNER_POLL_MS = 30                 # cada cuánto el event loop revisa resultados listos
+
+# VISTAS (ver app/gui/view_manager.py)
+VIEW_CACHE_SIZE = 4                      # vistas que se conservan ocultas al navegar (0 = destruir siempre)
+
+# COBRO EN MOSTRADOR
+SALES_CHECKOUT_QUEUE = False             # True: el cobro no espera a la DB, ver app/services/sale_queue.py
+SALE_QUEUE_BATCH_SIZE = 50               # ventas máximas por transacción
+SALE_QUEUE_FLUSH_MS = 200                # cuánto espera la cola a juntar más ventas
+
+# REPORTES: consultas máximas por dataset (ver app/data/report_queries.py)
+REPORT_QUERY_BUDGETS = {
+    "sales": 3,                          # 2 + 1 solo cuando cierra un mes (report_cache.closed)
+    "customers": 1,
+    "supplies": 3,
+    "suppliers": 2,
+    "customer_products": 1,
+    "supplier_purchases": 1,
+}
+
+# CACHÉ DE REPORTES (ver app/services/report_cache.py)
+REPORT_CACHE_FILE = f"{DB_NAME}_reportes.json"   # agregados de periodos cerrados, junto a la DB
+
+# PANELES DE DETALLE: consultas máximas sin importar cuántos renglones tenga (ver app/data/query_counter.py)
+DETAIL_QUERY_BUDGETS = {
+    "order_detail": 2,
+    "sale_detail": 1,
+    "order_refunds": 1,
+}
+
 # DEFAULT PRODUCTS
 CSV_PATH = _os.path.join(_os.path.dirname(__file__), 'data', 'default', 'products.csv')
 
@@ -92,6 +154,12 @@ ORDER_STATUSES = {
     ORDER_STATUSES_CANCEL:  {"label": "Cancelado",  "color": "secondary"},
 }
 
+# DAILY ROLLUPS (totales por día x canal, ver app/data/providers/rollups.py)
+
+ROLLUP_CHANNEL_SALE = 'venta'                        # ventas de mostrador (Sale.date)
+ROLLUP_CHANNEL_ORDER = 'pedido'                      # pedidos creados (Order.date)
+ROLLUP_CHANNEL_ORDER_COMPLETED = 'pedido_completado' # pedidos completados (Order.completed_at)
+
 # PAYMENT STATUSES
 
 PAYMENT_STATUS_ALL = "todos"
@@ -121,15 +189,27 @@ SUPPLY_UNITS = ["kilos", "litros", "piezas", "costales", "bultos", "cajas", "ser
 
 # AI ASSISTANT
 
-DANGEROUS_KEYWORDS = [
-    "DROP", "DELETE", "INSERT", "UPDATE", "ALTER",
-    "CREATE", "TRUNCATE", "EXEC", "EXECUTE",
-    "--", ";--", "/*", "*/", "UNION"
-]
 AI_ASSISTANT_MODEL = "claude-sonnet-4-20250514"
 AI_ASSISTANT_MAX_ITERATIONS = 5
 AI_ASSISTANT_TEMPERATURE = 0.3
 AI_ASSISTANT_MAX_TOKENS = 2000
+AI_STREAM_POLL_MS = 50                   # cada cuánto la burbuja del chat toma el texto que llegó
+AI_ASSISTANT_USE_FAKE = _os.environ.get("TORTILLERIA_FAKE_AI") == "1"   # respuestas fijas, sin red
+AI_METRICS_HISTORY = 100                 # llamadas recientes con latencia y tokens
+
+# SQL DEL ASISTENTE: engine de solo lectura aparte (ver app/data/readonly_db.py)
+AI_SQL_POOL_SIZE = 2                     # conexiones de solo lectura
+AI_SQL_TIME_BUDGET_S = 3.0               # tiempo máximo por consulta antes de interrumpirla
+AI_SQL_PROGRESS_OPS = 10000              # instrucciones de SQLite entre revisiones del tiempo
+AI_SQL_FETCH_SIZE = 100                  # renglones por fetchmany
+AI_SQL_MAX_ROWS = 200                    # renglones máximos que se regresan al modelo
+AI_SQL_MAX_BYTES = 16000                 # tamaño máximo (JSON) de los renglones regresados
+AI_SQL_COUNT_LIMIT = 100000              # tras recortar, hasta cuántos renglones se siguen contando
+AI_SQL_VALIDATED_CACHE = 256             # sentencias ya validadas que se recuerdan (LRU)
+AI_TOOL_TURN_BUDGET_S = 5.0              # tiempo máximo para todas las consultas de una misma respuesta
+AI_RESULT_DECIMALS = 2                   # decimales de los números que se mandan al modelo
+AI_RESULT_SUMMARY_ROWS = 30              # con más renglones se manda top-N + resumen por columna
+AI_RESULT_TOP_N = 10                     # renglones que se muestran cuando se resume
 
 QUICK_QUESTIONS = [
     "¿Cuántos ingresos generé este mes?",
@@ -141,6 +221,20 @@ QUICK_QUESTIONS = [
 ORDERS_COLLECTION = "orders"
 SERVICE_ACCOUNT_PATH = _os.path.join(_os.path.dirname(_os.path.dirname(__file__)), "serviceAccount.json")
 
+FIRESTORE_USE_FAKE = _os.environ.get("TORTILLERIA_FAKE_FIRESTORE") == "1"   # cliente en memoria, sin red
+
+# FIRESTORE OUTBOX (escrituras pendientes, ver app/services/firestore_outbox.py)
+FIRESTORE_OUTBOX_BATCH_SIZE = 100        # documentos por batch (Firestore acepta hasta 500 escrituras)
+FIRESTORE_OUTBOX_POLL_S = 5              # revisión periódica para reintentos
+FIRESTORE_OUTBOX_BACKOFF_BASE_S = 2      # espera tras el 1er fallo; se duplica en cada intento
+FIRESTORE_OUTBOX_BACKOFF_MAX_S = 300
+FIRESTORE_OUTBOX_ISOLATE_AFTER = 3       # tras N fallos el documento se envía solo (no frena a los demás)
+FIRESTORE_OUTBOX_MAX_ATTEMPTS = 10       # tras N fallos se marca fallido (failed_at) y ya no se reintenta
+
+# FIRESTORE LISTENER (cambios desde la app móvil, ver app/services/firestore_listener.py)
+FIRESTORE_ORDERS_READ_TIME_KEY = "firestore_orders_read_time"   # sync_state: último read_time aplicado
+FIRESTORE_NOTIFY_DEBOUNCE_MS = 300       # agrupa avisos a la UI de varios snapshots seguidos
+
 AI_ASSISTANT_SYSTEM_PROMPT_SCHEMA_DB = """ 
     DATABASE SCHEMA - Tortillería (SQLite):
 
@@ -5,7 +5,8 @@ from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.orm import Session
 
-from app.constants import DB_NAME
+from app.constants import DB_NAME, DB_TUNING_PROFILE
+from app.data.sqlite_tuning import apply_sqlite_tuning
 
 # En .exe la DB se guarda junto al ejecutable, en desarrollo en la raíz del proyecto
 _db_dir = os.path.dirname(sys.executable) if getattr(sys, 'frozen', False) else ''
@@ -14,10 +15,16 @@ engine = create_engine(
     DATABASE_URL,
     connect_args={"check_same_thread": False}
 )
+apply_sqlite_tuning(engine, DB_TUNING_PROFILE)
 SessionLocal = sessionmaker[Session](autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 
 
+def data_path(filename):
+    """Ruta de un archivo de datos junto a la DB."""
+    return os.path.join(_db_dir, filename)
+
+
 def get_db() -> Session:
     """
     Returns a new database session.
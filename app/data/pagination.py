@@ -0,0 +1,65 @@
+"""
+Paginación por llave (keyset / seek) sobre (fecha, id).
+
+En lugar de OFFSET, que recorre y descarta todos los renglones anteriores,
+cada página se pide relativa al primer/último renglón de la página actual:
+
+    WHERE (fecha, id) < (:fecha, :id) ORDER BY fecha DESC, id DESC LIMIT n
+
+Los índices sobre la fecha ya terminan en el rowid (= id), así que cada
+página cuesta O(n) sin importar qué tan profundo esté el historial.
+"""
+
+from collections import namedtuple
+from sqlalchemy import tuple_
+
+
+# rows: renglones de la página (más reciente primero)
+# first / last: llave (fecha, id) del primer y último renglón, o None
+# has_more: hay más renglones en la dirección pedida
+KeysetPage = namedtuple("KeysetPage", "rows first last has_more")
+
+
+def keyset_page(query, date_col, id_col, limit, after=None, before=None, last=False, offset=0):
+    """
+    Pagina `query` en orden (date_col, id_col) descendente.
+
+    after:  llave del último renglón mostrado  -> página siguiente (más antigua)
+    before: llave del primer renglón mostrado  -> página anterior (más reciente)
+    last:   la página más antigua
+    offset: salto directo, solo para "ir a la página N"
+
+    `query` no debe traer order_by; los renglones deben exponer las columnas
+    date_col e id_col por nombre.
+    """
+    backwards = before is not None or last
+    key = tuple_(date_col, id_col)
+
+    if after is not None:
+        query = query.filter(key < tuple_(*after))
+    elif before is not None:
+        query = query.filter(key > tuple_(*before))
+
+    if backwards:
+        query = query.order_by(date_col.asc(), id_col.asc())
+    else:
+        query = query.order_by(date_col.desc(), id_col.desc())
+
+    if offset:
+        query = query.offset(offset)
+
+    rows = query.limit(limit + 1).all()
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    if backwards:
+        rows.reverse()
+
+    def row_key(row):
+        return getattr(row, date_col.key), getattr(row, id_col.key)
+
+    return KeysetPage(
+        rows,
+        row_key(rows[0]) if rows else None,
+        row_key(rows[-1]) if rows else None,
+        has_more,
+    )
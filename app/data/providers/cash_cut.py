@@ -1,9 +1,10 @@
 from datetime import datetime, timedelta
 from sqlalchemy import func
 from app.models.cash_cut import CashCut
-from app.models import Sale, Order
 from app.data.database import get_db
-from app.constants import mexico_now
+from app.data.pagination import keyset_page
+from app.data.providers.rollups import rollup_provider
+from app.constants import mexico_now, ROLLUP_CHANNEL_SALE, ROLLUP_CHANNEL_ORDER_COMPLETED
 
 
 def _day_range(d):
@@ -61,47 +62,24 @@ class CashCutProvider:
             db.close()
 
     def get_current_period_summary(self):
-        db = get_db()
-        try:
-            day_start, day_end = _day_range(mexico_now().date())
-
-            # Sales of today
-            sales_result = db.query(
-                func.count(Sale.id),
-                func.coalesce(func.sum(Sale.total), 0.0)
-            ).filter(
-                Sale.date >= day_start,
-                Sale.date < day_end,
-            ).first()
+        today = mexico_now().date()
 
-            sales_count = sales_result[0] or 0
-            sales_total = sales_result[1] or 0.0
-
-            # Completed orders of today
-            orders_result = db.query(
-                func.count(Order.id),
-                func.coalesce(func.sum(Order.total), 0.0)
-            ).filter(
-                Order.status == 'completado',
-                Order.completed_at >= day_start,
-                Order.completed_at < day_end,
-            ).first()
+        # Sales of today
+        sales_count, sales_total, _ = rollup_provider.get_totals(ROLLUP_CHANNEL_SALE, today)
 
-            orders_count = orders_result[0] or 0
-            orders_total = orders_result[1] or 0.0
+        # Completed orders of today
+        orders_count, orders_total, _ = rollup_provider.get_totals(ROLLUP_CHANNEL_ORDER_COMPLETED, today)
 
-            expected_total = sales_total + orders_total
+        expected_total = sales_total + orders_total
 
-            return {
-                'today': mexico_now().date(),
-                'sales_count': sales_count,
-                'sales_total': sales_total,
-                'orders_count': orders_count,
-                'orders_total': orders_total,
-                'expected_total': expected_total,
-            }
-        finally:
-            db.close()
+        return {
+            'today': today,
+            'sales_count': sales_count,
+            'sales_total': sales_total,
+            'orders_count': orders_count,
+            'orders_total': orders_total,
+            'expected_total': expected_total,
+        }
 
     def save(self, data):
         db = get_db()
@@ -157,6 +135,31 @@ class CashCutProvider:
         finally:
             db.close()
 
+    def get_page(self, limit, filters=None, **cursor):
+        """Página keyset sobre (closed_at, id); cursor: after / before / last / offset"""
+        db = get_db()
+        try:
+            query = db.query(
+                CashCut.id,
+                CashCut.closed_at,
+                CashCut.expected_total,
+                CashCut.declared_cash,
+                CashCut.declared_card,
+                CashCut.declared_transfer,
+                CashCut.declared_total,
+                CashCut.difference,
+                CashCut.sales_count,
+                CashCut.orders_count,
+            )
+
+            if filters:
+                for f in filters:
+                    query = query.filter(f)
+
+            return keyset_page(query, CashCut.closed_at, CashCut.id, limit, **cursor)
+        finally:
+            db.close()
+
     def get_count(self, filters=None):
         db = get_db()
         try:
@@ -1,11 +1,15 @@
 from app.data.database import get_db
 from app.models import CustomerProductPrice
+from app.services.catalog_cache import catalog_cache, PRICES
 
 
 class CustomerPriceProvider:
 
     def get_prices_for_customer(self, customer_id):
         """Retorna dict {product_id: custom_price} para un cliente."""
+        return dict(catalog_cache.get(PRICES, customer_id, lambda: self._load_prices(customer_id)))
+
+    def _load_prices(self, customer_id):
         db = get_db()
 
         try:
@@ -41,6 +45,7 @@ class CustomerPriceProvider:
                 db.add(record)
 
             db.commit()
+            catalog_cache.invalidate(PRICES)
             return True
         except Exception as e:
             db.rollback()
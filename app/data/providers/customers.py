@@ -1,11 +1,15 @@
 from app.data.database import get_db
 from app.models import Customer
+from app.services.catalog_cache import catalog_cache, CUSTOMERS
 from app.constants import CUSTOMER_CATEGORIES, CUSTOMER_MOSTRADOR_NAME, mexico_now
 
 
 class CustomerProvider:
 
     def get_all(self):
+        return list(catalog_cache.get(CUSTOMERS, "active", self._load_all))
+
+    def _load_all(self):
 
         db = get_db()
 
@@ -28,11 +32,19 @@ class CustomerProvider:
             db.close()
 
     def get_by_category(self, category):
+        """(id, customer_name) del primer cliente activo de la categoría, o None"""
+        return catalog_cache.get(CUSTOMERS, ("category", category), lambda: self._load_by_category(category))
+
+    def _load_by_category(self, category):
         
         db = get_db()
 
         try:
-            customer = db.query(Customer).filter(
+            # Renglón inmutable: el mismo valor se comparte desde la caché
+            customer = db.query(
+                Customer.id,
+                Customer.customer_name
+            ).filter(
                 Customer.customer_category == category,
                 Customer.active == True
             ).first()
@@ -77,6 +89,7 @@ class CustomerProvider:
             db.add(customer)
             db.commit()
             db.refresh(customer)
+            catalog_cache.invalidate(CUSTOMERS)
        
             return True, customer.id
         except Exception as e:
@@ -104,6 +117,7 @@ class CustomerProvider:
                 customer.updated_at = mexico_now()
         
                 db.commit()
+                catalog_cache.invalidate(CUSTOMERS)
         
                 return True, "Cliente actualizado"
         
@@ -129,6 +143,7 @@ class CustomerProvider:
                 
                 customer.active = False
                 db.commit()
+                catalog_cache.invalidate(CUSTOMERS)
                 
                 return True, "Cliente eliminado"
 
@@ -169,6 +184,7 @@ class CustomerProvider:
                 )
                 db.add(customer)
                 db.commit()
+                catalog_cache.invalidate(CUSTOMERS)
 
         except Exception as e:
             db.rollback()
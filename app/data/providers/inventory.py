@@ -3,6 +3,7 @@ import csv
 from app.data.database import get_db
 from app.constants import CSV_PATH
 from app.models import Product
+from app.services.catalog_cache import catalog_cache, PRODUCTS
 
 
 class InventoryProvider:
@@ -28,11 +29,15 @@ class InventoryProvider:
 
                 db.add_all(productos)
                 db.commit()
+                catalog_cache.invalidate(PRODUCTS)
 
         finally:
             db.close()
 
     def get_all(self):
+        return list(catalog_cache.get(PRODUCTS, "active", self._load_all))
+
+    def _load_all(self):
 
         db = get_db()
 
@@ -74,6 +79,7 @@ class InventoryProvider:
             db.add(product)
             db.commit()
             db.refresh(product)
+            catalog_cache.invalidate(PRODUCTS)
             
             return True, product.id
        
@@ -98,6 +104,7 @@ class InventoryProvider:
                 product.name = name
                 product.price = price
                 db.commit()
+                catalog_cache.invalidate(PRODUCTS)
 
                 return True, "Producto actualizado"
             
@@ -122,6 +129,7 @@ class InventoryProvider:
             if product:
                 product.active = False
                 db.commit()
+                catalog_cache.invalidate(PRODUCTS)
                 return True, "Producto eliminado"
             
             return False, "Producto no encontrado"
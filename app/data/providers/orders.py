@@ -1,16 +1,29 @@
-from app.models import Order, OrderDetail
+from app.models import Order, OrderDetail, FirestoreOutbox, Product
+from app.models.orders import payment_status_for
 from app.models.order_refund import OrderRefund
 from datetime import datetime, timedelta
-from sqlalchemy import func, case, literal
+from sqlalchemy import func, case, literal, insert, null, select, union_all
 from app.data.database import get_db
+from app.data.pagination import keyset_page
+from app.data.query_counter import QueryCounter
+from app.data.providers.rollups import rollup_provider
+from app.data.providers.sync_state import sync_state_provider
 from app.constants import (
     mexico_now,
+    ROLLUP_CHANNEL_ORDER,
+    ROLLUP_CHANNEL_ORDER_COMPLETED,
     PAYMENT_STATUS_UNPAID,
     PAYMENT_STATUS_PARTIAL,
     PAYMENT_STATUS_PAID,
     ORDER_STATUSES_PENDING,
+    ORDER_STATUSES_COMPLETE,
+    ORDERS_COLLECTION,
+    FIRESTORE_ORDERS_READ_TIME_KEY,
+    DETAIL_QUERY_BUDGETS,
 )
 from app.services.firestore_service import firestore_service
+from app.services.task_runner import task_runner
+from app.services.change_bus import change_bus, OP_INSERT
 
 
 class OrderProvider:
@@ -27,39 +40,51 @@ class OrderProvider:
 
         db = get_db()
         try:
-            order = Order(
-                total=total,
-                customer_id=customer_id,
-                status='pendiente',
-                notes=notes,
-                amount_paid=amount_paid
+            now = mexico_now()
+            order_id = db.execute(
+                insert(Order).values(
+                    date=now,
+                    total=total,
+                    customer_id=customer_id,
+                    status='pendiente',
+                    notes=notes,
+                    amount_paid=amount_paid
+                ).returning(Order.id)
+            ).scalar_one()
+
+            if items:
+                db.execute(insert(OrderDetail), [
+                    {
+                        'order_id': order_id,
+                        'product_id': item['id'],
+                        'quantity': item['quantity'],
+                        'unit_price': item['price'],
+                        'subtotal': item['subtotal'],
+                    }
+                    for item in items
+                ])
+
+            change_bus.touch(db, Order.__tablename__, OP_INSERT, [order_id])
+
+            rollup_provider.record(
+                db, ROLLUP_CHANNEL_ORDER, now, total,
+                [(item['id'], item['quantity'], item['subtotal']) for item in items]
             )
-            db.add(order)
-            db.flush()
-
-            for item in items:
-                detail = OrderDetail(
-                    order_id=order.id,
-                    product_id=item['id'],
-                    quantity=item['quantity'],
-                    unit_price=item['price'],
-                    subtotal=item['subtotal']
-                )
-                db.add(detail)
-
-            db.commit()
 
-            # Sync with Firestore
+            # Sync with Firestore (outbox, se envía en segundo plano)
             firestore_service.add_order(
-                order_id=order.id,
+                db,
+                order_id=order_id,
                 customer_name=customer_name,
                 items=items,
                 total=total,
                 amount_paid=amount_paid,
-                created_at=order.date.isoformat() if order.date else mexico_now().isoformat(),
+                created_at=now.isoformat(),
             )
 
-            return True, order.id
+            db.commit()
+
+            return True, order_id
         except Exception as e:
             db.rollback()
             return False, str(e)
@@ -95,6 +120,52 @@ class OrderProvider:
         finally:
             db.close()
 
+    def get_page(self, limit, filters=None, **cursor):
+        """Página keyset sobre (date, id); cursor: after / before / last / offset"""
+
+        db = get_db()
+
+        try:
+            query = db.query(
+                Order.id,
+                Order.date,
+                Order.total,
+                Order.status,
+                Order.customer_id,
+                Order.amount_paid
+            )
+
+            if filters:
+                query = query.filter(*filters)
+
+            return keyset_page(query, Order.date, Order.id, limit, **cursor)
+
+        finally:
+            db.close()
+
+    def get_by_ids(self, order_ids, filters=None):
+        """Renglones como los de get_page solo para esos pedidos (los que siguen cumpliendo filters)"""
+
+        db = get_db()
+
+        try:
+            query = db.query(
+                Order.id,
+                Order.date,
+                Order.total,
+                Order.status,
+                Order.customer_id,
+                Order.amount_paid
+            ).filter(Order.id.in_(order_ids))
+
+            if filters:
+                query = query.filter(*filters)
+
+            return query.all()
+
+        finally:
+            db.close()
+
     def get_count(self, filters=None):
 
         db = get_db()
@@ -107,6 +178,25 @@ class OrderProvider:
         finally:
             db.close()
 
+    def get_page_async(self, owner, on_done, limit, filters=None, **cursor):
+        """get_page en segundo plano; on_done(page) corre en el hilo de la UI"""
+        return task_runner.submit(
+            owner, self.get_page, limit, filters,
+            on_done=on_done, key="orders_page", **cursor
+        )
+
+    def get_by_ids_async(self, owner, on_done, order_ids, filters=None):
+        return task_runner.submit(
+            owner, self.get_by_ids, order_ids, filters,
+            on_done=on_done
+        )
+
+    def get_count_async(self, owner, on_done, filters=None):
+        return task_runner.submit(
+            owner, self.get_count, filters,
+            on_done=on_done, key="orders_count"
+        )
+
     def build_status_filter(self, status):
         return [Order.status == status]
 
@@ -154,36 +244,94 @@ class OrderProvider:
         finally:
             db.close()
 
-    def get_by_id(self, order_id):
+    def get_detail(self, order_id):
+        """
+        Pedido para el panel de detalle en 2 consultas sin importar cuántos
+        renglones tenga: el encabezado, y renglones + devoluciones con el
+        nombre del producto (UNION ALL).
+        """
 
         db = get_db()
 
         try:
-            order = db.query(Order).filter(Order.id == order_id).first()
-
-            if order:
-                return {
-                    'id': order.id,
-                    'date': order.date,
-                    'total': order.total,
-                    'status': order.status,
-                    'completed_at': order.completed_at,
-                    'customer_id': order.customer_id,
-                    'notes': order.notes,
-                    'amount_paid': order.amount_paid or 0.0,
-                    'payment_status': order.payment_status,
-                    'details': [
-                        {
-                            'product_id': d.product_id,
-                            'product_name': d.product.name if d.product else 'N/A',
-                            'quantity': d.quantity,
-                            'unit_price': d.unit_price,
-                            'subtotal': d.subtotal
-                        }
-                        for d in order.order_details
-                    ]
-                }
-            return None
+            with QueryCounter("order_detail", DETAIL_QUERY_BUDGETS["order_detail"]):
+                order = db.query(
+                    Order.id,
+                    Order.date,
+                    Order.total,
+                    Order.status,
+                    Order.completed_at,
+                    Order.customer_id,
+                    Order.notes,
+                    Order.amount_paid
+                ).filter(Order.id == order_id).first()
+
+                if not order:
+                    return None
+
+                lines = union_all(
+                    select(
+                        literal('detail').label('kind'),
+                        OrderDetail.id.label('id'),
+                        OrderDetail.product_id.label('product_id'),
+                        Product.name.label('product_name'),
+                        OrderDetail.quantity.label('quantity'),
+                        OrderDetail.unit_price.label('unit_price'),
+                        OrderDetail.subtotal.label('subtotal'),
+                        null().label('comments')
+                    ).outerjoin(
+                        Product, Product.id == OrderDetail.product_id
+                    ).where(OrderDetail.order_id == order_id),
+                    select(
+                        literal('refund'),
+                        OrderRefund.id,
+                        OrderRefund.product_id,
+                        Product.name,
+                        OrderRefund.quantity,
+                        null(),
+                        null(),
+                        OrderRefund.comments
+                    ).outerjoin(
+                        Product, Product.id == OrderRefund.product_id
+                    ).where(OrderRefund.order_id == order_id)
+                ).subquery()
+
+                rows = db.execute(
+                    select(lines).order_by(lines.c.kind, lines.c.id)
+                ).all()
+
+            details, refunds = [], []
+            for kind, line_id, product_id, product_name, quantity, unit_price, subtotal, comments in rows:
+                if kind == 'detail':
+                    details.append({
+                        'product_id': product_id,
+                        'product_name': product_name or 'N/A',
+                        'quantity': quantity,
+                        'unit_price': unit_price,
+                        'subtotal': subtotal
+                    })
+                else:
+                    refunds.append({
+                        'id': line_id,
+                        'product_id': product_id,
+                        'product_name': product_name or 'N/A',
+                        'quantity': quantity,
+                        'comments': comments
+                    })
+
+            return {
+                'id': order.id,
+                'date': order.date,
+                'total': order.total,
+                'status': order.status,
+                'completed_at': order.completed_at,
+                'customer_id': order.customer_id,
+                'notes': order.notes,
+                'amount_paid': order.amount_paid or 0.0,
+                'payment_status': payment_status_for(order.total, order.amount_paid),
+                'details': details,
+                'refunds': refunds
+            }
         finally:
             db.close()
 
@@ -218,8 +366,8 @@ class OrderProvider:
             order = db.query(Order).filter(Order.id == order_id).first()
             if order:
                 order.status = new_status
+                firestore_service.update_order_status(db, order_id, new_status)
                 db.commit()
-                firestore_service.update_order_status(order_id, new_status)
                 return True, order_id
             return False, "Pedido no encontrado"
         except Exception as e:
@@ -246,6 +394,56 @@ class OrderProvider:
         finally:
             db.close()
 
+    def apply_remote_changes(self, changes, read_time=None):
+        """
+        Aplica en UNA transacción los cambios que llegan de Firestore (app móvil).
+
+        changes: [(order_id, status, amount_paid)], uno por documento.
+        Los pedidos con escrituras propias aún en el outbox se saltan: lo local
+        gana hasta que se envíe (las marcadas como fallidas ya no cuentan).
+        Guarda read_time para no reprocesar al reiniciar.
+        Devuelve (True, [ids que pasaron a completado]) o (False, error).
+        """
+        db = get_db()
+        try:
+            ids = {order_id for order_id, _, _ in changes if order_id is not None}
+
+            busy = {
+                document_id for (document_id,) in db.query(FirestoreOutbox.document_id).filter(
+                    FirestoreOutbox.collection == ORDERS_COLLECTION,
+                    FirestoreOutbox.document_id.in_([str(order_id) for order_id in ids]),
+                    FirestoreOutbox.failed_at.is_(None)
+                )
+            }
+            orders = {
+                order.id: order
+                for order in db.query(Order).filter(Order.id.in_(ids))
+            }
+
+            completed = []
+            for order_id, status, amount_paid in changes:
+                order = orders.get(order_id)
+                if not order or str(order_id) in busy:
+                    continue
+
+                if status == ORDER_STATUSES_COMPLETE and order.status != ORDER_STATUSES_COMPLETE:
+                    order.status = ORDER_STATUSES_COMPLETE
+                    completed.append(order_id)
+
+                if amount_paid is not None and (order.amount_paid or 0.0) != amount_paid:
+                    order.amount_paid = amount_paid
+
+            if read_time is not None:
+                sync_state_provider.set(db, FIRESTORE_ORDERS_READ_TIME_KEY, read_time.isoformat())
+
+            db.commit()
+            return True, completed
+        except Exception as e:
+            db.rollback()
+            return False, str(e)
+        finally:
+            db.close()
+
     def register_payment(
         self,
         order_id,
@@ -264,8 +462,8 @@ class OrderProvider:
                 return False, f"El monto excede el total del pedido (${order.total:.2f})"
 
             order.amount_paid = new_paid
+            firestore_service.sync_payment(db, order_id, new_paid)
             db.commit()
-            firestore_service.sync_payment(order_id, new_paid)
             return True, order_id
         except Exception as e:
             db.rollback()
@@ -301,8 +499,15 @@ class OrderProvider:
             # Marcar como completado
             order.status = 'completado'
             order.completed_at = mexico_now()
+
+            rollup_provider.record(
+                db, ROLLUP_CHANNEL_ORDER_COMPLETED, order.completed_at, order.total,
+                [(d.product_id, d.quantity, d.subtotal) for d in order.order_details],
+                [(item['product_id'], item['quantity']) for item in refund_items]
+            )
+
+            firestore_service.update_order_status(db, order_id, 'completado')
             db.commit()
-            firestore_service.update_order_status(order_id, 'completado')
             return True, order_id
         except Exception as e:
             db.rollback()
@@ -312,25 +517,8 @@ class OrderProvider:
 
     def get_today(self):
 
-        db = get_db()
-
-        try:
-            today = mexico_now().date()
-            day_start = datetime(today.year, today.month, today.day)
-            day_end = day_start + timedelta(days=1)
-
-            result = db.query(
-                func.count(Order.id),
-                func.coalesce(func.sum(Order.total), 0.0)
-            ).filter(
-                Order.date >= day_start,
-                Order.date < day_end,
-            ).first()
-
-            return result[0] or 0, result[1] or 0.0
-
-        finally:
-            db.close()
+        tickets, total, _ = rollup_provider.get_totals(ROLLUP_CHANNEL_ORDER, mexico_now().date())
+        return tickets, total
 
 
 order_provider = OrderProvider()
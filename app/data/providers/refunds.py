@@ -1,5 +1,8 @@
+from app.models import Product
 from app.models.order_refund import OrderRefund
 from app.data.database import get_db
+from app.data.query_counter import QueryCounter
+from app.constants import DETAIL_QUERY_BUDGETS
 
 
 class RefundProvider:
@@ -7,19 +10,28 @@ class RefundProvider:
     def get_by_order(self, order_id):
         db = get_db()
         try:
-            refunds = db.query(OrderRefund).filter(
-                OrderRefund.order_id == order_id
-            ).all()
+            with QueryCounter("order_refunds", DETAIL_QUERY_BUDGETS["order_refunds"]):
+                refunds = db.query(
+                    OrderRefund.id,
+                    OrderRefund.product_id,
+                    Product.name,
+                    OrderRefund.quantity,
+                    OrderRefund.comments
+                ).outerjoin(
+                    Product, Product.id == OrderRefund.product_id
+                ).filter(
+                    OrderRefund.order_id == order_id
+                ).order_by(OrderRefund.id).all()
 
             return [
                 {
-                    'id': r.id,
-                    'product_id': r.product_id,
-                    'product_name': r.product.name if r.product else 'N/A',
-                    'quantity': r.quantity,
-                    'comments': r.comments
+                    'id': refund_id,
+                    'product_id': product_id,
+                    'product_name': product_name or 'N/A',
+                    'quantity': quantity,
+                    'comments': comments
                 }
-                for r in refunds
+                for refund_id, product_id, product_name, quantity, comments in refunds
             ]
         finally:
             db.close()
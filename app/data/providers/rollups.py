@@ -0,0 +1,216 @@
+"""
+Rollups diarios de ventas y pedidos.
+
+daily_rollups guarda por día y canal: tickets, total, piezas vendidas y
+devueltas; daily_product_rollups lo mismo por producto. Se actualizan en la
+MISMA transacción que la venta/pedido (record() recibe la sesión del
+llamador), así los KPIs y el corte de caja leen O(días) en lugar de O(ventas).
+
+rebuild() los recalcula desde cero a partir de sales/orders (datos
+históricos, seed_data.py o si algo quedó desfasado).
+
+Escribir en un día ya cerrado o reconstruir invalida los agregados de
+periodos cerrados que report_cache guarda en disco.
+"""
+
+from sqlalchemy import func, literal, select, delete, update
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+from app.models import Sale, SaleDetail, Order, OrderDetail, OrderRefund
+from app.models.daily_rollup import DailyRollup, DailyProductRollup
+from app.data.database import get_db
+from app.services.change_bus import change_bus, OP_UPDATE
+from app.services.report_cache import report_cache
+from app.constants import (
+    ROLLUP_CHANNEL_SALE,
+    ROLLUP_CHANNEL_ORDER,
+    ROLLUP_CHANNEL_ORDER_COMPLETED,
+    ORDER_STATUSES_COMPLETE,
+    mexico_now,
+)
+
+
+class RollupProvider:
+
+    # --- Escritura (dentro de la transacción del llamador) ---
+
+    def record(self, db, channel, when, total, lines, refunds=(), tickets=1):
+        """
+        Suma un ticket (o `tickets` agrupados) al rollup del día. No hace commit.
+
+        lines: [(product_id, quantity, subtotal)]
+        refunds: [(product_id, quantity)]
+        """
+        day = when.date()
+        if day < mexico_now().date():
+            report_cache.forget_closed_on_commit(db, day)
+
+        per_product = {}
+        for product_id, quantity, subtotal in lines:
+            qty, sub, ref = per_product.get(product_id, (0.0, 0.0, 0.0))
+            per_product[product_id] = (qty + quantity, sub + subtotal, ref)
+        for product_id, quantity in refunds:
+            qty, sub, ref = per_product.get(product_id, (0.0, 0.0, 0.0))
+            per_product[product_id] = (qty, sub, ref + quantity)
+
+        stmt = sqlite_insert(DailyRollup).values(
+            day=day,
+            channel=channel,
+            tickets=tickets,
+            total=total,
+            quantity=sum(qty for qty, _, _ in per_product.values()),
+            refunded=sum(ref for _, _, ref in per_product.values()),
+        )
+        db.execute(stmt.on_conflict_do_update(
+            index_elements=['day', 'channel'],
+            set_={
+                'tickets': DailyRollup.tickets + stmt.excluded.tickets,
+                'total': DailyRollup.total + stmt.excluded.total,
+                'quantity': DailyRollup.quantity + stmt.excluded.quantity,
+                'refunded': DailyRollup.refunded + stmt.excluded.refunded,
+            }
+        ))
+
+        if not per_product:
+            return
+
+        stmt = sqlite_insert(DailyProductRollup).values([
+            {
+                'day': day,
+                'channel': channel,
+                'product_id': product_id,
+                'quantity': qty,
+                'subtotal': sub,
+                'refunded': ref,
+            }
+            for product_id, (qty, sub, ref) in per_product.items()
+        ])
+        db.execute(stmt.on_conflict_do_update(
+            index_elements=['day', 'channel', 'product_id'],
+            set_={
+                'quantity': DailyProductRollup.quantity + stmt.excluded.quantity,
+                'subtotal': DailyProductRollup.subtotal + stmt.excluded.subtotal,
+                'refunded': DailyProductRollup.refunded + stmt.excluded.refunded,
+            }
+        ))
+
+    # --- Lectura ---
+
+    def get_totals(self, channel, start_day, end_day=None):
+        """(tickets, total, quantity) del canal entre start_day y end_day (inclusive)."""
+
+        db = get_db()
+
+        try:
+            result = db.query(
+                func.coalesce(func.sum(DailyRollup.tickets), 0),
+                func.coalesce(func.sum(DailyRollup.total), 0.0),
+                func.coalesce(func.sum(DailyRollup.quantity), 0.0),
+            ).filter(
+                DailyRollup.channel == channel,
+                DailyRollup.day >= start_day,
+                DailyRollup.day <= (end_day or start_day),
+            ).first()
+
+            return result[0] or 0, result[1] or 0.0, result[2] or 0.0
+        finally:
+            db.close()
+
+    # --- Reconstrucción ---
+
+    def ensure_built(self):
+        """Reconstruye si la tabla está vacía pero ya hay ventas o pedidos (DB existente)."""
+
+        db = get_db()
+
+        try:
+            if db.query(DailyRollup.id).first():
+                return
+            if not db.query(Sale.id).first() and not db.query(Order.id).first():
+                return
+        finally:
+            db.close()
+
+        self.rebuild()
+
+    def rebuild(self):
+        """Recalcula todos los rollups desde sales / orders / order_refunds."""
+
+        db = get_db()
+
+        try:
+            db.execute(delete(DailyProductRollup))
+            db.execute(delete(DailyRollup))
+
+            completed = Order.status == ORDER_STATUSES_COMPLETE
+            sources = [
+                (ROLLUP_CHANNEL_SALE, Sale, Sale.date, SaleDetail, SaleDetail.sale_id, None),
+                (ROLLUP_CHANNEL_ORDER, Order, Order.date, OrderDetail, OrderDetail.order_id, None),
+                (ROLLUP_CHANNEL_ORDER_COMPLETED, Order, Order.completed_at, OrderDetail, OrderDetail.order_id, completed),
+            ]
+
+            for channel, header, date_col, detail, detail_fk, condition in sources:
+                day = func.date(date_col)
+                conditions = [date_col.isnot(None)]
+                if condition is not None:
+                    conditions.append(condition)
+
+                # Un renglón por día: tickets y total desde la cabecera
+                db.execute(DailyRollup.__table__.insert().from_select(
+                    ['day', 'channel', 'tickets', 'total', 'quantity', 'refunded'],
+                    select(
+                        day, literal(channel), func.count(header.id), func.sum(header.total),
+                        literal(0.0), literal(0.0)
+                    ).where(*conditions).group_by(day)
+                ))
+
+                # Un renglón por día y producto desde el detalle
+                db.execute(DailyProductRollup.__table__.insert().from_select(
+                    ['day', 'channel', 'product_id', 'quantity', 'subtotal', 'refunded'],
+                    select(
+                        day, literal(channel), detail.product_id,
+                        func.sum(detail.quantity), func.sum(detail.subtotal), literal(0.0)
+                    ).join(header, detail_fk == header.id)
+                    .where(*conditions)
+                    .group_by(day, detail.product_id)
+                ))
+
+            # Devoluciones: cuentan el día en que se completó el pedido
+            refunded = select(
+                func.coalesce(func.sum(OrderRefund.quantity), 0.0)
+            ).join(Order, OrderRefund.order_id == Order.id).where(
+                completed,
+                func.date(Order.completed_at) == DailyProductRollup.day,
+                OrderRefund.product_id == DailyProductRollup.product_id,
+            ).scalar_subquery()
+
+            db.execute(
+                update(DailyProductRollup)
+                .where(DailyProductRollup.channel == ROLLUP_CHANNEL_ORDER_COMPLETED)
+                .values(refunded=refunded)
+            )
+
+            # Piezas por día = suma de los renglones por producto
+            def product_sum(column):
+                return select(func.coalesce(func.sum(column), 0.0)).where(
+                    DailyProductRollup.day == DailyRollup.day,
+                    DailyProductRollup.channel == DailyRollup.channel,
+                ).scalar_subquery()
+
+            db.execute(update(DailyRollup).values(
+                quantity=product_sum(DailyProductRollup.quantity),
+                refunded=product_sum(DailyProductRollup.refunded),
+            ))
+
+            change_bus.touch(db, DailyRollup.__tablename__, OP_UPDATE, [])
+            db.commit()
+            report_cache.forget_closed()
+            return True, db.query(func.count(DailyRollup.id)).scalar()
+        except Exception as e:
+            db.rollback()
+            return False, str(e)
+        finally:
+            db.close()
+
+
+rollup_provider = RollupProvider()
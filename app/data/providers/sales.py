@@ -1,8 +1,12 @@
 from datetime import datetime, timedelta
-from sqlalchemy import func
-from app.models import Sale, SaleDetail
+from sqlalchemy import func, insert
+from app.models import Sale, SaleDetail, Product
 from app.data.database import get_db
-from app.constants import mexico_now
+from app.data.query_counter import QueryCounter
+from app.data.pagination import keyset_page
+from app.data.providers.rollups import rollup_provider
+from app.services.change_bus import change_bus, OP_INSERT
+from app.constants import mexico_now, ROLLUP_CHANNEL_SALE, DETAIL_QUERY_BUDGETS
 
 
 class SaleProvider:
@@ -10,24 +14,59 @@ class SaleProvider:
 
     def save(self, items, total, customer_id):
 
+        ok, result = self.save_many([{'items': items, 'total': total, 'customer_id': customer_id}])
+        return (True, result[0]) if ok else (False, result)
+
+    def save_many(self, sales):
+        """
+        Guarda varias ventas en UNA transacción con INSERT en bloque (sin ORM).
+
+        sales: [{'items', 'total', 'customer_id', 'date' (opcional)}]
+        Regresa (True, [sale_id, ...]) en el mismo orden.
+        """
+
         db = get_db()
         try:
-            sale = Sale(total=total, customer_id=customer_id)
-            db.add(sale)
-            db.flush()
-
-            for item in items:
-                detail = SaleDetail(
-                    sale_id=sale.id,
-                    product_id=item['id'],
-                    quantity=item['quantity'],
-                    unit_price=item['price'],
-                    subtotal=item['subtotal']
-                )
-                db.add(detail)
+            now = mexico_now()
+            rows = [
+                {'date': sale.get('date') or now, 'total': sale['total'], 'customer_id': sale['customer_id']}
+                for sale in sales
+            ]
+
+            sale_ids = db.execute(
+                insert(Sale).returning(Sale.id, sort_by_parameter_order=True),
+                rows
+            ).scalars().all()
+
+            details = [
+                {
+                    'sale_id': sale_id,
+                    'product_id': item['id'],
+                    'quantity': item['quantity'],
+                    'unit_price': item['price'],
+                    'subtotal': item['subtotal'],
+                }
+                for sale_id, sale in zip(sale_ids, sales)
+                for item in sale['items']
+            ]
+            if details:
+                db.execute(insert(SaleDetail), details)
+
+            change_bus.touch(db, Sale.__tablename__, OP_INSERT, sale_ids)
+
+            # Un upsert de rollup por día, no por venta
+            per_day = {}
+            for row, sale in zip(rows, sales):
+                day = per_day.setdefault(row['date'].date(), [row['date'], 0, 0.0, []])
+                day[1] += 1
+                day[2] += sale['total']
+                day[3].extend((item['id'], item['quantity'], item['subtotal']) for item in sale['items'])
+
+            for when, tickets, total, lines in per_day.values():
+                rollup_provider.record(db, ROLLUP_CHANNEL_SALE, when, total, lines, tickets=tickets)
 
             db.commit()
-            return True, sale.id
+            return True, sale_ids
         except Exception as e:
             db.rollback()
             return False, str(e)
@@ -36,25 +75,8 @@ class SaleProvider:
 
     def get_today(self):
 
-        db = get_db()
-        
-        try:
-            today = mexico_now().date()
-            day_start = datetime(today.year, today.month, today.day)
-            day_end = day_start + timedelta(days=1)
-
-            result = db.query(
-                func.count(Sale.id),
-                func.coalesce(func.sum(Sale.total), 0.0)
-            ).filter(
-                Sale.date >= day_start,
-                Sale.date < day_end,
-            ).first()
-
-            return result[0] or 0, result[1] or 0.0
-        
-        finally:
-            db.close()
+        tickets, total, _ = rollup_provider.get_totals(ROLLUP_CHANNEL_SALE, mexico_now().date())
+        return tickets, total
 
 
     def get_all(self, offset=0, limit=None, filters=None):
@@ -82,6 +104,27 @@ class SaleProvider:
         finally:
             db.close()
 
+    def get_page(self, limit, filters=None, **cursor):
+        """Página keyset sobre (date, id); cursor: after / before / last / offset"""
+
+        db = get_db()
+
+        try:
+            query = db.query(
+                Sale.id,
+                Sale.date,
+                Sale.total,
+                Sale.customer_id
+            )
+
+            if filters:
+                query = query.filter(*filters)
+
+            return keyset_page(query, Sale.date, Sale.id, limit, **cursor)
+
+        finally:
+            db.close()
+
     def get_count(self, filters=None):
 
         db = get_db()
@@ -103,31 +146,52 @@ class SaleProvider:
         ]
 
 
-    def get_by_id(self, sale_id):
+    def get_detail(self, sale_id):
+        """Venta con sus renglones y nombres de producto en UNA consulta."""
 
         db = get_db()
 
         try:
-            sale = db.query(Sale).filter(Sale.id == sale_id).first()
-
-            if sale:
-                return {
-                    'id': sale.id,
-                    'date': sale.date,
-                    'total': sale.total,
-                    'customer_id': sale.customer_id,
-                    'details': [
-                        {
-                            'product_id': d.product_id,
-                            'product_name': d.product.name if d.product else 'N/A',
-                            'quantity': d.quantity,
-                            'unit_price': d.unit_price,
-                            'subtotal': d.subtotal
-                        }
-                        for d in sale.sales_details
-                    ]
-                }
-            return None
+            with QueryCounter("sale_detail", DETAIL_QUERY_BUDGETS["sale_detail"]):
+                rows = db.query(
+                    Sale.id,
+                    Sale.date,
+                    Sale.total,
+                    Sale.customer_id,
+                    SaleDetail.product_id,
+                    Product.name,
+                    SaleDetail.quantity,
+                    SaleDetail.unit_price,
+                    SaleDetail.subtotal
+                ).outerjoin(
+                    SaleDetail, SaleDetail.sale_id == Sale.id
+                ).outerjoin(
+                    Product, Product.id == SaleDetail.product_id
+                ).filter(
+                    Sale.id == sale_id
+                ).order_by(SaleDetail.id).all()
+
+            if not rows:
+                return None
+
+            sale_id, date, total, customer_id = rows[0][:4]
+            return {
+                'id': sale_id,
+                'date': date,
+                'total': total,
+                'customer_id': customer_id,
+                'details': [
+                    {
+                        'product_id': product_id,
+                        'product_name': product_name or 'N/A',
+                        'quantity': quantity,
+                        'unit_price': unit_price,
+                        'subtotal': subtotal
+                    }
+                    for *_, product_id, product_name, quantity, unit_price, subtotal in rows
+                    if product_id is not None
+                ]
+            }
         finally:
             db.close()
 
@@ -4,8 +4,10 @@ from pathlib import Path
 from app.models import Supply, SupplyPurchase, Supplier
 from sqlalchemy.orm import joinedload
 from app.data.database import get_db
+from app.data.pagination import keyset_page
 from datetime import datetime, date
 from app.constants import mexico_now
+from app.services.task_runner import task_runner
 
 DEFAULT_SUPPLIES_CSV = Path(__file__).parent.parent / "default" / "default_supplies.csv"
 
@@ -200,6 +202,13 @@ class SupplyProvider:
         finally:
             db.close()
 
+    def get_supply_by_id_async(self, owner, on_done, supply_id):
+        """get_supply_by_id en segundo plano; on_done(supply) corre en el hilo de la UI"""
+        return task_runner.submit(
+            owner, self.get_supply_by_id, supply_id,
+            on_done=on_done, key="supply_detail"
+        )
+
     def get_supply_by_name(self, supply_name):
 
         db = get_db()
@@ -307,19 +316,19 @@ class SupplyProvider:
         finally:
             db.close()
 
-    def get_purchases_paginated(self, supply_id, offset=0, limit=10):
-        """Get purchases for a supply with server-side pagination"""
+    def get_purchases_page(self, supply_id, limit=10, **cursor):
+        """Keyset page of purchases over (purchase_date, id); cursor: after / before / last / offset"""
         db = get_db()
         try:
-            purchases = db.query(SupplyPurchase).options(
+            query = db.query(SupplyPurchase).options(
                 joinedload(SupplyPurchase.supplier)
             ).filter(
                 SupplyPurchase.supply_id == supply_id
-            ).order_by(
-                SupplyPurchase.purchase_date.desc()
-            ).offset(offset).limit(limit).all()
+            )
 
-            return [
+            page = keyset_page(query, SupplyPurchase.purchase_date, SupplyPurchase.id, limit, **cursor)
+
+            return page._replace(rows=[
                 {
                     'id': p.id,
                     'purchase_date': p.purchase_date,
@@ -332,8 +341,8 @@ class SupplyProvider:
                     'supplier_name': p.supplier.supplier_name if p.supplier else 'N/A',
                     'notes': p.notes
                 }
-                for p in purchases
-            ]
+                for p in page.rows
+            ])
         finally:
             db.close()
 
@@ -0,0 +1,26 @@
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from app.models import SyncState
+from app.data.database import get_db
+
+
+class SyncStateProvider:
+    """Valores sueltos de sincronización (p. ej. último read_time de Firestore)."""
+
+    def get(self, key):
+        db = get_db()
+        try:
+            state = db.query(SyncState.value).filter(SyncState.key == key).first()
+            return state[0] if state else None
+        finally:
+            db.close()
+
+    def set(self, db, key, value):
+        """Guarda el valor en la transacción del llamador. No hace commit."""
+        stmt = sqlite_insert(SyncState).values(key=key, value=value)
+        db.execute(stmt.on_conflict_do_update(
+            index_elements=['key'],
+            set_={'value': stmt.excluded.value}
+        ))
+
+
+sync_state_provider = SyncStateProvider()
@@ -0,0 +1,52 @@
+"""
+Cuenta las sentencias SQL que ejecuta el hilo actual.
+
+Sirve para detectar N+1: las consultas de reportes y los paneles de detalle
+miden cuántas sentencias hicieron y avisan si se pasan de su presupuesto
+(REPORT_QUERY_BUDGETS / DETAIL_QUERY_BUDGETS).
+"""
+
+import threading
+from sqlalchemy import event
+
+from app.data.database import engine
+
+
+_local = threading.local()
+
+query_counts = {}
+
+
+@event.listens_for(engine, "before_cursor_execute")
+def _count_query(*_args):
+    for counter in getattr(_local, "counters", ()):
+        counter.count += 1
+
+
+class QueryCounter:
+    """
+    Context manager: cuenta las consultas del hilo actual dentro del bloque.
+
+    Con `name` el conteo queda en query_counts[name]; con `budget` además
+    avisa si se pasa.
+    """
+
+    def __init__(self, name=None, budget=None):
+        self.name = name
+        self.budget = budget
+        self.count = 0
+
+    def __enter__(self):
+        if not hasattr(_local, "counters"):
+            _local.counters = []
+        _local.counters.append(self)
+        return self
+
+    def __exit__(self, *_exc):
+        _local.counters.remove(self)
+
+        if self.name is None:
+            return
+        query_counts[self.name] = self.count
+        if self.budget is not None and self.count > self.budget:
+            print(f"[SQL] {self.name}: {self.count} consultas (presupuesto {self.budget})")
@@ -0,0 +1,153 @@
+"""
+Engine de solo lectura para las consultas analíticas del asistente IA.
+
+Abre el mismo archivo con URI `file:...?mode=ro` y `PRAGMA query_only`, con
+su propio pool pequeño (AI_SQL_POOL_SIZE): una consulta pesada del asistente
+no toma conexiones ni locks de escritura del POS (con WAL los lectores no
+bloquean a quien escribe).
+
+Cada conexión tiene además un authorizer de SQLite: al compilar una
+sentencia solo se permiten lecturas (SELECT, leer columnas, funciones que no
+sean load_extension y CTE recursivos). Cualquier otra acción (INSERT, PRAGMA,
+ATTACH, ...) hace fallar la compilación con "not authorized"; la acción
+negada queda en TimedConnection.denied. Así no importa cómo venga escrita la
+consulta (comentarios, CTE, literales): SQLite decide con el plan real.
+
+timed_connection(budget_s) instala el progress handler de SQLite: cada
+AI_SQL_PROGRESS_OPS instrucciones revisa el reloj y, si la consulta pasó de
+su presupuesto, SQLite la interrumpe (OperationalError "interrupted").
+"""
+
+import os
+import sqlite3
+import time
+from contextlib import contextmanager
+from urllib.parse import quote
+from sqlalchemy import create_engine, event
+
+from app.constants import DB_NAME, AI_SQL_POOL_SIZE, AI_SQL_PROGRESS_OPS
+from app.data.database import data_path
+
+
+# URI absoluta (en Windows C:/... -> /C:/...)
+_db_path = os.path.abspath(data_path(f"{DB_NAME}.db")).replace("\\", "/")
+if not _db_path.startswith("/"):
+    _db_path = "/" + _db_path
+
+readonly_engine = create_engine(
+    f"sqlite:///file://{quote(_db_path)}?mode=ro&uri=true",
+    connect_args={"check_same_thread": False},
+    pool_size=AI_SQL_POOL_SIZE,
+    max_overflow=0,
+    pool_timeout=10,
+)
+
+
+_ALLOWED_ACTIONS = {
+    sqlite3.SQLITE_SELECT,
+    sqlite3.SQLITE_READ,
+    sqlite3.SQLITE_FUNCTION,
+    sqlite3.SQLITE_RECURSIVE,
+    # ROLLBACK del pool al devolver la conexión
+    sqlite3.SQLITE_TRANSACTION,
+}
+
+# Nombres legibles de las acciones que se niegan
+_ACTION_NAMES = {
+    getattr(sqlite3, f"SQLITE_{name}"): name.replace("_", " ")
+    for name in (
+        "INSERT", "UPDATE", "DELETE", "PRAGMA", "ATTACH", "DETACH",
+        "ALTER_TABLE", "REINDEX", "ANALYZE", "SAVEPOINT",
+        "CREATE_INDEX", "CREATE_TABLE", "CREATE_TEMP_INDEX", "CREATE_TEMP_TABLE",
+        "CREATE_TEMP_TRIGGER", "CREATE_TEMP_VIEW", "CREATE_TRIGGER", "CREATE_VIEW",
+        "CREATE_VTABLE", "DROP_INDEX", "DROP_TABLE", "DROP_TEMP_INDEX",
+        "DROP_TEMP_TABLE", "DROP_TEMP_TRIGGER", "DROP_TEMP_VIEW", "DROP_TRIGGER",
+        "DROP_VIEW", "DROP_VTABLE",
+    )
+}
+
+
+def _make_authorizer(log):
+    """log["select"] indica si la sentencia lee algo; log["denied"] lo negado."""
+
+    def authorize(action, arg1, arg2, _db_name, _trigger):
+        if action == sqlite3.SQLITE_FUNCTION:
+            if arg2 == "load_extension":
+                log["denied"].append(f"FUNCTION {arg2}")
+                return sqlite3.SQLITE_DENY
+            return sqlite3.SQLITE_OK
+        if action in _ALLOWED_ACTIONS:
+            if action == sqlite3.SQLITE_SELECT:
+                log["select"] = True
+            return sqlite3.SQLITE_OK
+
+        name = _ACTION_NAMES.get(action, f"acción {action}")
+        log["denied"].append(f"{name} {arg1}" if arg1 else name)
+        return sqlite3.SQLITE_DENY
+
+    return authorize
+
+
+@event.listens_for(readonly_engine, "connect")
+def _set_readonly_pragmas(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    try:
+        cursor.execute("PRAGMA query_only=ON")
+        cursor.execute("PRAGMA busy_timeout=2000")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+    finally:
+        cursor.close()
+
+    # Después de los PRAGMA: de aquí en adelante solo lecturas
+    log = connection_record.info.setdefault("authorizer", {"select": False, "denied": []})
+    dbapi_connection.set_authorizer(_make_authorizer(log))
+
+
+class TimedConnection:
+    """Conexión del pool de solo lectura con fecha límite por consulta."""
+
+    def __init__(self, connection, budget_s):
+        self.connection = connection
+        self.budget_s = budget_s
+        self.deadline = None
+        self.interrupted = False
+        self._authorizer_log = connection.info["authorizer"]
+
+    @property
+    def denied(self):
+        """Acciones que el authorizer negó en el último execute()."""
+        return list(self._authorizer_log["denied"])
+
+    @property
+    def selected(self):
+        """Si la sentencia del último execute() leyó algo (SQLITE_SELECT)."""
+        return self._authorizer_log["select"]
+
+    def execute(self, statement, *args, **kwargs):
+        self.deadline = time.monotonic() + self.budget_s
+        self.interrupted = False
+        self._authorizer_log["select"] = False
+        self._authorizer_log["denied"].clear()
+        return self.connection.execute(statement, *args, **kwargs)
+
+    def _on_progress(self):
+        if self.deadline is not None and time.monotonic() > self.deadline:
+            self.interrupted = True
+            return 1
+        return 0
+
+
+@contextmanager
+def timed_connection(budget_s):
+    """
+    Conexión de solo lectura; execute() y la lectura de sus renglones deben
+    terminar en budget_s segundos o SQLite interrumpe la consulta.
+    """
+    with readonly_engine.connect() as connection:
+        raw = connection.connection.dbapi_connection
+        timed = TimedConnection(connection, budget_s)
+        raw.set_progress_handler(timed._on_progress, AI_SQL_PROGRESS_OPS)
+        try:
+            yield timed
+        finally:
+            raw.set_progress_handler(None, 0)
@@ -0,0 +1,349 @@
+"""
+Consultas de los tabs de Reportes.
+
+Cada tab pide sus datos en un número fijo y pequeño de consultas (agregados
+agrupados, subconsultas y ROW_NUMBER() en lugar de una consulta por renglón)
+y recibe tuplas simples, sin objetos ORM: así se puede consultar en un hilo
+del pool y pintar después en el hilo de Tkinter.
+
+QueryCounter (app/data/query_counter.py) cuenta las sentencias; cada dataset
+deja su conteo en query_counter.query_counts y avisa si se pasa de
+REPORT_QUERY_BUDGETS (un N+1 que regrese se nota de inmediato).
+
+Los resultados pasan por report_cache: se reusan mientras no cambien las
+tablas de SECTION_TABLES, y los meses ya cerrados de ventas se guardan en
+disco, así solo se recalcula el mes en curso.
+"""
+
+from datetime import timedelta
+from sqlalchemy import func, select, and_
+
+from app.models import (
+    Customer, Order, OrderDetail, Product,
+    Supplier, Supply, SupplyPurchase, DailyRollup,
+)
+from app.data.database import get_db
+from app.data.query_counter import QueryCounter
+from app.services.report_cache import report_cache
+from app.constants import mexico_now, ROLLUP_CHANNEL_SALE, REPORT_QUERY_BUDGETS
+
+
+class ReportQueries:
+
+    # Tablas de las que depende cada dataset (versión de datos de la caché)
+    SECTION_TABLES = {
+        "sales": ("sales", "orders", "daily_rollups"),
+        "customers": ("customers", "orders", "order_details", "order_refunds"),
+        "customer_products": ("products", "orders", "order_details", "order_refunds"),
+        "supplies": ("supplies", "suppliers", "supply_purchases"),
+        "suppliers": ("suppliers", "supply_purchases"),
+        "supplier_purchases": ("supplies", "supply_purchases"),
+    }
+
+    def _cached(self, name, fn, *args):
+        # El día va en la llave: los KPIs de "hoy" cambian a medianoche
+        params = (mexico_now().date(), *args)
+        return report_cache.get(name, params, self.SECTION_TABLES[name], lambda: self._run(name, fn, *args))
+
+    def _run(self, name, fn, *args):
+        db = get_db()
+
+        try:
+            with QueryCounter(name, REPORT_QUERY_BUDGETS.get(name)):
+                return fn(db, *args)
+        finally:
+            db.close()
+
+    # --- Ventas ---
+
+    def sales_tab(self):
+        """
+        kpis: (ventas_hoy, total_hoy, ventas_semana, total_semana, ticket_promedio, productos_hoy)
+        orders_by_status: [(status, pedidos, total)]
+        """
+        return self._cached("sales", self._sales_tab)
+
+    def _sales_tab(self, db):
+        today = mexico_now().date()
+        week_start = today - timedelta(days=6)
+        month_start = today.replace(day=1)
+
+        # Meses cerrados: una consulta la primera vez, luego salen del disco
+        closed = report_cache.closed(
+            "sales_months",
+            (month_start - timedelta(days=1)).strftime("%Y-%m"),
+            lambda after: self._sales_months(db, after, month_start)
+        )
+
+        # Periodo abierto: días del mes en curso (y de la semana si empezó el mes anterior)
+        days = db.query(
+            DailyRollup.day,
+            DailyRollup.tickets,
+            DailyRollup.total,
+            DailyRollup.quantity,
+        ).filter(
+            DailyRollup.channel == ROLLUP_CHANNEL_SALE,
+            DailyRollup.day >= min(week_start, month_start)
+        ).all()
+
+        today_rows = [r for r in days if r.day == today]
+        week_rows = [r for r in days if r.day >= week_start]
+        month_rows = [r for r in days if r.day >= month_start]
+
+        all_tickets = sum(t for t, _ in closed.values()) + sum(r.tickets for r in month_rows)
+        all_total = sum(total for _, total in closed.values()) + sum(r.total for r in month_rows)
+        avg_ticket = all_total / all_tickets if all_tickets else 0
+
+        orders_by_status = db.query(
+            Order.status,
+            func.count(Order.id),
+            func.coalesce(func.sum(Order.total), 0)
+        ).group_by(Order.status).all()
+
+        return {
+            "kpis": (
+                sum(r.tickets for r in today_rows),
+                sum(r.total for r in today_rows),
+                sum(r.tickets for r in week_rows),
+                sum(r.total for r in week_rows),
+                avg_ticket,
+                sum(r.quantity for r in today_rows),
+            ),
+            "orders_by_status": [tuple(r) for r in orders_by_status],
+        }
+
+    def _sales_months(self, db, after, month_start):
+        """{'YYYY-MM': [tickets, total]} de los meses cerrados posteriores a `after`"""
+        month = func.strftime('%Y-%m', DailyRollup.day)
+
+        query = db.query(
+            month,
+            func.sum(DailyRollup.tickets),
+            func.sum(DailyRollup.total),
+        ).filter(
+            DailyRollup.channel == ROLLUP_CHANNEL_SALE,
+            DailyRollup.day < month_start
+        )
+        if after:
+            query = query.filter(month > after)
+
+        return {m: [tickets, total] for m, tickets, total in query.group_by(month).all()}
+
+    # --- Clientes ---
+
+    def customers_tab(self):
+        """
+        Una sola consulta agrupada por cliente; KPIs, top 5 y categorías se
+        derivan de ahí.
+
+        kpis: (total_pedidos, clientes_con_pedidos, gasto_promedio, cliente_top)
+        top_customers: [(id, nombre, categoria, pedidos, productos, total_gastado)]
+        by_category: [(categoria, clientes, pedidos, total)]
+        by_customer: [(id, nombre, categoria, pedidos, total)]
+        """
+        return self._cached("customers", self._customers_tab)
+
+    def _customers_tab(self, db):
+        # Piezas por pedido, para no duplicar Order.total al unir con el detalle
+        order_products = db.query(
+            OrderDetail.order_id,
+            func.sum(OrderDetail.quantity).label('quantity')
+        ).group_by(OrderDetail.order_id).subquery()
+
+        rows = db.query(
+            Customer.id,
+            Customer.customer_name,
+            Customer.customer_category,
+            func.count(Order.id),
+            func.coalesce(func.sum(Order.total), 0),
+            func.count(order_products.c.order_id),
+            func.coalesce(func.sum(order_products.c.quantity), 0),
+        ).join(
+            Order, Customer.id == Order.customer_id
+        ).outerjoin(
+            order_products, order_products.c.order_id == Order.id
+        ).filter(
+            Customer.active == True,
+            Customer.active2 == True
+        ).group_by(
+            Customer.id, Customer.customer_name, Customer.customer_category
+        ).all()
+
+        by_total = sorted(rows, key=lambda r: r[4], reverse=True)
+
+        total_orders = sum(r[3] for r in rows)
+        avg_spent = sum(r[4] for r in rows) / len(rows) if rows else 0
+        top_name = by_total[0][1] if by_total else "N/A"
+
+        top_customers = [
+            (r[0], r[1], r[2], r[5], r[6], r[4])
+            for r in sorted((r for r in rows if r[5]), key=lambda r: r[6], reverse=True)[:5]
+        ]
+
+        categories = {}
+        for r in rows:
+            customers, orders, total = categories.get(r[2], (0, 0, 0))
+            categories[r[2]] = (customers + 1, orders + r[3], total + r[4])
+
+        by_category = sorted(
+            ((category, *values) for category, values in categories.items()),
+            key=lambda r: r[3], reverse=True
+        )
+
+        return {
+            "kpis": (total_orders, len(rows), avg_spent, top_name),
+            "top_customers": top_customers,
+            "by_category": by_category,
+            "by_customer": [(r[0], r[1], r[2], r[3], r[4]) for r in by_total],
+        }
+
+    def customer_products(self, customer_id):
+        """[(producto, cantidad, veces_pedido, total)] de un cliente"""
+        return self._cached("customer_products", self._customer_products, customer_id)
+
+    def _customer_products(self, db, customer_id):
+        rows = db.query(
+            Product.name,
+            func.sum(OrderDetail.quantity),
+            func.count(OrderDetail.id),
+            func.sum(OrderDetail.subtotal)
+        ).join(
+            OrderDetail, Product.id == OrderDetail.product_id
+        ).join(
+            Order, OrderDetail.order_id == Order.id
+        ).filter(
+            Order.customer_id == customer_id
+        ).group_by(
+            Product.id, Product.name
+        ).order_by(
+            func.sum(OrderDetail.quantity).desc()
+        ).all()
+
+        return [tuple(r) for r in rows]
+
+    # --- Insumos ---
+
+    def supplies_tab(self):
+        """
+        kpis: (total_invertido, compras, insumos, proveedores_con_compras)
+        stock: [(insumo, proveedor, stock_actual, unidad, fecha_ultima_compra)]
+               (stock/unidad/fecha en None si no tiene compras)
+        top_supplies: [(insumo, cantidad_total, total_gastado, compras)] por gasto desc
+        """
+        return self._cached("supplies", self._supplies_tab)
+
+    def _supplies_tab(self, db):
+        kpis = db.query(
+            func.coalesce(func.sum(SupplyPurchase.total_price), 0),
+            func.count(SupplyPurchase.id),
+            select(func.count(Supply.id)).scalar_subquery(),
+            func.count(func.distinct(SupplyPurchase.supplier_id)),
+        ).one()
+
+        # Última compra por insumo con ROW_NUMBER() (antes: una consulta por insumo)
+        ranked = db.query(
+            SupplyPurchase.supply_id,
+            (SupplyPurchase.remaining + SupplyPurchase.quantity).label('stock'),
+            SupplyPurchase.unit,
+            SupplyPurchase.purchase_date,
+            func.row_number().over(
+                partition_by=SupplyPurchase.supply_id,
+                order_by=(SupplyPurchase.purchase_date.desc(), SupplyPurchase.id.desc())
+            ).label('rn')
+        ).subquery()
+
+        stock = db.query(
+            Supply.supply_name,
+            Supplier.supplier_name,
+            ranked.c.stock,
+            ranked.c.unit,
+            ranked.c.purchase_date,
+        ).outerjoin(
+            Supplier, Supply.supplier_id == Supplier.id
+        ).outerjoin(
+            ranked, and_(ranked.c.supply_id == Supply.id, ranked.c.rn == 1)
+        ).order_by(Supply.id).all()
+
+        top_supplies = db.query(
+            Supply.supply_name,
+            func.sum(SupplyPurchase.quantity),
+            func.sum(SupplyPurchase.total_price),
+            func.count(SupplyPurchase.id)
+        ).join(
+            Supply, SupplyPurchase.supply_id == Supply.id
+        ).group_by(
+            Supply.id, Supply.supply_name
+        ).order_by(
+            func.sum(SupplyPurchase.total_price).desc()
+        ).all()
+
+        return {
+            "kpis": tuple(kpis),
+            "stock": [tuple(r) for r in stock],
+            "top_supplies": [tuple(r) for r in top_supplies],
+        }
+
+    # --- Proveedores ---
+
+    def suppliers_tab(self):
+        """
+        kpis: (proveedores_activos, total_comprado, precio_promedio, proveedor_top)
+        best_suppliers: [(id, proveedor, tipo, precio_prom, compras, total)] por precio asc
+        by_demand: mismas tuplas ordenadas por compras desc
+        """
+        return self._cached("suppliers", self._suppliers_tab)
+
+    def _suppliers_tab(self, db):
+        totals = db.query(
+            select(func.count(Supplier.id)).where(Supplier.active == True).scalar_subquery(),
+            func.coalesce(func.sum(SupplyPurchase.total_price), 0),
+            func.coalesce(func.avg(SupplyPurchase.unit_price), 0),
+        ).select_from(SupplyPurchase).one()
+
+        rows = db.query(
+            Supplier.id,
+            Supplier.supplier_name,
+            Supplier.product_type,
+            func.avg(SupplyPurchase.unit_price),
+            func.count(SupplyPurchase.id),
+            func.coalesce(func.sum(SupplyPurchase.total_price), 0)
+        ).join(
+            SupplyPurchase, Supplier.id == SupplyPurchase.supplier_id
+        ).group_by(
+            Supplier.id, Supplier.supplier_name, Supplier.product_type
+        ).all()
+
+        rows = [tuple(r) for r in rows]
+        by_demand = sorted(rows, key=lambda r: r[4], reverse=True)
+        top_name = by_demand[0][1] if by_demand else "N/A"
+
+        return {
+            "kpis": (totals[0], totals[1], totals[2], top_name),
+            "best_suppliers": sorted(rows, key=lambda r: r[3]),
+            "by_demand": by_demand,
+        }
+
+    def supplier_purchases(self, supplier_id):
+        """[(insumo, fecha, cantidad, unidad, precio_unit, total)] de un proveedor"""
+        return self._cached("supplier_purchases", self._supplier_purchases, supplier_id)
+
+    def _supplier_purchases(self, db, supplier_id):
+        rows = db.query(
+            Supply.supply_name,
+            SupplyPurchase.purchase_date,
+            SupplyPurchase.quantity,
+            SupplyPurchase.unit,
+            SupplyPurchase.unit_price,
+            SupplyPurchase.total_price
+        ).join(
+            Supply, SupplyPurchase.supply_id == Supply.id
+        ).filter(
+            SupplyPurchase.supplier_id == supplier_id
+        ).order_by(
+            SupplyPurchase.purchase_date.desc()
+        ).all()
+
+        return [tuple(r) for r in rows]
+
+
+report_queries = ReportQueries()
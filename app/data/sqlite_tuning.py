@@ -0,0 +1,61 @@
+"""
+Ajustes de conexión para SQLite.
+
+Registra un hook "connect" en el engine para aplicar los PRAGMAs del perfil
+elegido a cada conexión nueva del pool (journal WAL, busy_timeout,
+synchronous, cache, mmap y temp_store).
+
+Con WAL los lectores (reportes, asistente IA) ya no bloquean al POS y cada
+commit solo escribe al archivo -wal en lugar de reescribir el journal.
+"""
+
+from sqlalchemy import event
+
+from app.constants import DB_TUNING_PROFILES
+
+
+def apply_sqlite_tuning(engine, profile_name):
+    """Aplica el perfil de PRAGMAs a cada conexión del engine (solo SQLite)."""
+
+    if engine.dialect.name != "sqlite":
+        return
+
+    profile = DB_TUNING_PROFILES[profile_name]
+    pragmas = profile["pragmas"]
+
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, _connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in pragmas.items():
+                cursor.execute(f"PRAGMA {name}={value}")
+        finally:
+            cursor.close()
+
+
+def checkpoint(engine, mode="TRUNCATE"):
+    """
+    Pasa el contenido del archivo -wal a la base principal.
+
+    Se llama al cerrar la app para que tortilleria.db quede completo por sí
+    solo (respaldos copiando un único archivo). Durante el uso normal el
+    autocheckpoint del perfil (wal_autocheckpoint) mantiene el -wal acotado.
+    Retorna (busy, wal_pages, checkpointed_pages) o None si no aplica.
+    """
+
+    if engine.dialect.name != "sqlite":
+        return None
+
+    raw = engine.raw_connection()
+    try:
+        cursor = raw.cursor()
+        try:
+            cursor.execute(f"PRAGMA wal_checkpoint({mode})")
+            return cursor.fetchone()
+        finally:
+            cursor.close()
+    except Exception as e:
+        print(f"[DB] Error en checkpoint WAL: {e}")
+        return None
+    finally:
+        raw.close()
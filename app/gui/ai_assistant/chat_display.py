@@ -1,15 +1,25 @@
+import queue
 from tkinter import ttk
-from app.constants import mexico_now
+from app.constants import mexico_now, AI_STREAM_POLL_MS
 import tkinter as tk
 
 
 class ChatDisplay(ttk.Frame):
-    """Chat display area with title and messages"""
+    """
+    Chat display area with title and messages
+
+    Respuestas en streaming: start_stream() crea la burbuja y regresa una
+    cola; el hilo de trabajo deja ahí ("text", fragmento), ("status", msg),
+    ("tools", tiempos de las consultas) o ("reset", None) y la burbuja la
+    vacía cada AI_STREAM_POLL_MS con after(), cambiando solo su propio
+    texto (no se rehace el chat).
+    """
 
     def __init__(self, parent):
         super().__init__(parent)
         self.configure(style='TFrame')
         self.pending_sql_queries = []  # Track SQL for next button
+        self._stream = None
         self.create_widgets()
 
     def create_widgets(self):
@@ -109,6 +119,10 @@ class ChatDisplay(ttk.Frame):
 
     def add_message(self, sender: dict, message: str):
         """Add a message to the chat display with bubble styling"""
+        self._add_bubble(sender, message)
+        self._scroll_to_bottom()
+
+    def _add_bubble(self, sender: dict, message: str):
 
         timestamp = mexico_now().strftime("%H:%M")
         # Container for message alignment
@@ -151,7 +165,112 @@ class ChatDisplay(ttk.Frame):
         )
         msg_label.pack(anchor="w", padx=15, pady=(0, 10))
 
+        return msg_container, bubble_frame, msg_label
+
+    # --- Streaming ---
+
+    def start_stream(self, sender: dict) -> queue.Queue:
+        """Burbuja vacía de `sender` que se llena con lo que llegue a la cola"""
+        self.discard_stream()
+
+        container, bubble_frame, msg_label = self._add_bubble(sender, "")
+        status_label = tk.Label(
+            bubble_frame,
+            text="⏳ Pensando…",
+            font=("Segoe UI", 9, "italic"),
+            bg=sender["bg"],
+            fg=sender["header_fg"]
+        )
+        status_label.pack(anchor="w", padx=15, pady=(0, 10))
+
+        self._stream = {
+            "queue": queue.Queue(),
+            "container": container,
+            "bubble": bubble_frame,
+            "sender": sender,
+            "label": msg_label,
+            "status": status_label,
+            "timings": None,
+            "parts": [],
+            "job": None,
+        }
+        self._scroll_to_bottom()
+        self._drain_stream()
+        return self._stream["queue"]
+
+    def _drain_stream(self):
+        stream = self._stream
+        if stream is None or not self.winfo_exists():
+            return
+
+        changed = False
+        while True:
+            try:
+                kind, value = stream["queue"].get_nowait()
+            except queue.Empty:
+                break
+
+            if kind == "text":
+                stream["parts"].append(value)
+                changed = True
+            elif kind == "reset":
+                stream["parts"].clear()
+                changed = True
+            elif kind == "status":
+                if value:
+                    stream["status"].config(text=value)
+                    stream["status"].pack(anchor="w", padx=15, pady=(0, 10))
+                else:
+                    stream["status"].pack_forget()
+            elif kind == "tools":
+                self._add_timings(stream, value)
+
+        if changed:
+            stream["label"].config(text="".join(stream["parts"]))
+            self._scroll_to_bottom()
+
+        stream["job"] = self.after(AI_STREAM_POLL_MS, self._drain_stream)
+
+    def _add_timings(self, stream, line):
+        """Tiempos de las consultas de cada turno, debajo del texto (se quedan al terminar)"""
+        if stream["timings"] is None:
+            sender = stream["sender"]
+            stream["timings"] = tk.Label(
+                stream["bubble"],
+                text=line,
+                font=("Segoe UI", 8),
+                bg=sender["bg"],
+                fg=sender["header_fg"],
+                wraplength=400,
+                justify=tk.LEFT
+            )
+            stream["timings"].pack(anchor="w", padx=15, pady=(0, 8), after=stream["label"])
+        else:
+            stream["timings"].config(text=f"{stream['timings'].cget('text')}\n{line}")
+
+    def finish_stream(self, message: str) -> bool:
+        """Deja `message` como texto final de la burbuja; False si no había stream"""
+        stream = self._stream
+        if stream is None:
+            return False
+
+        self._stop_stream()
+        stream["status"].destroy()
+        stream["label"].config(text=message)
         self._scroll_to_bottom()
+        return True
+
+    def discard_stream(self):
+        """Quita la burbuja en curso (ej: la respuesta terminó en error)"""
+        stream = self._stream
+        if stream is not None:
+            self._stop_stream()
+            stream["container"].destroy()
+
+    def _stop_stream(self):
+        if self._stream["job"] is not None:
+            self.after_cancel(self._stream["job"])
+        self._stream = None
 
     def add_system_message(self, message: str):        
         msg_container = tk.Frame(self.scrollable_frame, bg="#f8f9fa")
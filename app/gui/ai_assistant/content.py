@@ -4,10 +4,10 @@ Provides a chat interface to ask business questions
 """
 import tkinter as tk
 from tkinter import ttk
-import threading
 
 from app.constants import ASISTANT_SENDER, ERROR_SENDER, YOU_SENDER
 from app.services.ai_assistant_mcp import ai_assistant_mcp
+from app.services.task_runner import task_runner
 from app.data.providers.ia import ia_provider
 from app.gui.ai_assistant.chat_display import ChatDisplay
 from app.gui.ai_assistant.chat_input import ChatInput
@@ -117,15 +117,13 @@ class AIAssistantContent(ttk.Frame):
             self.check_claude_on_startup()
 
     def check_claude_on_startup(self):
-        
-        def check():
-
-            # Use MCP status check
-            status = ai_assistant_mcp.check_status()
-            self.after(0, self.display.update_status_check_api_ai, status)
 
-        thread = threading.Thread(target=check, daemon=True)
-        thread.start()
+        # Use MCP status check
+        task_runner.submit(
+            self, ai_assistant_mcp.check_status,
+            on_done=self.display.update_status_check_api_ai,
+            key="status"
+        )
 
     def send_question(self, question: str = None):
 
@@ -146,38 +144,41 @@ class AIAssistantContent(ttk.Frame):
         self.is_processing = True
         self.input.set_processing(True)
 
+        # La respuesta se va escribiendo en la burbuja conforme llega
+        stream = self.display.start_stream(ASISTANT_SENDER)
+
         # Process in background thread
-        def process():
-            try:
-
-                result = ai_assistant_mcp.ask(question)
-                
-                # MCP returns dict with response and sql_queries
-                if isinstance(result, dict):
-                    response_text = result.get("response", "Error desconocido")
-
-                    if result.get("success", False):
-                        self.after(0, self.display_response, response_text)
-                    else:
-                        self.after(0, self.display_error, response_text)
-                else:
-                    self.after(0, self.display_response, result)
-            
-            except Exception as e:
-                self.after(0, self.display_error, str(e))
-
-        thread = threading.Thread(target=process, daemon=True)
-        thread.start()
+        task_runner.submit(
+            self, ai_assistant_mcp.ask, question,
+            on_event=lambda kind, value=None: stream.put((kind, value)),
+            on_done=self.on_answer,
+            on_error=lambda e: self.display_error(str(e))
+        )
+
+    def on_answer(self, result):
+
+        # MCP returns dict with response and sql_queries
+        if isinstance(result, dict):
+            response_text = result.get("response", "Error desconocido")
+
+            if result.get("success", False):
+                self.display_response(response_text)
+            else:
+                self.display_error(response_text)
+        else:
+            self.display_response(result)
 
     def display_response(self, response: str):
 
-        self.display.add_message(ASISTANT_SENDER, response)
+        if not self.display.finish_stream(response):
+            self.display.add_message(ASISTANT_SENDER, response)
 
         self.is_processing = False
         self.input.set_processing(False)
 
     def display_error(self, error: str):
         
+        self.display.discard_stream()
         self.display.add_message(ERROR_SENDER, error)
         self.is_processing = False
         self.input.set_processing(False)
@@ -4,10 +4,15 @@ from app.gui.cash.summary_panel import SummaryPanel
 from app.gui.cash.register_form import RegisterForm
 from app.gui.cash.closed_panel import ClosedPanel
 from app.gui.cash.history_panel import HistoryPanel
+from app.constants import mexico_now
 from app.data.providers.cash_cut import cash_cut_provider
+from app.gui.view_manager import LazyTabs
 
 
 class CashContent(ttk.Frame):
+    # Lo que mueve el resumen del día y el historial
+    REFRESH_ON = ("sales", "orders", "order_refunds", "cash_cuts")
+
     def __init__(self, parent, app):
         super().__init__(parent)
         self.app = app
@@ -18,6 +23,7 @@ class CashContent(ttk.Frame):
         # Notebook (tabs)
         self.notebook = ttk.Notebook(self, bootstyle="primary")
         self.notebook.pack(fill=BOTH, expand=YES, padx=10, pady=10)
+        self.lazy_tabs = LazyTabs(self.notebook, "cash")
 
         # Tab 1: Caja
         self.tab_caja = ttk.Frame(self.notebook)
@@ -26,14 +32,14 @@ class CashContent(ttk.Frame):
 
         # Tab 2: Historial de Caja
         self.tab_historial = ttk.Frame(self.notebook)
-        self.notebook.add(self.tab_historial, text="  📋 Historial de Caja  ")
-        self.setup_historial_tab()
+        self.lazy_tabs.add(self.tab_historial, "  📋 Historial de Caja  ", self.setup_historial_tab)
 
     def _build_caja_tab(self):
         # Clear existing content
         for w in self.tab_caja.winfo_children():
             w.destroy()
 
+        self.built_on = mexico_now().date()
         today_cut = self.provider.get_today_cut()
 
         if today_cut:
@@ -63,4 +69,10 @@ class CashContent(ttk.Frame):
 
     def refresh_all(self):
         self._build_caja_tab()
-        self.history_panel.refresh()
+        if self.lazy_tabs.built(self.tab_historial):
+            self.history_panel.refresh()
+
+    def on_show(self, changed):
+        # También si cambió el día con la vista oculta
+        if changed or mexico_now().date() != self.built_on:
+            self.refresh_all()
@@ -97,14 +97,15 @@ class HistoryPanel(ttk.Frame):
             fetch_page=self._fetch_page,
             count_rows=lambda: self.provider.get_count(self._filters),
             pagesize=40,
+            keyset=True,
             bootstyle=PRIMARY,
         )
         self.table.pack(fill=BOTH, expand=YES, padx=10)
 
-    def _fetch_page(self, offset, limit):
-        rows = self.provider.get_all(offset=offset, limit=limit, filters=self._filters)
+    def _fetch_page(self, limit, **cursor):
+        page = self.provider.get_page(limit, self._filters, **cursor)
         table_data = []
-        for row in rows:
+        for row in page.rows:
             cut_id, closed_at, expected, cash, card, transfer, declared, diff, s_count, o_count = row
             date_str = closed_at.strftime("%d/%b/%Y %H:%M") if closed_at else "---"
 
@@ -127,7 +128,7 @@ class HistoryPanel(ttk.Frame):
                 f"${expected:,.2f}",
                 diff_str,
             ])
-        return table_data
+        return page._replace(rows=table_data)
 
     def _apply_filter(self):
         start = self.date_start.entry.get()
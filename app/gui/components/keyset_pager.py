@@ -0,0 +1,104 @@
+from math import ceil
+
+
+class KeysetPager:
+    """
+    Estado de navegacion compartido por ServerPaginatedTableview y PaginationBar.
+
+    Cada movimiento devuelve un request (pageindex, limit, cursor) o None si no
+    hay a donde ir. En modo keyset el cursor es {'after': llave},
+    {'before': llave}, {'last': True} o {'offset': n} (solo para saltar a una
+    pagina escrita a mano); en modo offset siempre es {'offset': n}.
+
+    El conteo total es opcional: llega aparte (set_total) y puede estar
+    desfasado. En modo keyset la pagina siguiente la decide has_more de la
+    ultima consulta, no el conteo.
+    """
+
+    def __init__(self, pagesize, keyset=False):
+        self.pagesize = pagesize
+        self.keyset = keyset
+        self.total = None
+        self.page = None
+        self.pageindex = 1
+        self.has_next = False
+
+    # --- Estado ---
+
+    def pagelimit(self):
+        counted = max(ceil(self.total / self.pagesize), 1) if self.total is not None else None
+
+        if not self.keyset and counted is not None:
+            return max(counted, self.pageindex)
+        if self.has_next:
+            return max(counted or 0, self.pageindex + 1)
+        return self.pageindex
+
+    def set_total(self, total):
+        self.total = total
+
+    def loaded(self, pageindex, cursor, page):
+        """Registra la pagina recibida; devuelve el pageindex corregido."""
+        backwards = cursor.get('before') is not None or cursor.get('last')
+
+        if backwards and not page.has_more:
+            # No hay nada mas reciente: es la primera pagina
+            pageindex = 1
+
+        if backwards:
+            self.has_next = cursor.get('before') is not None
+        else:
+            self.has_next = page.has_more
+
+        self.pageindex = pageindex
+        self.page = page
+        return pageindex
+
+    # --- Movimientos ---
+
+    def _at(self, pageindex):
+        return pageindex, self.pagesize, {'offset': (pageindex - 1) * self.pagesize}
+
+    def first(self):
+        return self._at(1)
+
+    def next(self):
+        if self.pageindex >= self.pagelimit():
+            return None
+        if self.keyset:
+            return self.pageindex + 1, self.pagesize, {'after': self.page.last}
+        return self._at(self.pageindex + 1)
+
+    def prev(self):
+        if self.pageindex <= 1:
+            return None
+        if self.keyset and self.page and self.page.rows:
+            return self.pageindex - 1, self.pagesize, {'before': self.page.first}
+        return self._at(self.pageindex - 1)
+
+    def last(self):
+        pagelimit = self.pagelimit()
+        if not self.keyset:
+            return self._at(pagelimit)
+        if self.total is None:
+            return pagelimit, self.pagesize, {'last': True}
+
+        # La ultima pagina trae el residuo para que "anterior" quede alineado
+        limit = self.total - (pagelimit - 1) * self.pagesize
+        limit = min(max(limit, 1), self.pagesize)
+        return pagelimit, limit, {'last': True}
+
+    def goto(self, pageindex):
+        pagelimit = self.pagelimit()
+        pageindex = min(max(pageindex, 1), pagelimit)
+
+        if pageindex == 1:
+            return self.first()
+        if self.keyset:
+            if pageindex == self.pageindex + 1:
+                return self.next()
+            if pageindex == self.pageindex - 1:
+                return self.prev()
+            if pageindex == pagelimit and self.total is not None:
+                return self.last()
+        return self._at(pageindex)
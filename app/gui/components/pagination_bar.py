@@ -1,7 +1,7 @@
-from math import ceil
 import tkinter as tk
 import ttkbootstrap as ttk
 from ttkbootstrap.constants import *
+from app.gui.components.keyset_pager import KeysetPager
 
 
 class PaginationBar(ttk.Frame):
@@ -9,15 +9,17 @@ class PaginationBar(ttk.Frame):
     Barra de paginacion reutilizable que replica el estilo del Tableview.
 
     Parametros:
-        on_page_change: callable() que se invoca al cambiar de pagina.
+        on_page_change: callable(limit, cursor) que se invoca al cambiar de
+            pagina; el llamador consulta y devuelve el resultado con set_page().
         pagesize: cantidad de items por pagina (default 10).
+        keyset: cursores por llave (fecha, id) en lugar de offset.
     """
 
-    def __init__(self, master, on_page_change, pagesize=10, **kwargs):
+    def __init__(self, master, on_page_change, pagesize=10, keyset=False, **kwargs):
         super().__init__(master, **kwargs)
         self._on_page_change = on_page_change
-        self._pagesize = pagesize
-        self._total_items = 0
+        self._pager = KeysetPager(pagesize, keyset=keyset)
+        self._pending = (1, {})
         self._pageindex = tk.IntVar(value=1)
         self._pagelimit = tk.IntVar(value=1)
 
@@ -63,45 +65,42 @@ class PaginationBar(ttk.Frame):
     # --- API publica ---
 
     def update_total(self, total_items):
-        self._total_items = total_items
-        total_pages = ceil(total_items / self._pagesize) if total_items > 0 else 1
-        self._pagelimit.set(total_pages)
-        if self._pageindex.get() > total_pages:
-            self._pageindex.set(total_pages)
+        """Conteo opcional (puede llegar tarde o estar desfasado)."""
+        self._pager.set_total(total_items)
+        self._pagelimit.set(self._pager.pagelimit())
 
-    def get_offset(self):
-        return (self._pageindex.get() - 1) * self._pagesize
+    def set_page(self, page):
+        """Registra la KeysetPage que devolvio la consulta de on_page_change."""
+        pageindex, cursor = self._pending
+        self._pageindex.set(self._pager.loaded(pageindex, cursor, page))
+        self._pagelimit.set(self._pager.pagelimit())
 
-    def reset(self):
-        self._pageindex.set(1)
+    def reload_page(self):
+        """Vuelve a pedir la pagina actual (mismo cursor)."""
+        pageindex, cursor = self._pending
+        self._request((pageindex, self._pager.pagesize, cursor))
 
     # --- Navegacion ---
 
+    def _request(self, request):
+        if request is None:
+            return
+        pageindex, limit, cursor = request
+        self._pending = (pageindex, cursor)
+        self._pageindex.set(pageindex)
+        self._on_page_change(limit, cursor)
+
     def goto_first_page(self):
-        self._pageindex.set(1)
-        self._on_page_change()
+        self._request(self._pager.first())
 
     def goto_last_page(self):
-        self._pageindex.set(self._pagelimit.get())
-        self._on_page_change()
+        self._request(self._pager.last())
 
     def goto_next_page(self):
-        if self._pageindex.get() >= self._pagelimit.get():
-            return
-        self._pageindex.set(self._pageindex.get() + 1)
-        self._on_page_change()
+        self._request(self._pager.next())
 
     def goto_prev_page(self):
-        if self._pageindex.get() <= 1:
-            return
-        self._pageindex.set(self._pageindex.get() - 1)
-        self._on_page_change()
+        self._request(self._pager.prev())
 
     def goto_page(self):
-        page = self._pageindex.get()
-        limit = self._pagelimit.get()
-        if page > limit:
-            self._pageindex.set(limit)
-        elif page <= 0:
-            self._pageindex.set(1)
-        self._on_page_change()
+        self._request(self._pager.goto(self._pageindex.get()))
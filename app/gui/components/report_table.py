@@ -0,0 +1,105 @@
+import ttkbootstrap as ttk
+from ttkbootstrap.constants import *
+from tkinter import font as tkfont
+
+
+class ReportTable(ttk.Frame):
+    """
+    Tabla de solo lectura para reportes: un solo ttk.Treeview.
+
+    columns usa el mismo formato que coldata de Tableview:
+        {"text", "width" (opcional), "stretch" (opcional), "format" (opcional)}
+    rows son los valores crudos. Cada celda se formatea una sola vez
+    (money_cols -> "$1,234.56", o con el "format" de la columna) y al hacer
+    clic en un encabezado se ordena en Python por el valor crudo, así los
+    montos se ordenan como número y no como texto.
+
+    A diferencia de Tableview no crea menús contextuales, objetos por
+    renglón ni mide cada celda para autoajustar columnas: el ancho de las
+    columnas sin "width" sale del texto más largo x el ancho de un carácter.
+    """
+
+    MIN_WIDTH = 60
+    MAX_WIDTH = 420
+
+    def __init__(self, master, columns, rows, money_cols=(), bootstyle=INFO, height=15, **kwargs):
+        super().__init__(master, **kwargs)
+        self.columns = columns
+        self.rows = [list(row) for row in rows]
+        self._sorted_by = None
+
+        formats = [
+            "${:,.2f}" if i in money_cols else column.get("format")
+            for i, column in enumerate(columns)
+        ]
+        self._display = [
+            [self._format(value, fmt) for value, fmt in zip(row, formats)]
+            for row in self.rows
+        ]
+
+        self.view = ttk.Treeview(
+            self,
+            columns=list(range(len(columns))),
+            show=HEADINGS,
+            height=max(min(len(self.rows), height), 1),
+            selectmode="none",
+            bootstyle=f"{bootstyle}-table",
+        )
+        self.scrollbar = ttk.Scrollbar(self, orient=VERTICAL, command=self.view.yview)
+        self.view.configure(yscrollcommand=self.scrollbar.set)
+
+        if len(self.rows) > height:
+            self.scrollbar.pack(side=RIGHT, fill=Y)
+        self.view.pack(side=LEFT, fill=BOTH, expand=YES)
+
+        self._setup_columns(money_cols)
+
+        for index, values in enumerate(self._display):
+            self.view.insert("", END, iid=str(index), values=values)
+
+    @staticmethod
+    def _format(value, fmt):
+        if value is None:
+            return ""
+        if fmt and isinstance(value, (int, float)):
+            return fmt.format(value)
+        return str(value)
+
+    def _setup_columns(self, money_cols):
+        char_width = tkfont.nametofont("TkDefaultFont").measure("0")
+
+        for i, column in enumerate(self.columns):
+            width = column.get("width")
+            if width is None:
+                longest = max([len(column["text"])] + [len(row[i]) for row in self._display])
+                width = min(max((longest + 2) * char_width, self.MIN_WIDTH), self.MAX_WIDTH)
+
+            numeric = i in money_cols or column.get("format") is not None
+            self.view.column(
+                i,
+                width=width,
+                minwidth=min(width, self.MIN_WIDTH),
+                stretch=column.get("stretch", False),
+                anchor=E if numeric else W,
+            )
+            self.view.heading(i, text=column["text"], anchor=W, command=lambda c=i: self.sort_by(c))
+
+    # --- Orden ---
+
+    def sort_by(self, col):
+        reverse = self._sorted_by == (col, False)
+        self._sorted_by = (col, reverse)
+
+        order = list(range(len(self.rows)))
+        try:
+            order.sort(key=lambda i: (self.rows[i][col] is None, self.rows[i][col]), reverse=reverse)
+        except TypeError:
+            # Tipos mezclados (ej: número y "N/A"): se ordena por el texto
+            order.sort(key=lambda i: self._display[i][col], reverse=reverse)
+
+        for position, index in enumerate(order):
+            self.view.move(str(index), "", position)
+
+        for i, column in enumerate(self.columns):
+            arrow = (" ▼" if reverse else " ▲") if i == col else ""
+            self.view.heading(i, text=column["text"] + arrow)
@@ -1,22 +1,33 @@
-from math import ceil
 from ttkbootstrap.tableview import Tableview, TableRow
 
+from app.data.pagination import KeysetPage
+from app.gui.components.keyset_pager import KeysetPager
+from app.services.task_runner import task_runner
+
 
 class ServerPaginatedTableview(Tableview):
     """
-    Tableview con paginacion server-side (OFFSET/LIMIT).
+    Tableview con paginacion server-side.
 
     Parametros extra:
-        fetch_page: callable(offset, limit) -> list[list]
+        fetch_page:
+            keyset=False -> callable(offset, limit) -> list[list]
+            keyset=True  -> callable(limit, **cursor) -> KeysetPage con rows ya formateados
         count_rows: callable() -> int
+        keyset: paginar por llave (fecha, id) en lugar de OFFSET/LIMIT
+
+    Ambos corren en un hilo del pool (task_runner): no deben tocar widgets.
+    count_rows solo se consulta en la primera carga y en refresh(), en su
+    propia tarea; cambiar de pagina no vuelve a contar.
     """
 
     def __init__(self, master, coldata, fetch_page, count_rows,
-                 pagesize=10, **kwargs):
+                 pagesize=10, keyset=False, **kwargs):
         self._fetch_page = fetch_page
         self._count_rows = count_rows
-        self._server_total = 0
+        self._pager = KeysetPager(pagesize, keyset=keyset)
         self._loading = False
+        self._rendering = False
         self._initialized = False
 
         kwargs.pop('autoalign', None)
@@ -37,21 +48,54 @@ class ServerPaginatedTableview(Tableview):
 
     def _first_load(self):
         self._initialized = True
-        self._rowindex.set(0)
-        self._load_server_page()
+        self._load_count()
+        self._load_server_page(self._pager.first())
+
+    def _load_count(self):
+        task_runner.submit(
+            self, self._count_rows,
+            on_done=self._on_count,
+            on_error=self._on_load_error,
+            key="count"
+        )
+
+    def _on_count(self, total):
+        self._pager.set_total(total)
+        self._pagelimit.set(self._pager.pagelimit())
 
-    def _load_server_page(self):
-        if self._loading or not self._initialized:
+    def _load_server_page(self, request):
+        if request is None or self._rendering or not self._initialized:
             return
         self._loading = True
 
-        try:
-            offset = max(0, self._rowindex.get())
-            limit = self._pagesize.get()
-            self._server_total = self._count_rows()
-            total_pages = ceil(self._server_total / limit) if self._server_total > 0 else 1
+        # Pagina en segundo plano; una carga nueva cancela la anterior
+        pageindex, limit, cursor = request
+        task_runner.submit(
+            self, self._query_page, pageindex, limit, cursor,
+            on_done=self._show_server_page,
+            on_error=self._on_load_error,
+            key="page"
+        )
 
-            rows = self._fetch_page(offset, limit)
+    def _query_page(self, pageindex, limit, cursor):
+        """Corre en un hilo del pool: solo consultas, nada de widgets."""
+        if self._pager.keyset:
+            page = self._fetch_page(limit, **cursor)
+        else:
+            rows = self._fetch_page(cursor['offset'], limit)
+            page = KeysetPage(rows, None, None, len(rows) >= limit)
+        return pageindex, cursor, page
+
+    def _on_load_error(self, error):
+        self._loading = False
+        print(f"[ServerPaginatedTableview] Error cargando pagina: {error}")
+
+    def _show_server_page(self, result):
+        pageindex, cursor, page = result
+        self._rendering = True
+
+        try:
+            pageindex = self._pager.loaded(pageindex, cursor, page)
 
             # Limpiar vista y datos internos
             self.unload_table_data()
@@ -66,7 +110,7 @@ class ServerPaginatedTableview(Tableview):
             self._iidmap.clear()
 
             # Crear y mostrar filas directamente
-            for i, values in enumerate(rows):
+            for i, values in enumerate(page.rows):
                 record = TableRow(self, values)
                 self._tablerows.append(record)
                 stripe = self._stripecolor is not None and i % 2 == 0
@@ -74,59 +118,32 @@ class ServerPaginatedTableview(Tableview):
                 self._viewdata.append(record)
 
             # Setear paginacion
-            self._pagelimit.set(total_pages)
-            pageindex = (offset // limit) + 1 if self._server_total > 0 else 1
-            self._pageindex.set(min(total_pages, pageindex))
+            self._rowindex.set((pageindex - 1) * self.pagesize)
+            self._pageindex.set(pageindex)
+            self._pagelimit.set(self._pager.pagelimit())
 
         finally:
             self._loading = False
+            self._rendering = False
 
     # ─── Override paginacion ──────────────────────────────────
 
     def goto_first_page(self):
-        if not self._initialized:
-            return
-        self._rowindex.set(0)
-        self._load_server_page()
+        self._load_server_page(self._pager.first())
 
     def goto_last_page(self):
-        if not self._initialized:
-            return
-        total = self._count_rows()
-        limit = self._pagesize.get()
-        last_page = max(ceil(total / limit) - 1, 0)
-        self._rowindex.set(self.pagesize * last_page)
-        self._load_server_page()
+        self._load_server_page(self._pager.last())
 
     def goto_next_page(self):
-        if not self._initialized:
-            return
-        if self._pageindex.get() >= self._pagelimit.get():
-            return
-        self._rowindex.set(self._rowindex.get() + self.pagesize)
-        self._load_server_page()
+        self._load_server_page(self._pager.next())
 
     def goto_prev_page(self):
-        if not self._initialized:
-            return
-        if self._pageindex.get() <= 1:
-            return
-        self._rowindex.set(self._rowindex.get() - self.pagesize)
-        self._load_server_page()
+        self._load_server_page(self._pager.prev())
 
     def goto_page(self, *_):
         if not self._initialized:
             return
-        pagelimit = self._pagelimit.get()
-        pageindex = self._pageindex.get()
-        if pageindex > pagelimit:
-            pageindex = pagelimit
-            self._pageindex.set(pageindex)
-        elif pageindex <= 0:
-            pageindex = 1
-            self._pageindex.set(pageindex)
-        self._rowindex.set((pageindex * self.pagesize) - self.pagesize)
-        self._load_server_page()
+        self._load_server_page(self._pager.goto(self._pageindex.get()))
 
     # ─── Override sort (el orden viene del SQL) ───────────────
 
@@ -134,5 +151,7 @@ class ServerPaginatedTableview(Tableview):
         pass
 
     def refresh(self):
-        self._rowindex.set(0)
-        self._load_server_page()
+        if not self._initialized:
+            return
+        self._load_count()
+        self._load_server_page(self._pager.first())
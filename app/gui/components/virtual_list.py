@@ -0,0 +1,194 @@
+import math
+import ttkbootstrap as ttk
+from ttkbootstrap.constants import *
+
+
+class VirtualList(ttk.Frame):
+    """
+    Lista con scroll que solo crea los renglones visibles.
+
+    Todos los renglones miden row_height. Los widgets se crean una sola vez
+    con row_factory(parent) y se reciclan al hacer scroll: al salir de la
+    vista regresan al pool y se vuelven a llenar con row.show(item). Con
+    columns > 1 cada renglón tiene varias tarjetas (grid).
+
+    Así el costo de pintar depende del alto de la ventana, no de cuántos
+    elementos tenga la lista.
+    """
+
+    def __init__(
+        self,
+        master,
+        row_factory,
+        row_height,
+        columns=1,
+        gap=8,
+        empty_text="",
+        **kwargs
+    ):
+        super().__init__(master, **kwargs)
+        self.row_factory = row_factory
+        self.row_height = row_height
+        self.columns = columns
+        self.gap = gap
+        self.items = []
+
+        self._slots = {}
+        self._free = []
+        self._width = 1
+        self._layout_after = None
+        self.stats = {"created": 0, "shown": 0}
+
+        self.canvas = ttk.Canvas(self, highlightthickness=0)
+        self.scrollbar = ttk.Scrollbar(self, orient=VERTICAL, command=self.canvas.yview)
+        self.canvas.configure(yscrollcommand=self._on_yscroll)
+
+        self.scrollbar.pack(side=RIGHT, fill=Y)
+        self.canvas.pack(side=LEFT, fill=BOTH, expand=YES)
+
+        self.empty_label = ttk.Label(self.canvas, text=empty_text, font=("Arial", 12), bootstyle="secondary")
+        self._empty_window = self.canvas.create_window(0, 40, window=self.empty_label, anchor="n", state="hidden")
+
+        self.canvas.bind("<Configure>", self._on_configure)
+        self.canvas.bind("<Enter>", lambda e: self._bind_mousewheel())
+        self.canvas.bind("<Leave>", lambda e: self._on_leave())
+
+    # --- API publica ---
+
+    def set_items(self, items):
+        """Reemplaza los elementos y regresa al inicio."""
+        self.items = list(items)
+        for index in list(self._slots):
+            self._release(index)
+
+        self.canvas.yview_moveto(0)
+        self._update_scrollregion()
+        self._layout()
+
+    def update_item(self, index, item):
+        """Cambia un elemento; si está visible solo se vuelve a llenar su renglón."""
+        self.items[index] = item
+        slot = self._slots.get(index)
+        if slot:
+            slot[1].show(item)
+            self.stats["shown"] += 1
+
+    def refresh(self):
+        """Vuelve a llenar los renglones visibles (ej: cambió un dato externo)."""
+        for index, (_, row) in self._slots.items():
+            row.show(self.items[index])
+            self.stats["shown"] += 1
+
+    # --- Layout ---
+
+    def _rows(self):
+        return math.ceil(len(self.items) / self.columns)
+
+    def _cell_width(self):
+        return max(self._width / self.columns, 1)
+
+    def _update_scrollregion(self):
+        height = self._rows() * self.row_height
+        self.canvas.configure(scrollregion=(0, 0, self._width, max(height, 1)))
+
+        self.canvas.coords(self._empty_window, self._width / 2, 40)
+        self.canvas.itemconfigure(self._empty_window, state="hidden" if self.items else "normal")
+
+    def _visible_range(self):
+        top = self.canvas.canvasy(0)
+        height = self.canvas.winfo_height()
+
+        first_row = max(int(top // self.row_height), 0)
+        last_row = min(int((top + height) // self.row_height) + 1, self._rows())
+        return first_row * self.columns, min(last_row * self.columns, len(self.items))
+
+    def _place(self, window, index):
+        row, col = divmod(index, self.columns)
+        cell_width = self._cell_width()
+        gap_x = self.gap if self.columns > 1 else 0
+
+        self.canvas.coords(window, col * cell_width + gap_x / 2, row * self.row_height)
+        self.canvas.itemconfigure(
+            window,
+            width=max(cell_width - gap_x, 1),
+            height=self.row_height - self.gap,
+            state="normal"
+        )
+
+    def _layout(self):
+        self._layout_after = None
+        start, end = self._visible_range()
+
+        for index in [i for i in self._slots if not start <= i < end]:
+            self._release(index)
+
+        for index in range(start, end):
+            if index in self._slots:
+                continue
+
+            window, row = self._free.pop() if self._free else self._create()
+            self._place(window, index)
+            row.show(self.items[index])
+            self.stats["shown"] += 1
+            self._slots[index] = (window, row)
+
+    def _schedule_layout(self):
+        if self._layout_after is None:
+            self._layout_after = self.after_idle(self._layout)
+
+    def _create(self):
+        row = self.row_factory(self.canvas)
+        window = self.canvas.create_window(0, 0, window=row, anchor="nw")
+        self.stats["created"] += 1
+        return window, row
+
+    def _release(self, index):
+        window, row = self._slots.pop(index)
+        self.canvas.itemconfigure(window, state="hidden")
+        self._free.append((window, row))
+
+    # --- Eventos ---
+
+    def _on_configure(self, event):
+        self._width = event.width
+        self._update_scrollregion()
+        for index, (window, _) in self._slots.items():
+            self._place(window, index)
+        self._schedule_layout()
+
+    def _on_yscroll(self, first, last):
+        self.scrollbar.set(first, last)
+        self._schedule_layout()
+
+    # --- Mousewheel ---
+
+    def _pointer_inside(self):
+        x, y = self.winfo_pointerxy()
+        widget = self.winfo_containing(x, y)
+        return widget is not None and str(widget).startswith(str(self.canvas))
+
+    def _on_mousewheel(self, event):
+        # Al salir desde un renglón el canvas no recibe <Leave>
+        if not self._pointer_inside():
+            self._unbind_mousewheel()
+            return
+
+        if event.num == 4 or event.delta > 0:
+            self.canvas.yview_scroll(-1, "units")
+        elif event.num == 5 or event.delta < 0:
+            self.canvas.yview_scroll(1, "units")
+
+    def _bind_mousewheel(self):
+        self.canvas.bind_all("<MouseWheel>", self._on_mousewheel)
+        self.canvas.bind_all("<Button-4>", self._on_mousewheel)
+        self.canvas.bind_all("<Button-5>", self._on_mousewheel)
+
+    def _on_leave(self):
+        # Pasar del canvas a un renglón también genera <Leave>
+        if not self._pointer_inside():
+            self._unbind_mousewheel()
+
+    def _unbind_mousewheel(self):
+        self.canvas.unbind_all("<MouseWheel>")
+        self.canvas.unbind_all("<Button-4>")
+        self.canvas.unbind_all("<Button-5>")
@@ -11,6 +11,7 @@ from app.gui.reports.content import ReportsContent
 from app.gui.sales.pos.content import SalesContent
 from app.gui.sales.admin_sales.sales_admin_content import SalesAdminContent
 from app.gui.cash.content import CashContent
+from app.gui.view_manager import ViewManager
 
 
 class Navigation(tk.Frame):
@@ -30,6 +31,18 @@ class Navigation(tk.Frame):
         self.expanded = {}
         self.menu_data = {}
 
+        self.views = ViewManager({
+            "sales": lambda: SalesContent(self.app.content_container, self.app),
+            "sales_admin": lambda: SalesAdminContent(self.app.content_container, self.app),
+            "cash": lambda: CashContent(self.app.content_container, self.app),
+            "reports": lambda: ReportsContent(self.app.content_container, self.app),
+            "inventory": lambda: InventoryContent(self.app.content_container, self.app),
+            "customers": lambda: CustomersContent(self.app.content_container, self.app),
+            "suppliers": lambda: SuppliersContent(self.app.content_container, self.app),
+            "supplies": lambda: SuppliesContent(self.app.content_container, self.app),
+            "ai_assistant": lambda: AIAssistantContent(self.app.content_container)
+        })
+
         self._build_ui()
 
     def _frame(self, parent):
@@ -224,21 +237,5 @@ class Navigation(tk.Frame):
     def change_view(self, view, parent=None):
         self._set_active(view, parent)
 
-        if self.app.content:
-            self.app.content.destroy()
-
-        views = {
-            "sales": lambda: SalesContent(self.app.content_container, self.app),
-            "sales_admin": lambda: SalesAdminContent(self.app.content_container, self.app),
-            "cash": lambda: CashContent(self.app.content_container, self.app),
-            "reports": lambda: ReportsContent(self.app.content_container, self.app),
-            "inventory": lambda: InventoryContent(self.app.content_container, self.app),
-            "customers": lambda: CustomersContent(self.app.content_container, self.app),
-            "suppliers": lambda: SuppliersContent(self.app.content_container, self.app),
-            "supplies": lambda: SuppliesContent(self.app.content_container, self.app),
-            "ai_assistant": lambda: AIAssistantContent(self.app.content_container)
-        }
-
-        if view in views:
-            self.app.content = views[view]()
-            self.app.content.pack(fill=BOTH, expand=YES)
+        # Las vistas recientes se conservan ocultas (ver ViewManager)
+        self.app.content = self.views.show(view)
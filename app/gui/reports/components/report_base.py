@@ -1,17 +1,23 @@
 """
 BaseReportTab - Clase base para todos los tabs de reportes.
 Provee: scrollable frame, refresh_data, helpers para KPIs, tablas y cards.
+
+Cada tab separa load_data (consultas, corre en un hilo del pool) de
+build_sections (widgets, en el hilo de Tkinter). Si report_cache devuelve
+el mismo resultado que ya está pintado, no se reconstruye nada.
 """
 
 import ttkbootstrap as ttk
 from ttkbootstrap.constants import *
-from app.data.database import SessionLocal
+from app.services.task_runner import task_runner
+from app.gui.components.report_table import ReportTable
 
 
 class BaseReportTab(ttk.Frame):
     def __init__(self, parent, app):
         super().__init__(parent)
         self.app = app
+        self._data = None
         self.setup_ui()
 
     def setup_ui(self):
@@ -35,13 +41,23 @@ class BaseReportTab(ttk.Frame):
         self.canvas.itemconfig(self.canvas_window, width=event.width)
 
     def refresh_data(self):
+        task_runner.submit(self, self.load_data, on_done=self._show_data, key="refresh")
+
+    def _show_data(self, data):
+        if data is self._data:
+            return
+        self._data = data
+
         for widget in self.scrollable_frame.winfo_children():
             widget.destroy()
 
-        with SessionLocal() as db:
-            self.build_sections(db)
+        self.build_sections(data)
 
-    def build_sections(self, db):
+    def load_data(self):
+        """Datasets del tab (report_queries); no debe tocar widgets"""
+        raise NotImplementedError
+
+    def build_sections(self, data):
         raise NotImplementedError
 
     def add_separator(self):
@@ -81,37 +97,15 @@ class BaseReportTab(ttk.Frame):
 
         return frame
 
-    def create_table(self, parent, headers, rows, money_cols=None):
+    def create_table(self, parent, columns, rows, money_cols=(), bootstyle=INFO, height=15):
         """
-        headers: list of (text, width)
-        rows: list of lists of values
+        columns: list of dicts {text, width?, stretch?, format?}
+        rows: list of lists of raw values (se formatean y ordenan en ReportTable)
         money_cols: set of column indices that should be formatted as money
         """
-        money_cols = money_cols or set()
-
-        # Header
-        header_frame = ttk.Frame(parent)
-        header_frame.pack(fill=X, pady=(0, 5))
-        for text, width in headers:
-            ttk.Label(
-                header_frame, text=text,
-                font=("Segoe UI", 10, "bold"), width=width
-            ).pack(side=LEFT, padx=5)
-
-        # Rows
-        for row in rows:
-            row_frame = ttk.Frame(parent)
-            row_frame.pack(fill=X, pady=2)
-
-            for col_idx, (value, (_, width)) in enumerate(zip(row, headers)):
-                kwargs = {"width": width}
-                if col_idx in money_cols:
-                    kwargs["foreground"] = "#28a745"
-                    kwargs["font"] = ("Segoe UI", 10, "bold")
-
-                ttk.Label(row_frame, text=str(value), **kwargs).pack(side=LEFT, padx=5)
-
-        return len(rows) > 0
+        table = ReportTable(parent, columns, rows, money_cols=money_cols, bootstyle=bootstyle, height=height)
+        table.pack(fill=BOTH, expand=YES)
+        return table
 
     def create_highlight_cards(self, parent, best, worst):
         """
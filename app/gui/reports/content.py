@@ -3,19 +3,41 @@ Módulo de Reportes
 Análisis detallado de ventas, clientes, insumos y proveedores
 """
 
+import time
 import ttkbootstrap as ttk
 from ttkbootstrap.constants import *
 from .sales.sales_content import SalesTab
 from .customers.customers_content import CustomersTab
 from .supplies.supplies_content import SuppliesTab
 from .suppliers.suppliers_content import SuppliersTab
+from app.constants import mexico_now
+from app.services.change_bus import change_bus
+from app.gui.view_manager import record_build
 
 
 class ReportsContent(ttk.Frame):
+    # Tablas que leen los reportes; si cambian, los tabs ya construidos quedan viejos
+    REPORT_TABLES = (
+        "sales", "sales_detail", "orders", "order_details", "order_refunds", "customers",
+        "products", "supplies", "supply_purchases", "suppliers", "daily_rollups",
+    )
+
+    TAB_CLASSES = {
+        "ventas": SalesTab,
+        "clientes": CustomersTab,
+        "insumos": SuppliesTab,
+        "proveedores": SuppliersTab,
+    }
+
     def __init__(self, parent, app):
         super().__init__(parent)
         self.app = app
 
+        # Tabs con datos viejos y día en que se cargó cada uno
+        self.stale_tabs = set()
+        self.loaded_on = {}
+        change_bus.subscribe(self, self.REPORT_TABLES, self.on_tables_changed)
+
         # Configure custom styles
         self.setup_styles()
         self.setup_ui()
@@ -80,13 +102,8 @@ class ReportsContent(ttk.Frame):
         self.tab_content = ttk.Frame(tabs_container)
         self.tab_content.pack(fill=BOTH, expand=YES)
 
-        # Create tabs
-        self.tabs = {
-            "ventas": SalesTab(self.tab_content, self.app),
-            "clientes": CustomersTab(self.tab_content, self.app),
-            "insumos": SuppliesTab(self.tab_content, self.app),
-            "proveedores": SuppliersTab(self.tab_content, self.app)
-        }
+        # Los tabs se construyen la primera vez que se eligen
+        self.tabs = {}
 
         # Show first tab
         self.current_tab = None
@@ -106,6 +123,8 @@ class ReportsContent(ttk.Frame):
                 btn.config(bootstyle=f"outline-{bootstyle}")
 
         # Show new tab
+        if tab_id not in self.tabs:
+            self.build_tab(tab_id)
         self.tabs[tab_id].pack(fill=BOTH, expand=YES)
         self.current_tab = tab_id
 
@@ -113,5 +132,23 @@ class ReportsContent(ttk.Frame):
         bootstyle = "primary" if tab_id == "ventas" else "info" if tab_id == "clientes" else "warning" if tab_id == "insumos" else "success"
         self.tab_buttons[tab_id].config(bootstyle=bootstyle)
 
-        # Refresh tab data
-        self.tabs[tab_id].refresh_data()
+        # Refresh tab data (solo si no se ha cargado o quedó viejo)
+        self.refresh_if_stale(tab_id)
+
+    def build_tab(self, tab_id):
+        started = time.perf_counter()
+        self.tabs[tab_id] = self.TAB_CLASSES[tab_id](self.tab_content, self.app)
+        record_build(f"reports/{tab_id}", started)
+
+    def refresh_if_stale(self, tab_id):
+        today = mexico_now().date()
+        if tab_id in self.stale_tabs or self.loaded_on.get(tab_id) != today:
+            self.stale_tabs.discard(tab_id)
+            self.loaded_on[tab_id] = today
+            self.tabs[tab_id].refresh_data()
+
+    def on_tables_changed(self, _events):
+        self.stale_tabs.update(self.tabs)
+
+    def on_show(self, _changed):
+        self.refresh_if_stale(self.current_tab)
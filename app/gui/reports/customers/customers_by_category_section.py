@@ -4,13 +4,11 @@ CustomersByCategorySection - Desglose por categoria (Mostrador, Comedor, Tienda)
 
 import ttkbootstrap as ttk
 from ttkbootstrap.constants import *
-from sqlalchemy import func
-from app.models import Customer, Order
 
 
 class CustomersByCategorySection:
     @staticmethod
-    def render(tab, db):
+    def render(tab, data):
         section = tab.create_section(
             tab.scrollable_frame,
             "📊 Clientes por Categoria",
@@ -18,22 +16,6 @@ class CustomersByCategorySection:
             bootstyle="info"
         )
 
-        data = db.query(
-            Customer.customer_category,
-            func.count(func.distinct(Customer.id)).label('num_customers'),
-            func.count(Order.id).label('num_orders'),
-            func.coalesce(func.sum(Order.total), 0).label('total')
-        ).join(
-            Order, Customer.id == Order.customer_id
-        ).filter(
-            Customer.active == True,
-            Customer.active2 == True
-        ).group_by(
-            Customer.customer_category
-        ).order_by(
-            func.sum(Order.total).desc()
-        ).all()
-
         if not data:
             tab.create_empty_state(section, "No hay clientes registrados")
             return
@@ -44,8 +26,8 @@ class CustomersByCategorySection:
         colors = {"Mostrador": "#17a2b8", "Comedor": "#28a745", "Tienda": "#ffc107"}
         styles = {"Mostrador": "info", "Comedor": "success", "Tienda": "warning"}
 
-        for i, row in enumerate(data):
-            category = row.customer_category or "Sin Categoria"
+        for i, (category, num_customers, num_orders, total) in enumerate(data):
+            category = category or "Sin Categoria"
             color = colors.get(category, "#6c757d")
             style = styles.get(category, "secondary")
 
@@ -55,6 +37,6 @@ class CustomersByCategorySection:
                 padx = (10, 10) if i < len(data) - 1 else (10, 0)
             card.pack(side=LEFT, fill=BOTH, expand=True, padx=padx)
 
-            ttk.Label(card, text=f"{row.num_customers} clientes", font=("Segoe UI", 12, "bold"), foreground=color).pack(anchor=W)
-            ttk.Label(card, text=f"{row.num_orders} pedidos", font=("Segoe UI", 10)).pack(anchor=W, pady=(5, 0))
-            ttk.Label(card, text=f"${row.total:,.2f}", font=("Segoe UI", 14, "bold"), foreground=color).pack(anchor=W, pady=(5, 0))
+            ttk.Label(card, text=f"{num_customers} clientes", font=("Segoe UI", 12, "bold"), foreground=color).pack(anchor=W)
+            ttk.Label(card, text=f"{num_orders} pedidos", font=("Segoe UI", 10)).pack(anchor=W, pady=(5, 0))
+            ttk.Label(card, text=f"${total:,.2f}", font=("Segoe UI", 14, "bold"), foreground=color).pack(anchor=W, pady=(5, 0))
@@ -3,15 +3,19 @@ CustomersTab - Orquestador de secciones de reportes de clientes
 """
 
 from app.gui.reports.components.report_base import BaseReportTab
+from app.data.report_queries import report_queries
 from .customers_kpi_panel import CustomersKPIPanel
 from .top_customers_section import TopCustomersSection
 from .customers_by_category_section import CustomersByCategorySection
 
 
 class CustomersTab(BaseReportTab):
-    def build_sections(self, db):
-        CustomersKPIPanel.render(self, db)
+    def load_data(self):
+        return report_queries.customers_tab()
+
+    def build_sections(self, data):
+        CustomersKPIPanel.render(self, data["kpis"])
         self.add_separator()
-        TopCustomersSection.render(self, db)
+        TopCustomersSection.render(self, data["top_customers"])
         self.add_separator()
-        CustomersByCategorySection.render(self, db)
+        CustomersByCategorySection.render(self, data["by_category"])
@@ -2,16 +2,12 @@
 OrdersByCustomerSection - Tabla completa de pedidos por cliente
 """
 
-import ttkbootstrap as ttk
 from ttkbootstrap.constants import *
-from ttkbootstrap.tableview import Tableview
-from sqlalchemy import func
-from app.models import Customer, Order
 
 
 class OrdersByCustomerSection:
     @staticmethod
-    def render(tab, db):
+    def render(tab, customer_orders):
         section = tab.create_section(
             tab.scrollable_frame,
             "👤 Pedidos por Cliente",
@@ -19,23 +15,6 @@ class OrdersByCustomerSection:
             bootstyle="info"
         )
 
-        customer_orders = db.query(
-            Customer.id,
-            Customer.customer_name,
-            Customer.customer_category,
-            func.count(Order.id).label('orders'),
-            func.sum(Order.total).label('total')
-        ).join(
-            Order, Customer.id == Order.customer_id
-        ).filter(
-            Customer.active == True,
-            Customer.active2 == True
-        ).group_by(
-            Customer.id, Customer.customer_name, Customer.customer_category
-        ).order_by(
-            func.sum(Order.total).desc()
-        ).all()
-
         if not customer_orders:
             tab.create_empty_state(section, "No hay pedidos registrados de clientes")
             return
@@ -49,26 +28,13 @@ class OrdersByCustomerSection:
         ]
 
         rows = []
-        for i, customer in enumerate(customer_orders):
+        for i, (_, name, category, orders, total) in enumerate(customer_orders):
             rows.append([
                 i + 1,
-                customer.customer_name,
-                customer.customer_category or "N/A",
-                customer.orders,
-                f"${customer.total:,.2f}",
+                name,
+                category or "N/A",
+                orders,
+                total,
             ])
 
-        table_frame = ttk.Frame(section)
-        table_frame.pack(fill=BOTH, expand=YES)
-
-        table = Tableview(
-            master=table_frame,
-            coldata=columns,
-            rowdata=rows,
-            paginated=False,
-            searchable=False,
-            bootstyle=INFO,
-            height=min(len(rows), 15),
-        )
-        table.pack(fill=BOTH, expand=YES)
-        table.view.configure(selectmode="none")
+        tab.create_table(section, columns, rows, money_cols={4}, bootstyle=INFO)
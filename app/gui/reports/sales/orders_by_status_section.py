@@ -4,8 +4,6 @@ OrdersByStatusSection - Resumen de pedidos por estado (pendiente, completado, ca
 
 import ttkbootstrap as ttk
 from ttkbootstrap.constants import *
-from sqlalchemy import func
-from app.models import Order
 
 
 STATUS_CONFIG = {
@@ -17,7 +15,7 @@ STATUS_CONFIG = {
 
 class OrdersByStatusSection:
     @staticmethod
-    def render(tab, db):
+    def render(tab, data):
         section = tab.create_section(
             tab.scrollable_frame,
             "📋 Pedidos por Estado",
@@ -25,12 +23,6 @@ class OrdersByStatusSection:
             bootstyle="primary"
         )
 
-        data = db.query(
-            Order.status,
-            func.count(Order.id).label('count'),
-            func.coalesce(func.sum(Order.total), 0).label('total')
-        ).group_by(Order.status).all()
-
         if not data:
             tab.create_empty_state(section, "No hay pedidos registrados")
             return
@@ -38,12 +30,10 @@ class OrdersByStatusSection:
         cards_frame = ttk.Frame(section)
         cards_frame.pack(fill=X)
 
-        status_map = {row.status: row for row in data}
+        status_map = {status: (count, total) for status, count, total in data}
 
         for i, (status, cfg) in enumerate(STATUS_CONFIG.items()):
-            row = status_map.get(status)
-            count = row.count if row else 0
-            total = row.total if row else 0
+            count, total = status_map.get(status, (0, 0))
 
             card = ttk.Labelframe(cards_frame, text=cfg["label"], padding=15, bootstyle=cfg["bootstyle"])
             padx = (0, 10) if i < len(STATUS_CONFIG) - 1 else (0, 0)
@@ -3,12 +3,16 @@ SalesTab - Orquestador de secciones de reportes de ventas
 """
 
 from app.gui.reports.components.report_base import BaseReportTab
+from app.data.report_queries import report_queries
 from .sales_kpi_panel import SalesKPIPanel
 from .orders_by_status_section import OrdersByStatusSection
 
 
 class SalesTab(BaseReportTab):
-    def build_sections(self, db):
-        SalesKPIPanel.render(self, db)
+    def load_data(self):
+        return report_queries.sales_tab()
+
+    def build_sections(self, data):
+        SalesKPIPanel.render(self, data["kpis"])
         self.add_separator()
-        OrdersByStatusSection.render(self, db)
+        OrdersByStatusSection.render(self, data["orders_by_status"])
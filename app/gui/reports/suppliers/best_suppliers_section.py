@@ -2,16 +2,12 @@
 BestSuppliersSection - Ranking de proveedores por precio promedio (queries corregidas)
 """
 
-import ttkbootstrap as ttk
 from ttkbootstrap.constants import *
-from ttkbootstrap.tableview import Tableview
-from sqlalchemy import func
-from app.models import Supplier, SupplyPurchase
 
 
 class BestSuppliersSection:
     @staticmethod
-    def render(tab, db):
+    def render(tab, suppliers_data):
         section = tab.create_section(
             tab.scrollable_frame,
             "⭐ Mejores Proveedores",
@@ -19,21 +15,6 @@ class BestSuppliersSection:
             bootstyle="success"
         )
 
-        suppliers_data = db.query(
-            Supplier.id,
-            Supplier.supplier_name,
-            Supplier.product_type,
-            func.avg(SupplyPurchase.unit_price).label('avg_price'),
-            func.count(SupplyPurchase.id).label('purchases_count'),
-            func.coalesce(func.sum(SupplyPurchase.total_price), 0).label('total_spent')
-        ).join(
-            SupplyPurchase, Supplier.id == SupplyPurchase.supplier_id
-        ).group_by(
-            Supplier.id, Supplier.supplier_name, Supplier.product_type
-        ).order_by(
-            func.avg(SupplyPurchase.unit_price).asc()
-        ).all()
-
         if not suppliers_data:
             tab.create_empty_state(section, "No hay proveedores con compras registradas")
             return
@@ -48,28 +29,15 @@ class BestSuppliersSection:
         ]
 
         rows = []
-        for i, s in enumerate(suppliers_data):
+        for i, (_, supplier_name, product_type, avg_price, purchases_count, total_spent) in enumerate(suppliers_data):
             badge = " (Mas Economico)" if i == 0 else ""
             rows.append([
                 i + 1,
-                f"{s.supplier_name}{badge}",
-                s.product_type or "N/A",
-                f"${s.avg_price:,.2f}",
-                s.purchases_count,
-                f"${s.total_spent:,.2f}",
+                f"{supplier_name}{badge}",
+                product_type or "N/A",
+                avg_price,
+                purchases_count,
+                total_spent,
             ])
 
-        table_frame = ttk.Frame(section)
-        table_frame.pack(fill=BOTH, expand=YES)
-
-        table = Tableview(
-            master=table_frame,
-            coldata=columns,
-            rowdata=rows,
-            paginated=False,
-            searchable=False,
-            bootstyle=SUCCESS,
-            height=min(len(rows), 15),
-        )
-        table.pack(fill=BOTH, expand=YES)
-        table.view.configure(selectmode="none")
+        tab.create_table(section, columns, rows, money_cols={3, 5}, bootstyle=SUCCESS)
@@ -2,16 +2,12 @@
 SuppliersByDemandSection - Ranking por demanda + cards comparativos
 """
 
-import ttkbootstrap as ttk
 from ttkbootstrap.constants import *
-from ttkbootstrap.tableview import Tableview
-from sqlalchemy import func
-from app.models import Supplier, SupplyPurchase
 
 
 class SuppliersByDemandSection:
     @staticmethod
-    def render(tab, db):
+    def render(tab, suppliers_demand):
         section = tab.create_section(
             tab.scrollable_frame,
             "📊 Proveedores por Demanda",
@@ -19,19 +15,6 @@ class SuppliersByDemandSection:
             bootstyle="success"
         )
 
-        suppliers_demand = db.query(
-            Supplier.supplier_name,
-            Supplier.product_type,
-            func.count(SupplyPurchase.id).label('purchases'),
-            func.coalesce(func.sum(SupplyPurchase.total_price), 0).label('total_purchased')
-        ).join(
-            SupplyPurchase, Supplier.id == SupplyPurchase.supplier_id
-        ).group_by(
-            Supplier.id, Supplier.supplier_name, Supplier.product_type
-        ).order_by(
-            func.count(SupplyPurchase.id).desc()
-        ).all()
-
         if not suppliers_demand:
             tab.create_empty_state(section, "No hay datos de proveedores")
             return
@@ -45,46 +28,33 @@ class SuppliersByDemandSection:
         ]
 
         rows = []
-        for i, s in enumerate(suppliers_demand):
+        for i, (_, supplier_name, product_type, _, purchases, total_purchased) in enumerate(suppliers_demand):
             rows.append([
                 i + 1,
-                s.supplier_name,
-                s.product_type or "N/A",
-                s.purchases,
-                f"${s.total_purchased:,.2f}",
+                supplier_name,
+                product_type or "N/A",
+                purchases,
+                total_purchased,
             ])
 
-        table_frame = ttk.Frame(section)
-        table_frame.pack(fill=BOTH, expand=YES)
-
-        table = Tableview(
-            master=table_frame,
-            coldata=columns,
-            rowdata=rows,
-            paginated=False,
-            searchable=False,
-            bootstyle=SUCCESS,
-            height=min(len(rows), 15),
-        )
-        table.pack(fill=BOTH, expand=YES)
-        table.view.configure(selectmode="none")
+        tab.create_table(section, columns, rows, money_cols={4}, bootstyle=SUCCESS)
 
         # Highlight cards
-        most = suppliers_demand[0]
+        _, supplier_name, _, _, purchases, total_purchased = suppliers_demand[0]
         best = {
             "title": "✅ Proveedor Mas Solicitado",
-            "name": most.supplier_name,
-            "details": [("Compras", str(most.purchases)), ("Total", f"${most.total_purchased:,.2f}")],
+            "name": supplier_name,
+            "details": [("Compras", str(purchases)), ("Total", f"${total_purchased:,.2f}")],
             "color": "#28a745"
         }
 
         worst = None
         if len(suppliers_demand) > 1:
-            least = suppliers_demand[-1]
+            _, supplier_name, _, _, purchases, total_purchased = suppliers_demand[-1]
             worst = {
                 "title": "⚠️ Proveedor Menos Solicitado",
-                "name": least.supplier_name,
-                "details": [("Compras", str(least.purchases)), ("Total", f"${least.total_purchased:,.2f}")],
+                "name": supplier_name,
+                "details": [("Compras", str(purchases)), ("Total", f"${total_purchased:,.2f}")],
                 "color": "#dc3545"
             }
 
@@ -3,15 +3,19 @@ SuppliersTab - Orquestador de secciones de reportes de proveedores
 """
 
 from app.gui.reports.components.report_base import BaseReportTab
+from app.data.report_queries import report_queries
 from .suppliers_kpi_panel import SuppliersKPIPanel
 from .best_suppliers_section import BestSuppliersSection
 from .suppliers_by_demand_section import SuppliersByDemandSection
 
 
 class SuppliersTab(BaseReportTab):
-    def build_sections(self, db):
-        SuppliersKPIPanel.render(self, db)
+    def load_data(self):
+        return report_queries.suppliers_tab()
+
+    def build_sections(self, data):
+        SuppliersKPIPanel.render(self, data["kpis"])
         self.add_separator()
-        BestSuppliersSection.render(self, db)
+        BestSuppliersSection.render(self, data["best_suppliers"])
         self.add_separator()
-        SuppliersByDemandSection.render(self, db)
+        SuppliersByDemandSection.render(self, data["by_demand"])
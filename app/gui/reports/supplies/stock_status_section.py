@@ -3,15 +3,12 @@ StockStatusSection - Niveles de stock actual por insumo
 Stock = ultima_compra.remaining + ultima_compra.quantity
 """
 
-import ttkbootstrap as ttk
 from ttkbootstrap.constants import *
-from ttkbootstrap.tableview import Tableview
-from app.models import Supply, SupplyPurchase, Supplier
 
 
 class StockStatusSection:
     @staticmethod
-    def render(tab, db):
+    def render(tab, supplies):
         section = tab.create_section(
             tab.scrollable_frame,
             "📦 Estado de Stock",
@@ -19,8 +16,6 @@ class StockStatusSection:
             bootstyle="warning"
         )
 
-        supplies = db.query(Supply).all()
-
         if not supplies:
             tab.create_empty_state(section, "No hay insumos registrados")
             return
@@ -28,21 +23,14 @@ class StockStatusSection:
         columns = [
             {"text": "Insumo", "stretch": True},
             {"text": "Proveedor", "stretch": True},
-            {"text": "Stock Actual", "stretch": False, "width": 120},
+            {"text": "Stock Actual", "stretch": False, "width": 120, "format": "{:.2f}"},
             {"text": "Unidad", "stretch": False, "width": 90},
             {"text": "Ultima Compra", "stretch": False, "width": 130},
         ]
 
         rows = []
-        for supply in supplies:
-            last_purchase = db.query(SupplyPurchase).filter(
-                SupplyPurchase.supply_id == supply.id
-            ).order_by(SupplyPurchase.purchase_date.desc()).first()
-
-            if last_purchase:
-                current_stock = last_purchase.remaining + last_purchase.quantity
-                unit = last_purchase.unit
-                d = last_purchase.purchase_date
+        for supply_name, supplier_name, current_stock, unit, d in supplies:
+            if d is not None:
                 last_date = d.strftime("%Y-%m-%d") if hasattr(d, 'strftime') else str(d)
             else:
                 current_stock = 0
@@ -50,24 +38,11 @@ class StockStatusSection:
                 last_date = "Sin compras"
 
             rows.append([
-                supply.supply_name,
-                supply.supplier.supplier_name if supply.supplier else "N/A",
-                f"{current_stock:.2f}",
+                supply_name,
+                supplier_name or "N/A",
+                current_stock,
                 unit,
                 last_date,
             ])
 
-        table_frame = ttk.Frame(section)
-        table_frame.pack(fill=BOTH, expand=YES)
-
-        table = Tableview(
-            master=table_frame,
-            coldata=columns,
-            rowdata=rows,
-            paginated=False,
-            searchable=False,
-            bootstyle=WARNING,
-            height=min(len(rows), 15),
-        )
-        table.pack(fill=BOTH, expand=YES)
-        table.view.configure(selectmode="none")
+        tab.create_table(section, columns, rows, bootstyle=WARNING)
@@ -3,15 +3,19 @@ SuppliesTab - Orquestador de secciones de reportes de insumos
 """
 
 from app.gui.reports.components.report_base import BaseReportTab
+from app.data.report_queries import report_queries
 from .supplies_kpi_panel import SuppliesKPIPanel
 from .stock_status_section import StockStatusSection
 from .top_supplies_section import TopSuppliesSection
 
 
 class SuppliesTab(BaseReportTab):
-    def build_sections(self, db):
-        SuppliesKPIPanel.render(self, db)
+    def load_data(self):
+        return report_queries.supplies_tab()
+
+    def build_sections(self, data):
+        SuppliesKPIPanel.render(self, data["kpis"])
         self.add_separator()
-        StockStatusSection.render(self, db)
+        StockStatusSection.render(self, data["stock"])
         self.add_separator()
-        TopSuppliesSection.render(self, db)
+        TopSuppliesSection.render(self, data["top_supplies"])
@@ -2,7 +2,6 @@ import ttkbootstrap as ttk
 import tkinter.messagebox as mb
 from ttkbootstrap.constants import *
 from app.data.providers.orders import order_provider
-from app.data.providers.refunds import refund_provider
 from app.gui.sales.admin_sales.orders.refund_dialog import RefundDialog
 from app.gui.sales.admin_sales.orders.payment_dialog import PaymentDialog, PaymentRegisterDialog
 from app.constants import (
@@ -12,10 +11,10 @@ from app.constants import (
 
 
 class DetailOrder(ttk.Labelframe):
-    def __init__(self, parent, customers_cache, on_order_changed):
+    def __init__(self, parent, customers_cache):
         super().__init__(parent, text="  Detalles del Pedido  ", padding=10, width=350)
         self.customers_cache = customers_cache
-        self.on_order_changed = on_order_changed
+        self.order_id = None
 
         self.setup_ui()
 
@@ -36,11 +35,12 @@ class DetailOrder(ttk.Labelframe):
 
     def show_order_details(self, order):
         order_id = order if isinstance(order, int) else order.id
+        self.order_id = order_id
 
         for widget in self.detail_content.winfo_children():
             widget.destroy()
 
-        order_data = order_provider.get_by_id(order_id)
+        order_data = order_provider.get_detail(order_id)
 
         if not order_data:
             ttk.Label(
@@ -60,7 +60,7 @@ class DetailOrder(ttk.Labelframe):
         self._render_total(order_data['total'])
 
         if order_data['status'] == ORDER_STATUSES_COMPLETE:
-            self._show_refunds_section(order_data['id'])
+            self._show_refunds_section(order_data['refunds'])
 
         is_fully_done = (
             order_data['status'] == ORDER_STATUSES_COMPLETE
@@ -235,9 +235,7 @@ class DetailOrder(ttk.Labelframe):
                 bootstyle="danger-outline"
             ).pack(fill=X, pady=2)
 
-    def _show_refunds_section(self, order_id):
-        refunds = refund_provider.get_by_order(order_id)
-
+    def _show_refunds_section(self, refunds):
         refunds_with_return = [r for r in refunds if r['quantity'] > 0]
 
         if not refunds_with_return:
@@ -292,9 +290,8 @@ class DetailOrder(ttk.Labelframe):
         success, result = order_provider.register_payment(order_data['id'], dialog.result)
 
         if success:
+            # La tarjeta y este panel se repintan con el aviso del change_bus
             mb.showinfo("Éxito", f"Pago de ${dialog.result:.2f} registrado")
-            self.on_order_changed()
-            self.show_order_details(order_data['id'])
         else:
             mb.showerror("Error", f"Error al registrar pago: {result}")
 
@@ -324,7 +321,6 @@ class DetailOrder(ttk.Labelframe):
 
         if success:
             mb.showinfo("Éxito", f"Pedido #{order_data['id']} completado")
-            self.on_order_changed()
             self.reset_panel()
         else:
             mb.showerror("Error", f"Error al completar: {result}")
@@ -337,12 +333,13 @@ class DetailOrder(ttk.Labelframe):
 
         if success:
             mb.showinfo("Éxito", f"Pedido #{order_id} actualizado")
-            self.on_order_changed()
             self.reset_panel()
         else:
             mb.showerror("Error", f"Error al actualizar: {result}")
 
     def reset_panel(self):
+        self.order_id = None
+
         for widget in self.detail_content.winfo_children():
             widget.destroy()
 
@@ -3,7 +3,7 @@ from ttkbootstrap.constants import *
 from app.constants import ORDER_STATUSES_ALL, PAYMENT_STATUS_ALL
 from app.data.providers.orders import order_provider
 from app.data.providers.customers import customer_provider
-from app.services.firestore_listener import firestore_listener
+from app.services.change_bus import change_bus, OP_INSERT
 from app.gui.sales.admin_sales.orders.orders_header_with_filters import OrdersHeaderWithFilters
 from app.gui.sales.admin_sales.orders.orders_list import OrdersList
 from app.gui.sales.admin_sales.orders.detail_order import DetailOrder
@@ -20,8 +20,8 @@ class OrderContent(ttk.Frame):
         self.setup_ui()
         self.load_orders()
 
-        # when the order change from the apk load all orders again ( refresh )
-        firestore_listener.on_order_changed = self.load_orders
+        # Cambios propios, de otras vistas o de la app móvil: solo se repinta lo afectado
+        change_bus.subscribe(self, ("orders", "customers"), self.on_tables_changed)
 
     def setup_ui(self):
 
@@ -43,15 +43,15 @@ class OrderContent(ttk.Frame):
             customers_cache=self.customers_cache,
             on_select=self.on_order_select,
             on_page_change=self.display_current_page,
-            pagesize=10
+            pagesize=10,
+            keyset=True
         )
         self.orders_list.pack(side=LEFT, fill=BOTH, expand=YES, padx=(0, 10))
 
         # Detalle del pedido
         self.detail_order = DetailOrder(
             main_container,
-            customers_cache=self.customers_cache,
-            on_order_changed=self.load_orders
+            customers_cache=self.customers_cache
         )
         self.detail_order.pack(side=LEFT, fill=Y)
 
@@ -83,15 +83,59 @@ class OrderContent(ttk.Frame):
             filters += order_provider.build_customer_filter(customer_filter)
 
         self._filters = filters or None
-        self.orders_list.pagination.reset()
-        self.orders_list.pagination.update_total(order_provider.get_count(self._filters))
-        self.display_current_page()
-
-    def display_current_page(self):
-        pagination = self.orders_list.pagination
-        offset = pagination.get_offset()
-        orders = order_provider.get_all(offset, pagination._pagesize, self._filters)
-        self.orders_list.display_orders(orders)
+        order_provider.get_count_async(self, self.orders_list.pagination.update_total, self._filters)
+        self.orders_list.pagination.goto_first_page()
+
+    def display_current_page(self, limit, cursor):
+        order_provider.get_page_async(
+            self, self.on_page_loaded,
+            limit, self._filters, **cursor
+        )
+
+    def on_page_loaded(self, page):
+        self.orders_list.pagination.set_page(page)
+        self.orders_list.display_orders(page.rows)
+
+    def on_tables_changed(self, events):
+        changed_ids = set()
+        new_orders = False
+        customers_changed = False
+
+        for change in events:
+            if change.table == "customers":
+                customers_changed = True
+            elif change.op == OP_INSERT:
+                new_orders = True
+            else:
+                changed_ids |= change.pks
+
+        if customers_changed:
+            self.load_customers_cache()
+            self.header.load_customers()
+
+        if new_orders or customers_changed:
+            # Un pedido nuevo puede entrar en la página: recontar y recargar solo esta página
+            order_provider.get_count_async(self, self.orders_list.pagination.update_total, self._filters)
+            self.orders_list.pagination.reload_page()
+        else:
+            visible = [order_id for order_id in changed_ids if self.orders_list.has_order(order_id)]
+            if visible:
+                order_provider.get_by_ids_async(
+                    self, lambda rows: self.on_orders_patched(visible, rows),
+                    visible, self._filters
+                )
+
+        if self.detail_order.order_id in changed_ids:
+            self.detail_order.show_order_details(self.detail_order.order_id)
+
+    def on_orders_patched(self, requested_ids, rows):
+        for order in rows:
+            self.orders_list.update_order(order)
+
+        if len(rows) < len(requested_ids):
+            # Alguno ya no cumple los filtros (ej: pasó a completado): la página cambia
+            order_provider.get_count_async(self, self.orders_list.pagination.update_total, self._filters)
+            self.orders_list.pagination.reload_page()
 
     def on_order_select(self, order):
         self.detail_order.show_order_details(order)
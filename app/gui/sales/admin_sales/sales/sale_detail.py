@@ -89,7 +89,7 @@ class SaleDetail(ttk.Labelframe):
 
     def show_sale(self, sale_id):
 
-        sale_data = sale_provider.get_by_id(sale_id)
+        sale_data = sale_provider.get_detail(sale_id)
 
         if not sale_data:
             return
@@ -100,6 +100,7 @@ class SalesList(ttk.Frame):
             fetch_page=self._fetch_sales_page,
             count_rows=lambda: sale_provider.get_count(self._filters),
             pagesize=40,
+            keyset=True,
             bootstyle=PRIMARY,
         )
 
@@ -111,13 +112,13 @@ class SalesList(ttk.Frame):
         self.detail_panel = SaleDetail(parent)
         self.detail_panel.pack(side=RIGHT, fill=BOTH)
 
-    def _fetch_sales_page(self, offset, limit):
-        sales = sale_provider.get_all(offset, limit, self._filters)
+    def _fetch_sales_page(self, limit, **cursor):
+        page = sale_provider.get_page(limit, self._filters, **cursor)
         rows = []
-        for sale in sales:
+        for sale in page.rows:
             date_str = sale.date.strftime("%d/%m/%Y %H:%M") if sale.date else "N/A"
             rows.append([sale.id, date_str, f"${sale.total:.2f}"])
-        return rows
+        return page._replace(rows=rows)
 
     def on_sale_select(self, _event):
 
@@ -2,9 +2,13 @@ import ttkbootstrap as ttk
 from ttkbootstrap.constants import *
 from app.gui.sales.admin_sales.sales.sales_list import SalesList
 from app.gui.sales.admin_sales.orders.order_content import OrderContent
+from app.gui.view_manager import LazyTabs
 
 
 class SalesAdminContent(ttk.Frame):
+    # Mientras está oculta, solo la lista de ventas queda vieja (pedidos se actualiza por el change_bus)
+    REFRESH_ON = ("sales",)
+
     def __init__(self, parent, app):
         super().__init__(parent)
         self.app = app
@@ -15,6 +19,7 @@ class SalesAdminContent(ttk.Frame):
         # Crear Notebook (tabs)
         self.notebook = ttk.Notebook(self, bootstyle="primary")
         self.notebook.pack(fill=BOTH, expand=YES, padx=10, pady=10)
+        self.lazy_tabs = LazyTabs(self.notebook, "sales_admin")
 
         # Tab 1: Ver Ventas
         self.tab_ventas = ttk.Frame(self.notebook)
@@ -23,8 +28,7 @@ class SalesAdminContent(ttk.Frame):
 
         # Tab 2: Ver Pedidos
         self.tab_pedidos = ttk.Frame(self.notebook)
-        self.notebook.add(self.tab_pedidos, text="  📄 Ver Pedidos  ")
-        self.setup_pedidos_tab()
+        self.lazy_tabs.add(self.tab_pedidos, "  📄 Ver Pedidos  ", self.setup_pedidos_tab)
 
     def setup_ventas_tab(self):
         self.sales_list = SalesList(self.tab_ventas, self.app, self)
@@ -33,3 +37,11 @@ class SalesAdminContent(ttk.Frame):
     def setup_pedidos_tab(self):
         self.orders_list = OrderContent(self.tab_pedidos, self.app, self)
         self.orders_list.pack(fill=BOTH, expand=YES)
+
+    def show_orders_tab(self):
+        self.lazy_tabs.select(self.tab_pedidos)
+        return self.orders_list
+
+    def on_show(self, changed):
+        if "sales" in changed:
+            self.sales_list.load_sales()
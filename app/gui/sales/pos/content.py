@@ -3,8 +3,12 @@ import tkinter.messagebox as mb
 from ttkbootstrap.constants import *
 from app.gui.sales.pos.sales.sale_tab import SaleTab
 from app.gui.sales.pos.orders.order_tab import OrderTab
+from app.gui.view_manager import LazyTabs
 
 class SalesContent(ttk.Frame):
+    # Catálogo que muestran las ventas y el pedido; los carritos se conservan al navegar
+    REFRESH_ON = ("products", "customers", "customer_product_prices")
+
     def __init__(self, parent, app):
         super().__init__(parent)
         self.app = app
@@ -22,6 +26,7 @@ class SalesContent(ttk.Frame):
         # Create main Notebook (tabs)
         self.notebook = ttk.Notebook(self, bootstyle="primary")
         self.notebook.pack(fill=BOTH, expand=YES, padx=10, pady=10)
+        self.lazy_tabs = LazyTabs(self.notebook, "sales")
 
         # Tab 1: Make Sale (with dynamic sub-tabs)
         self.tab_venta = ttk.Frame(self.notebook)
@@ -30,8 +35,7 @@ class SalesContent(ttk.Frame):
 
         # Tab 2: Place an Order
         self.tab_pedido = ttk.Frame(self.notebook)
-        self.notebook.add(self.tab_pedido, text="  📋 Hacer Pedido  ")
-        self.setup_order_tab()
+        self.lazy_tabs.add(self.tab_pedido, "  📋 Hacer Pedido  ", self.setup_order_tab)
 
 
     def setup_sale_tab(self):
@@ -246,3 +250,12 @@ class SalesContent(ttk.Frame):
         self.order_tab = OrderTab(self.tab_pedido, self.app, self)
         self.order_tab.pack(fill=BOTH, expand=YES)
 
+    def on_show(self, changed):
+        if "products" in changed:
+            for sale_tab in self.sale_tabs.values():
+                sale_tab.get_products()
+                sale_tab.products.show_products()
+
+        if changed and self.lazy_tabs.built(self.tab_pedido):
+            self.order_tab.reload_data()
+
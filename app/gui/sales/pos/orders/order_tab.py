@@ -51,6 +51,12 @@ class OrderTab(ttk.Frame):
         self.customers_panel.load(customers)
         self.products_panel.load(products)
 
+    def reload_data(self):
+        """Recarga el catálogo sin perder el cliente elegido"""
+        self.load_data()
+        if self.selected_customer:
+            self.select_customer(self.selected_customer)
+
     def select_customer(self, customer):
         self.selected_customer = customer
         self.customers_panel.set_selected(customer)
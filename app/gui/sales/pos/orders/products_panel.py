@@ -1,6 +1,91 @@
 import ttkbootstrap as ttk
 from ttkbootstrap.constants import *
 from app.data.providers.customer_prices import customer_price_provider
+from app.gui.components.virtual_list import VirtualList
+
+
+class ProductCard(ttk.Frame):
+    """Tarjeta reutilizable de VirtualList; precio, cantidad y edición viven en el panel por producto"""
+
+    HEIGHT = 108
+
+    def __init__(self, parent, panel):
+        super().__init__(parent, bootstyle="light", relief="solid", borderwidth=1)
+        self.panel = panel
+        self.product = None
+
+        content = ttk.Frame(self)
+        content.pack(fill=X, padx=15, pady=12)
+
+        # Top row: name and base price
+        top_row = ttk.Frame(content)
+        top_row.pack(fill=X)
+
+        self.name_label = ttk.Label(top_row, font=("Arial", 13, "bold"))
+        self.name_label.pack(side=LEFT)
+
+        self.base_price_label = ttk.Label(top_row, font=("Arial", 10), bootstyle="secondary")
+        self.base_price_label.pack(side=RIGHT)
+
+        # Bottom row: controls
+        controls_row = ttk.Frame(content)
+        controls_row.pack(fill=X, pady=(10, 0))
+
+        price_frame = ttk.Frame(controls_row)
+        price_frame.pack(side=LEFT)
+
+        ttk.Label(price_frame, text="Precio: $").pack(side=LEFT)
+
+        self.price_entry = ttk.Entry(price_frame, width=8, font=("Arial", 11), state="readonly")
+        self.price_entry.pack(side=LEFT)
+
+        # Edit/Save price button
+        self.edit_btn = ttk.Button(
+            price_frame,
+            text="✏️",
+            width=3,
+            bootstyle="secondary-outline",
+            command=lambda: self.panel._toggle_edit(self.product[0])
+        )
+        self.edit_btn.pack(side=LEFT, padx=(5, 0))
+
+        qty_frame = ttk.Frame(controls_row)
+        qty_frame.pack(side=LEFT, padx=(20, 0))
+
+        ttk.Label(qty_frame, text="Cantidad:").pack(side=LEFT)
+
+        self.qty_entry = ttk.Entry(qty_frame, width=5, font=("Arial", 11))
+        self.qty_entry.pack(side=LEFT, padx=(5, 0))
+
+        ttk.Button(
+            controls_row,
+            text="+ Agregar",
+            command=self._add,
+            bootstyle="success-outline"
+        ).pack(side=RIGHT)
+
+    def show(self, product):
+        self.product = product
+        product_id, icon, name, default_price = product
+        state = self.panel.product_state(product_id, default_price)
+
+        self.name_label.configure(text=f"{icon or '🍴'} {name}")
+        self.base_price_label.configure(text=f"Precio base: ${default_price:.2f}")
+
+        self.price_entry.configure(
+            textvariable=state['price_var'],
+            state="normal" if state['editing'] else "readonly"
+        )
+        self.edit_btn.configure(
+            text="✅" if state['editing'] else "✏️",
+            bootstyle="success" if state['editing'] else "secondary-outline"
+        )
+        self.qty_entry.configure(textvariable=state['qty_var'])
+
+    def _add(self):
+        product_id, _, name, default_price = self.product
+        state = self.panel.product_state(product_id, default_price)
+        self.panel.on_product_added(product_id, name, state['price_var'], state['qty_var'])
 
 
 class ProductsPanel(ttk.Labelframe):
@@ -9,7 +94,7 @@ class ProductsPanel(ttk.Labelframe):
         super().__init__(parent, text="  Productos - Seleccione un cliente  ", padding=10)
         self.on_product_added = on_product_added
         self.products_list = []
-        self.product_widgets = {}
+        self.product_states = {}
         self.customer_id = None
         self.custom_prices = {}
 
@@ -26,35 +111,15 @@ class ProductsPanel(ttk.Labelframe):
         )
         self.no_customer_label.pack(expand=YES)
 
-        # Product frame (initially hidden)
+        # Product frame (initially hidden); solo se crean las tarjetas visibles
         self.content_frame = ttk.Frame(self)
 
-        # Canvas for products with scroll
-        canvas_frame = ttk.Frame(self.content_frame)
-        canvas_frame.pack(fill=BOTH, expand=YES)
-
-        self.canvas = ttk.Canvas(canvas_frame, highlightthickness=0)
-        self.scrollbar = ttk.Scrollbar(canvas_frame, orient=VERTICAL, command=self.canvas.yview)
-
-        self.inner_frame = ttk.Frame(self.canvas)
-        self.canvas_window = self.canvas.create_window((0, 0), window=self.inner_frame, anchor="nw")
-
-        self.canvas.configure(yscrollcommand=self.scrollbar.set)
-
-        self.inner_frame.bind(
-            "<Configure>",
-            lambda e: self.canvas.configure(scrollregion=self.canvas.bbox("all"))
-        )
-        self.canvas.bind(
-            "<Configure>",
-            lambda e: self.canvas.itemconfig(self.canvas_window, width=e.width)
+        self.products_view = VirtualList(
+            self.content_frame,
+            row_factory=lambda parent: ProductCard(parent, self),
+            row_height=ProductCard.HEIGHT
         )
-
-        self.canvas.bind("<Enter>", lambda e: self._bind_mousewheel())
-        self.canvas.bind("<Leave>", lambda e: self._unbind_mousewheel())
-
-        self.canvas.pack(side=LEFT, fill=BOTH, expand=YES)
-        self.scrollbar.pack(side=RIGHT, fill=Y)
+        self.products_view.pack(fill=BOTH, expand=YES)
 
     def load(self, products):
         self.products_list = products
@@ -75,98 +140,36 @@ class ProductsPanel(ttk.Labelframe):
         self.no_customer_label.pack(expand=YES)
 
     def _display_products(self):
-        for widget in self.inner_frame.winfo_children():
-            widget.destroy()
-
-        self.product_widgets = {}
-
-        for product_id, icon, name, default_price in self.products_list:
-            self._create_card(product_id, icon, name, default_price)
-
-    def _create_card(self, product_id, icon, name, default_price):
-        custom_price = self.custom_prices.get(product_id)
-        display_price = custom_price if custom_price is not None else default_price
-
-        card = ttk.Frame(self.inner_frame, bootstyle="light", relief="solid", borderwidth=1)
-        card.pack(fill=X, pady=4, padx=2)
-
-        content = ttk.Frame(card)
-        content.pack(fill=X, padx=15, pady=12)
-
-        # Top row: name and base price
-        top_row = ttk.Frame(content)
-        top_row.pack(fill=X)
-
-        ttk.Label(
-            top_row, text=f"{icon or '🍴'} {name}", font=("Arial", 13, "bold")
-        ).pack(side=LEFT)
-
-        ttk.Label(
-            top_row, text=f"Precio base: ${default_price:.2f}",
-            font=("Arial", 10), bootstyle="secondary"
-        ).pack(side=RIGHT)
-
-        # Bottom row: controls
-        controls_row = ttk.Frame(content)
-        controls_row.pack(fill=X, pady=(10, 0))
-
-        price_frame = ttk.Frame(controls_row)
-        price_frame.pack(side=LEFT)
-
-        ttk.Label(price_frame, text="Precio: $").pack(side=LEFT)
-
-        price_var = ttk.StringVar(value=str(display_price))
-        price_entry = ttk.Entry(price_frame, textvariable=price_var, width=8, font=("Arial", 11), state="readonly")
-        price_entry.pack(side=LEFT)
-
-        # Edit/Save price button
-        edit_btn = ttk.Button(
-            price_frame,
-            text="✏️",
-            width=3,
-            bootstyle="secondary-outline",
-            command=lambda: self._toggle_edit(product_id)
-        )
-        edit_btn.pack(side=LEFT, padx=(5, 0))
-
-        qty_frame = ttk.Frame(controls_row)
-        qty_frame.pack(side=LEFT, padx=(20, 0))
-
-        ttk.Label(qty_frame, text="Cantidad:").pack(side=LEFT)
-
-        qty_var = ttk.StringVar(value="1")
-        ttk.Entry(qty_frame, textvariable=qty_var, width=5, font=("Arial", 11)).pack(side=LEFT, padx=(5, 0))
-
-        ttk.Button(
-            controls_row,
-            text="+ Agregar",
-            command=lambda: self.on_product_added(product_id, name, price_var, qty_var),
-            bootstyle="success-outline"
-        ).pack(side=RIGHT)
-
-        self.product_widgets[product_id] = {
-            'price_var': price_var,
-            'qty_var': qty_var,
-            'default_price': default_price,
-            'price_entry': price_entry,
-            'edit_btn': edit_btn,
-            'editing': False
-        }
+        self.product_states = {}
+        self.products_view.set_items(self.products_list)
+
+    def product_state(self, product_id, default_price):
+        """Precio, cantidad y modo edición de cada producto (sobreviven al reciclar tarjetas)"""
+        state = self.product_states.get(product_id)
+        if state is None:
+            custom_price = self.custom_prices.get(product_id)
+            display_price = custom_price if custom_price is not None else default_price
+            state = {
+                'price_var': ttk.StringVar(value=str(display_price)),
+                'qty_var': ttk.StringVar(value="1"),
+                'default_price': default_price,
+                'editing': False
+            }
+            self.product_states[product_id] = state
+        return state
 
     def _toggle_edit(self, product_id):
-        widget = self.product_widgets.get(product_id)
-        if not widget:
+        state = self.product_states.get(product_id)
+        if not state:
             return
 
-        if not widget['editing']:
+        if not state['editing']:
             # Enter edit mode
-            widget['price_entry'].configure(state="normal")
-            widget['edit_btn'].configure(text="✅", bootstyle="success")
-            widget['editing'] = True
+            state['editing'] = True
         else:
             # Save and exit edit mode
             try:
-                new_price = float(widget['price_var'].get())
+                new_price = float(state['price_var'].get())
                 if new_price > 0 and self.customer_id:
                     customer_price_provider.save_price(
                         self.customer_id, product_id, new_price
@@ -175,25 +178,9 @@ class ProductsPanel(ttk.Labelframe):
             except ValueError:
                 # Restore previous price on invalid input
                 custom = self.custom_prices.get(product_id)
-                restore_price = custom if custom is not None else widget['default_price']
-                widget['price_var'].set(str(restore_price))
-
-            widget['price_entry'].configure(state="readonly")
-            widget['edit_btn'].configure(text="✏️", bootstyle="secondary-outline")
-            widget['editing'] = False
-
-    def _on_mousewheel(self, event):
-        if event.num == 4 or event.delta > 0:
-            self.canvas.yview_scroll(-1, "units")
-        elif event.num == 5 or event.delta < 0:
-            self.canvas.yview_scroll(1, "units")
-
-    def _bind_mousewheel(self):
-        self.canvas.bind_all("<MouseWheel>", self._on_mousewheel)
-        self.canvas.bind_all("<Button-4>", self._on_mousewheel)
-        self.canvas.bind_all("<Button-5>", self._on_mousewheel)
-
-    def _unbind_mousewheel(self):
-        self.canvas.unbind_all("<MouseWheel>")
-        self.canvas.unbind_all("<Button-4>")
-        self.canvas.unbind_all("<Button-5>")
+                restore_price = custom if custom is not None else state['default_price']
+                state['price_var'].set(str(restore_price))
+
+            state['editing'] = False
+
+        self.products_view.refresh()
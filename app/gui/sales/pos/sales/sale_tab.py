@@ -5,6 +5,10 @@ from app.gui.sales.pos.sales.products import Products
 from app.gui.sales.pos.sales.shopping_car import ShoppingCar
 from app.data.providers.inventory import inventory_provider
 from app.data.providers.sales import sale_provider
+from app.services.sale_queue import sale_queue
+from app.services.task_runner import task_runner
+from app.gui.components.toast import Toast
+from app.constants import SALES_CHECKOUT_QUEUE
 
 
 class SaleTab(ttk.Frame):
@@ -112,6 +116,10 @@ class SaleTab(ttk.Frame):
             mb.showerror("Error", "No se pudo obtener el cliente Mostrador. Por favor, verifique que exista en la base de datos.")
             return
 
+        if SALES_CHECKOUT_QUEUE:
+            self.charge_queued(customer_id)
+            return
+
         success, result = self.sales_provider.save(self.shopping_cart, self.total, customer_id)
 
         if success:
@@ -126,6 +134,26 @@ class SaleTab(ttk.Frame):
         else:
             mb.showerror("Error", f"Error al guardar venta:\n{result}")
 
+    def charge_queued(self, customer_id):
+        """Modo cola: la pestaña se libera al instante y el folio llega como aviso"""
+
+        total = self.total
+        future = sale_queue.submit(self.shopping_cart, total, customer_id)
+        root = self.app.root
+
+        def notify(done):
+            error = done.exception()
+            if error is not None:
+                mb.showerror("Error", f"Error al guardar venta de ${total:.2f}:\n{error}")
+            else:
+                Toast(root, f"Venta #{done.result()} registrada\nTotal: ${total:.2f}")
+
+        # Ya resuelto cuando se llama: solo lleva el aviso al hilo de Tkinter
+        future.add_done_callback(lambda done: task_runner.post(notify, done))
+
+        self.clean_shopping_car()
+        self.tab_manager.close_sale_tab(self)
+
     # Products methods
     def get_products(self):
         self.products_items = self.inventory_provider.get_all()
@@ -10,6 +10,8 @@ class ShoppingCar(ttk.Frame):
         super().__init__(parent, width=350)
         self.app = app
         self.content = content
+        self.lines = {}
+        self._totals_after = None
 
         self.setup_ui()
     
@@ -162,26 +164,51 @@ class ShoppingCar(ttk.Frame):
 
 
     def refresh_shopping_car(self):
+        """
+        Sincroniza los renglones con content.shopping_cart sin reconstruir:
+        cada producto tiene su renglón (llave = id) y solo se tocan las
+        etiquetas que cambiaron; el total y el contador se recalculan una
+        vez por ciclo del event loop.
+        """
+        cart = self.content.shopping_cart
+        cart_ids = {item['id'] for item in cart}
+
+        for product_id in [pid for pid in self.lines if pid not in cart_ids]:
+            self.lines.pop(product_id)['frame'].destroy()
+
+        previous = None
+        for index, item in enumerate(cart):
+            line = self.lines.get(item['id'])
+            if line is None:
+                line = self.create_shopping_car_item(item, after=previous)
+                self.lines[item['id']] = line
+            else:
+                self._update_line(line, item)
+
+            # First item has no top padding, rest have 5px top padding
+            pady = (0, 5) if index == 0 else 5
+            if line['pady'] != pady:
+                line['frame'].pack_configure(pady=pady)
+                line['pady'] = pady
+
+            previous = line['frame']
+
+        if cart:
+            self.lbl_vacio.pack_forget()
+        else:
+            self.lbl_vacio.pack(pady=(0, 10))
+
+        if self._totals_after is None:
+            self._totals_after = self.after_idle(self._refresh_totals)
 
-        # Solo limpiar los widgets hijos, sin destruir el canvas
-        for widget in self.scrollable_frame.winfo_children():
-            widget.destroy()
+    def _refresh_totals(self):
+        self._totals_after = None
 
         if not self.content.shopping_cart:
             self.lbl_total.config(text="$0.00")
             self.lbl_items.config(text="0 items")
-            self.lbl_vacio = ttk.Label(
-                self.scrollable_frame,
-                text="Carrito vacío 🛒",
-                font=("Arial", 20),
-                bootstyle="secondary"
-            )
-            self.lbl_vacio.pack(pady=(0, 10))
             return
 
-        for i, item in enumerate(self.content.shopping_cart):
-            self.create_shopping_car_item(i, item)
-
         # update total
         total = self.content.get_total()
         self.lbl_total.config(text=f"${total:.2f}")
@@ -190,8 +217,7 @@ class ShoppingCar(ttk.Frame):
         total_items = sum(item['quantity'] for item in self.content.shopping_cart)
         self.lbl_items.config(text=f"{total_items} items")
 
-
-    def create_shopping_car_item(self, index, item):
+    def create_shopping_car_item(self, item, after=None):
 
         item_frame = ttk.Frame(
             self.scrollable_frame,
@@ -200,9 +226,10 @@ class ShoppingCar(ttk.Frame):
             borderwidth=1
         )
 
-        # First item has no top padding, rest have 5px top padding
-        pady = (0, 5) if index == 0 else 5
-        item_frame.pack(fill=X, expand=NO, pady=pady, padx=0)
+        if after is not None:
+            item_frame.pack(fill=X, expand=NO, pady=5, padx=0, after=after)
+        else:
+            item_frame.pack(fill=X, expand=NO, pady=5, padx=0)
 
         content_frame = ttk.Frame(item_frame)
         content_frame.pack(fill=X, expand=YES, padx=10, pady=10)
@@ -210,44 +237,72 @@ class ShoppingCar(ttk.Frame):
         header_frame = ttk.Frame(content_frame)
         header_frame.pack(fill=X, expand=YES)
 
-        ttk.Label(
+        lbl_name = ttk.Label(
             header_frame,
-            text=item['name'],
             font=("Arial", 11, "bold")
-        ).pack(side=LEFT)
+        )
+        lbl_name.pack(side=LEFT)
 
-        ttk.Label(
+        lbl_quantity = ttk.Label(
             header_frame,
-            text=f"x{item['quantity']}",
             font=("Arial", 10),
             bootstyle="secondary"
-        ).pack(side=RIGHT)
+        )
+        lbl_quantity.pack(side=RIGHT)
 
         price_frame = ttk.Frame(content_frame)
         price_frame.pack(fill=X, expand=YES, pady=(5, 0))
 
-        ttk.Label(
+        lbl_price = ttk.Label(
             price_frame,
-            text=f"${item['price']:.2f} c/u",
             font=("Arial", 9),
             bootstyle="secondary"
-        ).pack(side=LEFT)
+        )
+        lbl_price.pack(side=LEFT)
 
-        ttk.Label(
+        lbl_subtotal = ttk.Label(
             price_frame,
-            text=f"${item['subtotal']:.2f}",
             font=("Arial", 12, "bold"),
             bootstyle="success"
-        ).pack(side=RIGHT)
+        )
+        lbl_subtotal.pack(side=RIGHT)
 
+        product_id = item['id']
         btn_eliminar = ttk.Button(
             content_frame,
             text="❌ Eliminar",
-            command=lambda: self.content.delete_product_from_car(index),
+            command=lambda: self._delete_line(product_id),
             bootstyle="danger-outline"
         )
         btn_eliminar.pack(fill=X, pady=(8, 0))
 
+        line = {
+            'frame': item_frame,
+            'pady': 5,
+            'values': {},
+            'labels': {
+                'name': (lbl_name, "{name}"),
+                'quantity': (lbl_quantity, "x{quantity}"),
+                'price': (lbl_price, "${price:.2f} c/u"),
+                'subtotal': (lbl_subtotal, "${subtotal:.2f}"),
+            },
+        }
+        self._update_line(line, item)
+        return line
+
+    def _update_line(self, line, item):
+        """Solo reconfigura las etiquetas cuyo valor cambió"""
+        for key, (label, text) in line['labels'].items():
+            if line['values'].get(key) != item[key]:
+                label.config(text=text.format(**{key: item[key]}))
+                line['values'][key] = item[key]
+
+    def _delete_line(self, product_id):
+        for index, item in enumerate(self.content.shopping_cart):
+            if item['id'] == product_id:
+                self.content.delete_product_from_car(index)
+                return
+
 
     def _on_mousewheel(self, event):
         """Handle mouse wheel scrolling"""
@@ -1,4 +1,3 @@
-import threading
 import ttkbootstrap as ttk
 from ttkbootstrap.constants import *
 from ttkbootstrap.dialogs import Messagebox
@@ -7,6 +6,7 @@ from app.gui.supplies.grid.supply_content import SupplyContent
 from app.gui.supplies.detail.supply_detail import SupplyDetailView
 from app.gui.supplies.credentials_dialog import CredentialsDialog
 from app.data.providers.supplies import supply_provider
+from app.services.task_runner import task_runner
 
 
 class SuppliesContent(ttk.Frame):
@@ -42,10 +42,14 @@ class SuppliesContent(ttk.Frame):
         self.current_view = "grid"
 
     def show_detail_view(self, supply_id):
-        supply = supply_provider.get_supply_by_id(supply_id)
+        supply_provider.get_supply_by_id_async(self, self._on_supply_loaded, supply_id)
+
+    def _on_supply_loaded(self, supply):
         if not supply:
             return
 
+        supply_id = supply['id']
+
         if supply.get('is_default', False):
             has_data = supply_provider.has_purchases(supply_id)
 
@@ -88,10 +92,12 @@ class SuppliesContent(ttk.Frame):
             if invoices:
                 added = supply_provider.sync_cfe_invoices(supply_id, invoices)
 
-            self.after(0, lambda: self.on_sync_complete(supply_id, supply_name, len(invoices), added))
+            return len(invoices), added
 
-        thread = threading.Thread(target=sync_task, daemon=True)
-        thread.start()
+        task_runner.submit(
+            self, sync_task,
+            on_done=lambda result: self.on_sync_complete(supply_id, supply_name, *result)
+        )
 
     def on_sync_complete(self, supply_id, supply_name, total_invoices, added):
         """Called on main thread when sync finishes."""
@@ -56,6 +56,7 @@ class HistoricTable(ttk.Frame):
             fetch_page=self._fetch_page,
             count_rows=self._count_rows,
             pagesize=10,
+            keyset=True,
             searchable=False,
             bootstyle=PRIMARY,
             height=10
@@ -63,8 +64,9 @@ class HistoricTable(ttk.Frame):
         self.table.pack(fill=BOTH, expand=YES)
         self.table.view.bind('<ButtonRelease-1>', self._on_click)
 
-    def _fetch_page(self, offset, limit):
-        purchases = self.provider.get_purchases_paginated(self.supply_id, offset, limit)
+    def _fetch_page(self, limit, **cursor):
+        page = self.provider.get_purchases_page(self.supply_id, limit, **cursor)
+        purchases = page.rows
         self._current_page_data = purchases
 
         rows = []
@@ -87,7 +89,7 @@ class HistoricTable(ttk.Frame):
                 purchase['notes'] or ""
             ])
 
-        return rows
+        return page._replace(rows=rows)
 
     def _count_rows(self):
         return self.provider.count_purchases(self.supply_id)
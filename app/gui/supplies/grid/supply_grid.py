@@ -1,7 +1,101 @@
 import ttkbootstrap as ttk
 from ttkbootstrap.constants import *
-from ttkbootstrap.scrolled import ScrolledFrame
 from app.data.providers.supplies import supply_provider
+from app.gui.components.virtual_list import VirtualList
+
+
+class SupplyCard(ttk.Frame):
+    """Tarjeta reutilizable de VirtualList: se crea una vez y show(supply) la llena"""
+
+    HEIGHT = 170
+
+    def __init__(self, parent, on_card_click, on_edit_supply):
+        super().__init__(parent, bootstyle="light", relief=RAISED, borderwidth=1)
+        self.supply_data = None
+
+        container = ttk.Frame(self, padding=15)
+        container.pack(fill=BOTH, expand=YES)
+
+        # Nombre del insumo + botón editar
+        name_frame = ttk.Frame(container)
+        name_frame.pack(fill=X, pady=(0, 5))
+
+        self.name_label = ttk.Label(
+            name_frame,
+            font=("Arial", 14, "bold"),
+            bootstyle="primary"
+        )
+        self.name_label.pack(side=LEFT)
+
+        self.default_label = ttk.Label(
+            name_frame,
+            text="Sistema",
+            font=("Arial", 8),
+            bootstyle="warning"
+        )
+
+        self.unit_label = ttk.Label(
+            name_frame,
+            font=("Arial", 10),
+            bootstyle="secondary"
+        )
+        self.unit_label.pack(side=LEFT, padx=(5, 0))
+
+        ttk.Button(
+            name_frame,
+            text="\u270F",
+            command=lambda: on_edit_supply(self.supply_data),
+            bootstyle="warning-outline",
+            width=3
+        ).pack(side=RIGHT)
+
+        # Proveedor
+        supplier_frame = ttk.Frame(container)
+        supplier_frame.pack(fill=X, pady=2)
+
+        ttk.Label(supplier_frame, text="Proveedor: ", font=("Arial", 9)).pack(side=LEFT)
+        self.supplier_label = ttk.Label(
+            supplier_frame,
+            font=("Arial", 9, "bold"),
+            bootstyle="info"
+        )
+        self.supplier_label.pack(side=LEFT)
+
+        ttk.Separator(container, orient=HORIZONTAL).pack(fill=X, pady=10)
+
+        ttk.Button(
+            container,
+            text="Ver Detalles",
+            command=lambda: on_card_click(self.supply_data['id']),
+            bootstyle="primary-outline",
+            width=15
+        ).pack(anchor=E)
+
+        # Hover effect
+        def on_enter(e):
+            self.configure(bootstyle="info")
+
+        def on_leave(e):
+            self.configure(bootstyle="light")
+
+        self.bind("<Enter>", on_enter)
+        self.bind("<Leave>", on_leave)
+
+        for child in self.winfo_children():
+            child.bind("<Enter>", on_enter)
+            child.bind("<Leave>", on_leave)
+
+    def show(self, supply_data):
+        self.supply_data = supply_data
+
+        self.name_label.configure(text=supply_data['supply_name'])
+        self.unit_label.configure(text=f"({supply_data.get('unit', '')})")
+        self.supplier_label.configure(text=supply_data['supplier_name'])
+
+        if supply_data.get('is_default', False):
+            self.default_label.pack(side=LEFT, padx=(5, 0), after=self.name_label)
+        else:
+            self.default_label.pack_forget()
 
 
 class SupplyGrid(ttk.Frame):
@@ -55,15 +149,17 @@ class SupplyGrid(ttk.Frame):
         search_entry.pack(side=RIGHT)
 
     def setup_grid_section(self):
-        
-        # Scrolled frame para las tarjetas
-        self.scrolled_frame = ScrolledFrame(self, autohide=True)
-        self.scrolled_frame.pack(fill=BOTH, expand=YES)
 
-        # Frame interior para las tarjetas - usar el frame interno del ScrolledFrame
-        # El ScrolledFrame de ttkbootstrap ya tiene un frame interno accesible
-        self.cards_container = ttk.Frame(self.scrolled_frame)
-        self.cards_container.pack(fill=BOTH, expand=YES, padx=5, pady=5)
+        # Solo se crean las tarjetas visibles (3 por renglón)
+        self.cards_list = VirtualList(
+            self,
+            row_factory=lambda parent: SupplyCard(parent, self.on_card_click, self._edit_supply),
+            row_height=SupplyCard.HEIGHT,
+            columns=self.CARDS_PER_ROW,
+            gap=10,
+            empty_text="No hay insumos registrados"
+        )
+        self.cards_list.pack(fill=BOTH, expand=YES, padx=5, pady=5)
 
         btn_frame = ttk.Frame(self)
         btn_frame.pack(fill=X, pady=(10, 0))
@@ -84,111 +180,7 @@ class SupplyGrid(ttk.Frame):
     def display_supplies(self, supplies):
         """Display supplies as cards in a grid"""
 
-        for widget in self.cards_container.winfo_children():
-            widget.destroy()
-
-        if not supplies:
-
-            no_data_label = ttk.Label(
-                self.cards_container,
-                text="No hay insumos registrados",
-                font=("Arial", 12),
-                bootstyle="secondary"
-            )
-            no_data_label.pack(pady=50)
-            return
-
-        # Crear grid de tarjetas (3 columnas)
-        for idx, supply in enumerate(supplies):
-            row = idx // self.CARDS_PER_ROW
-            col = idx % self.CARDS_PER_ROW
-
-            # Crear la tarjeta directamente
-            card = self.create_card(self.cards_container, supply)
-            card.grid(row=row, column=col, padx=5, pady=5, sticky=NSEW)
-
-        # Configurar el grid para que las columnas se expandan uniformemente
-        for col in range(self.CARDS_PER_ROW):
-            self.cards_container.grid_columnconfigure(col, weight=1, uniform="cards")
-
-    def create_card(self, parent, supply_data):
-
-        card = ttk.Frame(parent, bootstyle="light", relief=RAISED, borderwidth=1)
-
-        container = ttk.Frame(card, padding=15)
-        container.pack(fill=BOTH, expand=YES)
-
-        # Nombre del insumo + botón editar
-        name_frame = ttk.Frame(container)
-        name_frame.pack(fill=X, pady=(0, 5))
-
-        ttk.Label(
-            name_frame,
-            text=supply_data['supply_name'],
-            font=("Arial", 14, "bold"),
-            bootstyle="primary"
-        ).pack(side=LEFT)
-
-        if supply_data.get('is_default', False):
-            ttk.Label(
-                name_frame,
-                text="Sistema",
-                font=("Arial", 8),
-                bootstyle="warning"
-            ).pack(side=LEFT, padx=(5, 0))
-
-        ttk.Label(
-            name_frame,
-            text=f"({supply_data.get('unit', '')})",
-            font=("Arial", 10),
-            bootstyle="secondary"
-        ).pack(side=LEFT, padx=(5, 0))
-
-        ttk.Button(
-            name_frame,
-            text="\u270F",
-            command=lambda s=supply_data: self._edit_supply(s),
-            bootstyle="warning-outline",
-            width=3
-        ).pack(side=RIGHT)
-
-        # Proveedor
-        supplier_frame = ttk.Frame(container)
-        supplier_frame.pack(fill=X, pady=2)
-
-        ttk.Label(supplier_frame, text="Proveedor: ", font=("Arial", 9)).pack(side=LEFT)
-        ttk.Label(
-            supplier_frame,
-            text=supply_data['supplier_name'],
-            font=("Arial", 9, "bold"),
-            bootstyle="info"
-        ).pack(side=LEFT)
-
-        ttk.Separator(container, orient=HORIZONTAL).pack(fill=X, pady=10)
-
-        ttk.Button(
-            container,
-            text="Ver Detalles",
-            command=lambda sid=supply_data['id']: self.on_card_click(sid),
-            bootstyle="primary-outline",
-            width=15
-        ).pack(anchor=E)
-
-        # Hover effect
-        def on_enter(e):
-            card.configure(bootstyle="info")
-
-        def on_leave(e):
-            card.configure(bootstyle="light")
-
-        card.bind("<Enter>", on_enter)
-        card.bind("<Leave>", on_leave)
-
-        for child in card.winfo_children():
-            child.bind("<Enter>", on_enter)
-            child.bind("<Leave>", on_leave)
-
-        return card
+        self.cards_list.set_items(supplies)
 
     def _edit_supply(self, supply_data):
         """Enviar datos del insumo al formulario para editar"""
@@ -0,0 +1,144 @@
+"""
+Ciclo de vida de las vistas principales.
+
+ViewManager conserva las últimas VIEW_CACHE_SIZE vistas ocultas (LRU) en
+lugar de destruirlas al navegar: volver a una vista solo la empaca de nuevo.
+Mientras está oculta se anotan las tablas de su REFRESH_ON que cambiaron
+(vía change_bus) y al mostrarla se llama view.on_show(tablas), para que
+recargue solo lo que quedó viejo. Al ocultarla se llama view.on_hide().
+
+LazyTabs construye las pestañas de un Notebook hasta que se seleccionan.
+
+Los tiempos de construcción quedan en build_times y se imprimen.
+"""
+
+import time
+from collections import OrderedDict
+from ttkbootstrap.constants import *
+
+from app.constants import VIEW_CACHE_SIZE
+from app.services.change_bus import change_bus
+from app.services.task_runner import task_runner
+
+
+build_times = {}
+
+
+def record_build(name, started):
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    build_times.setdefault(name, []).append(elapsed_ms)
+    print(f"[Vistas] {name} construida en {elapsed_ms:.0f} ms")
+    return elapsed_ms
+
+
+class ViewManager:
+
+    def __init__(self, factories, keep_alive=VIEW_CACHE_SIZE):
+        self.factories = factories
+        self.keep_alive = keep_alive
+
+        self.current = None
+        self._views = OrderedDict()
+        self._stale = {}
+        self.stats = {"builds": 0, "reuses": 0, "evictions": 0}
+
+    def show(self, name):
+        """Muestra la vista `name` (reutilizada o nueva) y la devuelve."""
+        if name not in self.factories:
+            return self._views.get(self.current)
+
+        if name == self.current:
+            return self._views[name]
+
+        self._hide_current()
+
+        view = self._views.get(name)
+        if view is not None:
+            self._views.move_to_end(name)
+            self.stats["reuses"] += 1
+            view.pack(fill=BOTH, expand=YES)
+            self.current = name
+
+            on_show = getattr(view, "on_show", None)
+            if on_show:
+                on_show(self._stale.pop(name, set()))
+            return view
+
+        started = time.perf_counter()
+        view = self.factories[name]()
+        view.pack(fill=BOTH, expand=YES)
+        record_build(name, started)
+        self.stats["builds"] += 1
+
+        self._views[name] = view
+        self.current = name
+
+        tables = getattr(view, "REFRESH_ON", ())
+        if tables:
+            change_bus.subscribe(view, tables, lambda events, n=name: self._mark_stale(n, events))
+
+        self._evict()
+        return view
+
+    def _hide_current(self):
+        view = self._views.get(self.current)
+        self.current = None
+        if view is None:
+            return
+
+        view.pack_forget()
+        on_hide = getattr(view, "on_hide", None)
+        if on_hide:
+            on_hide()
+
+    def _mark_stale(self, name, events):
+        # La vista visible se actualiza sola; solo importa lo que pasa oculta
+        if name != self.current:
+            self._stale.setdefault(name, set()).update(change.table for change in events)
+
+    def _evict(self):
+        hidden = [name for name in self._views if name != self.current]
+        while len(hidden) > self.keep_alive:
+            name = hidden.pop(0)
+            view = self._views.pop(name)
+            self._stale.pop(name, None)
+            self.stats["evictions"] += 1
+
+            # Las consultas pendientes de la vista ya no sirven
+            task_runner.cancel_for(view)
+            view.destroy()
+
+
+class LazyTabs:
+    """Pestañas que se construyen con builder() la primera vez que se eligen."""
+
+    def __init__(self, notebook, name):
+        self.notebook = notebook
+        self.name = name
+        self._builders = {}
+        notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed, add="+")
+
+    def add(self, frame, text, builder):
+        self.notebook.add(frame, text=text)
+        self._builders[str(frame)] = builder
+
+    def built(self, frame):
+        return str(frame) not in self._builders
+
+    def ensure(self, frame):
+        builder = self._builders.pop(str(frame), None)
+        if builder is None:
+            return
+
+        started = time.perf_counter()
+        builder()
+        record_build(f"{self.name}/{self.notebook.tab(frame, 'text').strip()}", started)
+
+    def select(self, frame):
+        self.ensure(frame)
+        self.notebook.select(frame)
+
+    def _on_tab_changed(self, _event):
+        selected = self.notebook.select()
+        if selected:
+            self.ensure(selected)
@@ -9,5 +9,8 @@ from .order_refund import OrderRefund
 from .ia import IAConfig
 from .customer_product_price import CustomerProductPrice
 from .cash_cut import CashCut
+from .daily_rollup import DailyRollup, DailyProductRollup
+from .firestore_outbox import FirestoreOutbox
+from .sync_state import SyncState
 
-__all__ = ['Product', 'Customer', 'Sale', 'SaleDetail', 'Supplier', 'Supply', 'SupplyPurchase', 'Order', 'OrderDetail', 'OrderRefund', 'IAConfig', 'CustomerProductPrice', 'CashCut']
+__all__ = ['Product', 'Customer', 'Sale', 'SaleDetail', 'Supplier', 'Supply', 'SupplyPurchase', 'Order', 'OrderDetail', 'OrderRefund', 'IAConfig', 'CustomerProductPrice', 'CashCut', 'DailyRollup', 'DailyProductRollup', 'FirestoreOutbox', 'SyncState']
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, Float, String, DateTime
+from sqlalchemy import Column, Integer, Float, String, DateTime, Index
 from app.data.database import Base
 from app.constants import mexico_now
 
@@ -21,5 +21,9 @@ class CashCut(Base):
     difference = Column(Float, default=0.0)
     notes = Column(String(500), nullable=True)
 
+    __table_args__ = (
+        Index('ix_cash_cuts_closed_at', 'closed_at'),
+    )
+
     def __repr__(self):
         return f"<CashCut(id={self.id}, closed_at={self.closed_at}, expected={self.expected_total}, declared={self.declared_total})>"
@@ -0,0 +1,40 @@
+from sqlalchemy import Column, Integer, Float, String, Date, ForeignKey, UniqueConstraint
+from app.data.database import Base
+
+
+class DailyRollup(Base):
+    __tablename__ = 'daily_rollups'
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    day = Column(Date, nullable=False)
+    channel = Column(String(30), nullable=False)  # venta, pedido, pedido_completado
+    tickets = Column(Integer, nullable=False, default=0)
+    total = Column(Float, nullable=False, default=0.0)
+    quantity = Column(Float, nullable=False, default=0.0)
+    refunded = Column(Float, nullable=False, default=0.0)
+
+    __table_args__ = (
+        UniqueConstraint('day', 'channel', name='uq_daily_rollups_day_channel'),
+    )
+
+    def __repr__(self):
+        return f"<DailyRollup(day={self.day}, channel={self.channel}, tickets={self.tickets}, total={self.total})>"
+
+
+class DailyProductRollup(Base):
+    __tablename__ = 'daily_product_rollups'
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    day = Column(Date, nullable=False)
+    channel = Column(String(30), nullable=False)
+    product_id = Column(Integer, ForeignKey('products.id'), nullable=False)
+    quantity = Column(Float, nullable=False, default=0.0)
+    subtotal = Column(Float, nullable=False, default=0.0)
+    refunded = Column(Float, nullable=False, default=0.0)
+
+    __table_args__ = (
+        UniqueConstraint('day', 'channel', 'product_id', name='uq_daily_product_rollups_day_channel_product'),
+    )
+
+    def __repr__(self):
+        return f"<DailyProductRollup(day={self.day}, channel={self.channel}, product_id={self.product_id}, qty={self.quantity})>"
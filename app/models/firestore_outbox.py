@@ -0,0 +1,25 @@
+from sqlalchemy import Column, Integer, String, Text, DateTime, Index
+from app.data.database import Base
+from app.constants import mexico_now
+
+
+class FirestoreOutbox(Base):
+    __tablename__ = 'firestore_outbox'
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    collection = Column(String(50), nullable=False)
+    document_id = Column(String(100), nullable=False)
+    op = Column(String(10), nullable=False)          # set, update
+    payload = Column(Text, nullable=False)           # JSON
+    created_at = Column(DateTime, default=mexico_now)
+    attempts = Column(Integer, nullable=False, default=0)
+    next_attempt_at = Column(DateTime, default=mexico_now)
+    last_error = Column(String(500), nullable=True)
+    failed_at = Column(DateTime, nullable=True)      # se dejó de reintentar (FIRESTORE_OUTBOX_MAX_ATTEMPTS)
+
+    __table_args__ = (
+        Index('ix_firestore_outbox_document', 'collection', 'document_id'),
+    )
+
+    def __repr__(self):
+        return f"<FirestoreOutbox(id={self.id}, {self.op} {self.collection}/{self.document_id}, attempts={self.attempts})>"
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, Float, String, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, Float, String, DateTime, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from app.data.database import Base
 from app.constants import mexico_now
@@ -14,6 +14,10 @@ class OrderRefund(Base):
     comments = Column(String(500), nullable=True)
     created_at = Column(DateTime, default=mexico_now)
 
+    __table_args__ = (
+        Index('ix_order_refunds_order_id', 'order_id'),
+    )
+
     # Relationships
     order = relationship('Order', backref='refunds')
     product = relationship('Product', backref='order_refunds')
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, Float, String, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, Float, String, DateTime, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from app.data.database import Base
 from app.constants import (
@@ -9,6 +9,16 @@ from app.constants import (
 )
 
 
+def payment_status_for(total, amount_paid):
+    paid = amount_paid or 0.0
+    if paid <= 0:
+        return PAYMENT_STATUS_UNPAID
+    elif paid < total:
+        return PAYMENT_STATUS_PARTIAL
+    else:
+        return PAYMENT_STATUS_PAID
+
+
 class Order(Base):
     __tablename__ = 'orders'
 
@@ -21,19 +31,19 @@ class Order(Base):
     notes = Column(String(500), nullable=True)
     amount_paid = Column(Float, default=0.0)
 
+    __table_args__ = (
+        Index('ix_orders_date', 'date'),
+        Index('ix_orders_status_completed_at', 'status', 'completed_at'),
+        Index('ix_orders_customer_id_date', 'customer_id', 'date'),
+    )
+
     # Relationships
     order_details = relationship('OrderDetail', back_populates='order', cascade='all, delete-orphan')
     customer = relationship('Customer', backref='orders')
 
     @property
     def payment_status(self):
-        paid = self.amount_paid or 0.0
-        if paid <= 0:
-            return PAYMENT_STATUS_UNPAID
-        elif paid < self.total:
-            return PAYMENT_STATUS_PARTIAL
-        else:
-            return PAYMENT_STATUS_PAID
+        return payment_status_for(self.total, self.amount_paid)
 
     def __repr__(self):
         return f"<Order(id={self.id}, date={self.date}, total={self.total}, customer_id={self.customer_id}, status={self.status})>"
@@ -49,6 +59,10 @@ class OrderDetail(Base):
     unit_price = Column(Float, nullable=False)  # Precio personalizado para este cliente
     subtotal = Column(Float, nullable=False)
 
+    __table_args__ = (
+        Index('ix_order_details_order_id', 'order_id'),
+    )
+
     # Relationships
     order = relationship('Order', back_populates='order_details')
     product = relationship('Product', backref='order_details')
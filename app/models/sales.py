@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, Float, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, Float, DateTime, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from app.data.database import Base
 from app.constants import mexico_now
@@ -12,6 +12,10 @@ class Sale(Base):
     total = Column(Float, nullable=False)
     customer_id = Column(Integer, ForeignKey('customers.id'), nullable=False)
 
+    __table_args__ = (
+        Index('ix_sales_date', 'date'),
+    )
+
     # Relationships
     sales_details = relationship('SaleDetail', back_populates='sale', cascade='all, delete-orphan')
     customer = relationship('Customer', backref='sales')
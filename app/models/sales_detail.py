@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, Float, ForeignKey
+from sqlalchemy import Column, Integer, Float, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from app.data.database import Base
 
@@ -13,6 +13,10 @@ class SaleDetail(Base):
     unit_price = Column(Float, nullable=False)
     subtotal = Column(Float, nullable=False)
 
+    __table_args__ = (
+        Index('ix_sales_detail_sale_id', 'sale_id'),
+    )
+
     # Relationships
     sale = relationship('Sale', back_populates='sales_details')
     product = relationship('Product', back_populates='sales_details')
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Float, DateTime, Text, ForeignKey, Date, Boolean
+from sqlalchemy import Column, Integer, String, Float, DateTime, Text, ForeignKey, Date, Boolean, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from app.data.database import Base
@@ -42,6 +42,11 @@ class SupplyPurchase(Base):
     created_at = Column(DateTime, default=mexico_now)
     updated_at = Column(DateTime, default=mexico_now, onupdate=mexico_now)
 
+    __table_args__ = (
+        Index('ix_supply_purchases_supply_id_purchase_date', 'supply_id', 'purchase_date'),
+        Index('ix_supply_purchases_supplier_id', 'supplier_id'),
+    )
+
     # Relationships
     supply = relationship("Supply", back_populates="purchases")
     supplier = relationship("Supplier", backref="supply_purchases")
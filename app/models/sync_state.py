@@ -0,0 +1,12 @@
+from sqlalchemy import Column, String
+from app.data.database import Base
+
+
+class SyncState(Base):
+    __tablename__ = 'sync_state'
+
+    key = Column(String(50), primary_key=True)
+    value = Column(String(200), nullable=True)
+
+    def __repr__(self):
+        return f"<SyncState(key={self.key}, value={self.value})>"
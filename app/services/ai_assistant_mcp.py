@@ -5,33 +5,134 @@ Uses Claude Sonnet 4.5 with function calling (tool use)
 """
 
 import json
-from typing import Dict, Any
+import itertools
+import threading
+import time
+from collections import deque
+from functools import partial
+from typing import Callable, Dict, Any, Optional
 
 
 from anthropic import Anthropic
 from app.constants import AI_ASSISTANT_MAX_TOKENS, AI_ASSISTANT_SYSTEM_PROMPT, AI_ASSISTANT_TEMPERATURE, STATUS_API_AI
-from app.constants import AI_ASSISTANT_MODEL
+from app.constants import AI_ASSISTANT_MODEL, AI_ASSISTANT_USE_FAKE, AI_METRICS_HISTORY, AI_TOOL_TURN_BUDGET_S
 from app.services.db_tool import DatabaseTool
+from app.services.fake_anthropic import FakeAnthropicClient
+from app.services.tool_executor import tool_executor
+from app.services.intent_router import intent_router
+from app.services.result_shaper import result_shaper
+
+
+# Prefijo fijo de cada llamada (tools -> system). Los cache_control marcan
+# hasta dónde se puede reutilizar de la caché de prompts de Anthropic: las
+# iteraciones de herramientas y las preguntas siguientes solo pagan los
+# mensajes nuevos.
+TOOLS = [{
+    "name": "execute_sql",
+    "description": (
+        "Ejecuta una consulta SQL SELECT en la base de datos de la tortillería. "
+        "SOLO se permiten consultas SELECT (lectura). "
+        "Úsala para obtener datos sobre ventas, productos, insumos, proveedores, etc."
+    ),
+    "input_schema": {
+        "type": "object",
+        "properties": {
+            "query": {
+                "type": "string",
+                "description": "La consulta SQL SELECT a ejecutar. Debe seguir la sintaxis de SQLite."
+            }
+        },
+        "required": ["query"]
+    },
+    "cache_control": {"type": "ephemeral"}
+}]
+
+SYSTEM = [{
+    "type": "text",
+    "text": AI_ASSISTANT_SYSTEM_PROMPT,
+    "cache_control": {"type": "ephemeral"}
+}]
 
 
 class AIAssistantMCP:
     """
     AI Assistant using Claude's native tool calling
     The AI can execute SQL directly on the database
+
+    Con on_event, ask() usa la API de streaming y va avisando desde el hilo
+    de trabajo: on_event("text", fragmento), on_event("status", mensaje o
+    None) y on_event("reset") cuando el texto anterior a una consulta deja
+    de ser la respuesta.
+
+    Las preguntas comunes (ventas de hoy, pedidos pendientes, ...) las
+    contesta intent_router sin llamar al LLM.
+
+    Si una respuesta trae varias consultas, se ejecutan en paralelo con
+    tool_executor (con fecha límite por turno); on_event("tools", resumen)
+    reporta el tiempo de cada una.
+
+    El cliente (y su pool HTTP) vive mientras no cambie la API key. Cada
+    llamada deja en `metrics` su latencia, tiempo al primer token y tokens
+    (entrada, leídos/escritos en caché, salida).
     """
 
     def __init__(self):
         self.model = AI_ASSISTANT_MODEL
         self.db_tool = DatabaseTool()
+        self._override = FakeAnthropicClient() if AI_ASSISTANT_USE_FAKE else None
+        self._client = None
+        self._client_key = None
+        self._client_lock = threading.Lock()
+        self.metrics = deque(maxlen=AI_METRICS_HISTORY)
+
+    def use_client(self, client):
+        """Usa `client` en lugar de Anthropic (ej: FakeAnthropicClient); None regresa al real."""
+        self._override = client
 
     def _get_client(self):
         """Get Anthropic client with current API key"""
+        if self._override is not None:
+            return self._override
+
         from app import api_key
-        if not api_key.API_KEY:
+        key = api_key.API_KEY
+        if not key:
             return
-        return Anthropic(api_key=api_key.API_KEY)
 
-    def ask(self, question: str, max_iterations: int = 5) -> dict:
+        with self._client_lock:
+            if self._client_key != key:
+                previous = self._client
+                self._client = Anthropic(api_key=key)
+                self._client_key = key
+                if previous is not None:
+                    previous.close()
+            return self._client
+
+    def ask(
+        self,
+        question: str,
+        max_iterations: int = 5,
+        on_event: Optional[Callable[..., None]] = None
+    ) -> dict:
+        """
+        Ask a question to the AI assistant; common questions are answered locally
+        (ver _ask_llm para la respuesta)
+        """
+        local = intent_router.answer(question)
+        if local is not None:
+            return local
+
+        started = time.perf_counter()
+        result = self._ask_llm(question, max_iterations, on_event)
+        intent_router.record_llm((time.perf_counter() - started) * 1000)
+        return result
+
+    def _ask_llm(
+        self,
+        question: str,
+        max_iterations: int = 5,
+        on_event: Optional[Callable[..., None]] = None
+    ) -> dict:
         """
         Ask a question to the AI assistant using Claude's tool calling
 
@@ -39,36 +140,17 @@ class AIAssistantMCP:
             dict with keys:
             - response: str (respuesta en lenguaje natural)
             - sql_queries: list (queries SQL ejecutadas)
+            - tool_timings: list ({"query", "ms", "ok"} por consulta)
             - success: bool
         """
 
+        emit = on_event or (lambda kind, value=None: None)
         executed_queries = []
+        tool_timings = []
         empty_results_count = 0
         messages = [{"role": "user", "content": question}]
 
         try:
-            # Define the SQL execution tool for Claude
-            tools = [{
-                "name": "execute_sql",
-                "description": (
-                    "Ejecuta una consulta SQL SELECT en la base de datos de la tortillería. "
-                    "SOLO se permiten consultas SELECT (lectura). "
-                    "Úsala para obtener datos sobre ventas, productos, insumos, proveedores, etc."
-                ),
-                "input_schema": {
-                    "type": "object",
-                    "properties": {
-                        "query": {
-                            "type": "string",
-                            "description": "La consulta SQL SELECT a ejecutar. Debe seguir la sintaxis de SQLite."
-                        }
-                    },
-                    "required": ["query"]
-                }
-            }]
-
-            # System prompt with schema
-
             client = self._get_client()
             if not client:
                 return {
@@ -82,12 +164,13 @@ class AIAssistantMCP:
                 print(f"[DEBUG] Iteración {iteration + 1}/{max_iterations}")
 
                 # Call Claude with tools
-                response = client.messages.create(
+                response = self._create(
+                    client, on_event,
                     model=self.model,
                     max_tokens=AI_ASSISTANT_MAX_TOKENS,
                     temperature=AI_ASSISTANT_TEMPERATURE,
-                    system=AI_ASSISTANT_SYSTEM_PROMPT,
-                    tools=tools,
+                    system=SYSTEM,
+                    tools=TOOLS,
                     messages=messages
                 )
 
@@ -100,8 +183,8 @@ class AIAssistantMCP:
                     assistant_message = {"role": "assistant", "content": response.content}
                     messages.append(assistant_message)
 
-                    # Process tool calls
-                    tool_results = []
+                    # Process tool calls (en paralelo, en el orden de los bloques)
+                    calls = []
                     for block in response.content:
                         
                         if block.type == "tool_use":
@@ -113,49 +196,72 @@ class AIAssistantMCP:
                             if tool_name == "execute_sql":
                                 sql_query = tool_input.get("query", "")
                                 executed_queries.append(sql_query)
+                                calls.append((block.id, sql_query))
 
-                                # Execute SQL
-                                result = self.db_tool.execute_sql(sql_query)
-
-                                if result["success"]:
-                                    data = result["data"]
-
-                                    # Check if data is empty or null
-                                    is_empty = (
-                                        not data or
-                                        len(data) == 0 or
-                                        (len(data) == 1 and all(v is None or v == 0 for v in data[0].values()))
-                                    )
-
-                                    if is_empty:
-                                        empty_results_count += 1
-                                        content = json.dumps([], ensure_ascii=False) + "\n\n⚠️ DATOS VACÍOS: La consulta no retornó resultados. NO hagas más consultas. Responde AHORA al usuario que no hay datos disponibles para su pregunta."
-                                    else:
-                                        empty_results_count = 0
-                                        content = json.dumps(data, ensure_ascii=False)
-
-                                    tool_results.append({
-                                        "type": "tool_result",
-                                        "tool_use_id": block.id,
-                                        "content": content
-                                    })
-                                else:
-                                    tool_results.append({
-                                        "type": "tool_result",
-                                        "tool_use_id": block.id,
-                                        "content": f"Error: {result['error']}",
-                                        "is_error": True
-                                    })
+                    results = self._run_queries(calls, emit)
+
+                    tool_results = []
+                    for (tool_use_id, sql_query), (_id, result, elapsed_ms) in zip(calls, results):
+                        tool_timings.append({
+                            "query": sql_query,
+                            "ms": elapsed_ms,
+                            "ok": result is not None and result["success"]
+                        })
+
+                        if result is None:
+                            tool_results.append({
+                                "type": "tool_result",
+                                "tool_use_id": tool_use_id,
+                                "content": (
+                                    f"Error: la consulta no terminó dentro del tiempo del turno "
+                                    f"({AI_TOOL_TURN_BUDGET_S:g} s); usa filtros o agregados más simples"
+                                ),
+                                "is_error": True
+                            })
+
+                        elif result["success"]:
+                            rows = result["rows"]
+
+                            # Check if data is empty or null
+                            is_empty = (
+                                not rows or
+                                (len(rows) == 1 and all(v is None or v == 0 for v in rows[0]))
+                            )
+
+                            if is_empty:
+                                empty_results_count += 1
+                                content = json.dumps([], ensure_ascii=False) + "\n\n⚠️ DATOS VACÍOS: La consulta no retornó resultados. NO hagas más consultas. Responde AHORA al usuario que no hay datos disponibles para su pregunta."
+                            else:
+                                empty_results_count = 0
+                                content = result_shaper.shape(result)
+
+                            tool_results.append({
+                                "type": "tool_result",
+                                "tool_use_id": tool_use_id,
+                                "content": content
+                            })
+                        else:
+                            tool_results.append({
+                                "type": "tool_result",
+                                "tool_use_id": tool_use_id,
+                                "content": f"Error: {result['error']}",
+                                "is_error": True
+                            })
 
                     # Add tool results to conversation
                     messages.append({"role": "user", "content": tool_results})
 
+                    # Lo que escribió antes de consultar no es la respuesta final
+                    emit("reset")
+                    emit("status", "📊 Analizando resultados…")
+
                     # If empty results, stop immediately
                     if empty_results_count >= 1:
                         return {
                             "success": True,
                             "response": "No se encontraron datos para tu pregunta en este periodo.",
-                            "sql_queries": executed_queries
+                            "sql_queries": executed_queries,
+                            "tool_timings": tool_timings
                         }
 
                 elif response.stop_reason == "end_turn":
@@ -171,7 +277,8 @@ class AIAssistantMCP:
                     return {
                         "success": True,
                         "response": final_text.strip(),
-                        "sql_queries": executed_queries
+                        "sql_queries": executed_queries,
+                        "tool_timings": tool_timings
                     }
 
                 else:
@@ -183,7 +290,8 @@ class AIAssistantMCP:
             return {
                 "success": False,
                 "response": "No pude generar una respuesta después de varios intentos.",
-                "sql_queries": executed_queries
+                "sql_queries": executed_queries,
+                "tool_timings": tool_timings
             }
 
         except Exception as e:
@@ -191,9 +299,91 @@ class AIAssistantMCP:
             return {
                 "success": False,
                 "response": f"Error: {error_msg}",
-                "sql_queries": executed_queries
+                "sql_queries": executed_queries,
+                "tool_timings": tool_timings
             }
 
+    def _run_queries(self, calls, emit):
+        """Ejecuta en paralelo las consultas [(tool_use_id, sql)] del turno; [(id, result, ms)] en orden"""
+        if not calls:
+            return []
+
+        total = len(calls)
+        finished = itertools.count(1)
+
+        def on_done(_tool_use_id, _elapsed_ms):
+            emit("status", f"🔎 Consultas listas: {next(finished)}/{total}")
+
+        results = tool_executor.run(
+            [(tool_use_id, partial(self.db_tool.execute_sql, sql)) for tool_use_id, sql in calls],
+            on_done=on_done if total > 1 else None
+        )
+
+        summary = " · ".join(self._format_timing(result, elapsed_ms) for _id, result, elapsed_ms in results)
+        emit("tools", f"⏱ {summary}")
+        print(f"[IA] Consultas del turno: {summary}")
+        return results
+
+    @staticmethod
+    def _format_timing(result, elapsed_ms):
+        text = f"{elapsed_ms:.0f} ms" if elapsed_ms < 1000 else f"{elapsed_ms / 1000:.1f} s"
+        if result is None:
+            return f"{text} (sin terminar)"
+        if not result["success"]:
+            return f"{text} (error)"
+        return text
+
+    def _create(self, client, on_event, **kwargs):
+        """messages.create; con on_event usa messages.stream y reenvía el texto y el progreso"""
+        started = time.perf_counter()
+        if on_event is None:
+            response = client.messages.create(**kwargs)
+            self._record_call(started, None, response)
+            return response
+
+        first_token = None
+        with client.messages.stream(**kwargs) as stream:
+            for event in stream:
+                if event.type == "text":
+                    on_event("text", event.text)
+                elif event.type == "content_block_start":
+                    if first_token is None:
+                        first_token = time.perf_counter()
+                    if event.content_block.type == "tool_use":
+                        on_event("status", "🔎 Ejecutando consulta…")
+                    else:
+                        on_event("status", None)
+            response = stream.get_final_message()
+
+        self._record_call(started, first_token, response)
+        return response
+
+    def _record_call(self, started, first_token, response):
+        usage = getattr(response, "usage", None)
+        call = {
+            "latency_ms": (time.perf_counter() - started) * 1000,
+            "ttft_ms": (first_token - started) * 1000 if first_token else None,
+            "input_tokens": getattr(usage, "input_tokens", 0) or 0,
+            "cache_read_tokens": getattr(usage, "cache_read_input_tokens", 0) or 0,
+            "cache_write_tokens": getattr(usage, "cache_creation_input_tokens", 0) or 0,
+            "output_tokens": getattr(usage, "output_tokens", 0) or 0,
+        }
+        self.metrics.append(call)
+
+        ttft = f"{call['ttft_ms']:.0f} ms" if call["ttft_ms"] is not None else "-"
+        print(
+            f"[IA] {call['latency_ms']:.0f} ms (primer token: {ttft}) | tokens entrada {call['input_tokens']}"
+            f" + caché {call['cache_read_tokens']} leídos / {call['cache_write_tokens']} escritos"
+            f" | salida {call['output_tokens']}"
+        )
+
+    def cache_hit_rate(self) -> float:
+        """Fracción de los tokens de entrada recientes que salieron de la caché"""
+        calls = list(self.metrics)
+        read = sum(call["cache_read_tokens"] for call in calls)
+        total = read + sum(call["input_tokens"] + call["cache_write_tokens"] for call in calls)
+        return read / total if total else 0.0
+
     def check_status(self) -> Dict[str, Any]:
         """Check if Claude API is properly configured"""
      
@@ -0,0 +1,62 @@
+"""
+Caché en memoria del catálogo: productos, clientes y precios por cliente.
+
+Cada sección tiene un número de versión. Las escrituras de los providers
+(add / update / delete / save_price) llaman invalidate(sección), que sube la
+versión y tira sus entradas; una entrada guardada con otra versión nunca se
+devuelve. Si una escritura ocurre mientras otro hilo está cargando, el
+resultado de esa carga no se guarda (ya nació viejo).
+
+stats / hit_rate() permiten ver qué tanto se evita ir a la DB.
+"""
+
+import threading
+
+
+PRODUCTS = "products"
+CUSTOMERS = "customers"
+PRICES = "prices"
+
+
+class CatalogCache:
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._versions = {}
+        self._entries = {}
+        self.stats = {"hits": 0, "misses": 0, "invalidations": 0}
+
+    def get(self, section, key, loader):
+        """Valor de (section, key); si no está o es de otra versión, loader() lo carga."""
+        with self._lock:
+            version = self._versions.get(section, 0)
+            entry = self._entries.get((section, key))
+            if entry is not None and entry[0] == version:
+                self.stats["hits"] += 1
+                return entry[1]
+            self.stats["misses"] += 1
+
+        value = loader()
+
+        with self._lock:
+            if self._versions.get(section, 0) == version:
+                self._entries[(section, key)] = (version, value)
+        return value
+
+    def invalidate(self, section):
+        with self._lock:
+            self._versions[section] = self._versions.get(section, 0) + 1
+            self.stats["invalidations"] += 1
+            for entry_key in [k for k in self._entries if k[0] == section]:
+                del self._entries[entry_key]
+
+    def version(self, section):
+        with self._lock:
+            return self._versions.get(section, 0)
+
+    def hit_rate(self):
+        total = self.stats["hits"] + self.stats["misses"]
+        return self.stats["hits"] / total if total else 0.0
+
+
+catalog_cache = CatalogCache()
@@ -0,0 +1,159 @@
+"""
+Bus de cambios en proceso: avisa a las vistas qué renglones cambiaron.
+
+Cada sesión junta lo que escribe y, solo si hace commit, se publica como
+ChangeEvent(table, op, pks):
+
+- lo que pasa por el ORM (db.add, cambiar atributos, db.delete) se detecta
+  solo en after_flush
+- las sentencias Core (insert / update en bloque) se registran con
+  touch(db, table, op, pks) dentro de la misma transacción
+
+Las vistas se suscriben a las tablas que muestran y reciben los eventos en
+el hilo de Tkinter (vía task_runner), agrupados: varios commits seguidos
+llegan en una sola llamada. Así pueden repintar solo la tarjeta o el
+renglón afectado en lugar de recargar todo.
+
+Además cada tabla lleva un contador de escrituras (version(tables)); sirve
+como versión de datos para cachés como report_cache.
+"""
+
+import threading
+from collections import namedtuple
+from sqlalchemy import event, inspect
+
+from app.data.database import SessionLocal
+from app.services.task_runner import task_runner
+
+
+OP_INSERT = "insert"
+OP_UPDATE = "update"
+OP_DELETE = "delete"
+
+ChangeEvent = namedtuple("ChangeEvent", "table op pks")
+
+
+def _alive(widget):
+    try:
+        return bool(widget.winfo_exists())
+    except Exception:
+        return False
+
+
+class ChangeBus:
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subscribers = []
+        self._pending = {}
+        self._scheduled = False
+        self._versions = {}
+        self.stats = {"commits": 0, "events": 0, "deliveries": 0}
+
+    # --- Registrar (dentro de la transacción) ---
+
+    def touch(self, db, table, op, pks):
+        """Registra un cambio hecho con Core. Se publica al hacer commit."""
+        changes = db.info.setdefault("change_bus", {})
+        changes.setdefault((table, op), set()).update(pks)
+
+    def version(self, tables):
+        """Tupla con el contador de commits que tocaron cada tabla."""
+        with self._lock:
+            return tuple(self._versions.get(table, 0) for table in tables)
+
+    # --- Suscripción (hilo de Tkinter) ---
+
+    def subscribe(self, owner, tables, callback):
+        """
+        callback([ChangeEvent]) se llama con los eventos de `tables` mientras
+        el widget `owner` exista. Devuelve la función para desuscribirse.
+        """
+        subscriber = (owner, frozenset(tables), callback)
+        with self._lock:
+            self._subscribers.append(subscriber)
+
+        def unsubscribe():
+            with self._lock:
+                if subscriber in self._subscribers:
+                    self._subscribers.remove(subscriber)
+
+        return unsubscribe
+
+    # --- Publicar ---
+
+    def publish(self, changes):
+        """changes: {(table, op): {pks}} de un commit."""
+        with self._lock:
+            self.stats["commits"] += 1
+            for table in {table for table, _ in changes}:
+                self._versions[table] = self._versions.get(table, 0) + 1
+
+            if not self._subscribers:
+                return
+
+            for key, pks in changes.items():
+                self._pending.setdefault(key, set()).update(pks)
+
+            if self._scheduled:
+                return
+            self._scheduled = True
+
+        task_runner.post(self._deliver)
+
+    def _deliver(self):
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            self._scheduled = False
+            subscribers = list(self._subscribers)
+
+        events = [ChangeEvent(table, op, frozenset(pks)) for (table, op), pks in pending.items()]
+        self.stats["events"] += len(events)
+
+        for subscriber in subscribers:
+            owner, tables, callback = subscriber
+            if not _alive(owner):
+                with self._lock:
+                    if subscriber in self._subscribers:
+                        self._subscribers.remove(subscriber)
+                continue
+
+            matching = [change for change in events if change.table in tables]
+            if not matching:
+                continue
+
+            self.stats["deliveries"] += 1
+            try:
+                callback(matching)
+            except Exception as e:
+                print(f"[ChangeBus] Error en suscriptor de {owner}: {e}")
+
+
+change_bus = ChangeBus()
+
+
+@event.listens_for(SessionLocal, "after_flush")
+def _collect_flush(session, _flush_context):
+    changes = session.info.setdefault("change_bus", {})
+
+    for op, objects in (
+        (OP_INSERT, session.new),
+        (OP_UPDATE, [obj for obj in session.dirty if session.is_modified(obj, include_collections=False)]),
+        (OP_DELETE, session.deleted),
+    ):
+        for obj in objects:
+            mapper = inspect(obj).mapper
+            pk = mapper.primary_key_from_instance(obj)
+            changes.setdefault((mapper.local_table.name, op), set()).add(pk[0] if len(pk) == 1 else tuple(pk))
+
+
+@event.listens_for(SessionLocal, "after_commit")
+def _publish_after_commit(session):
+    changes = session.info.pop("change_bus", None)
+    if changes:
+        change_bus.publish(changes)
+
+
+@event.listens_for(SessionLocal, "after_rollback")
+def _discard_after_rollback(session):
+    session.info.pop("change_bus", None)
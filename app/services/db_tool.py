@@ -1,51 +1,121 @@
 
-import re
+import json
+import time
+import threading
+from collections import OrderedDict
 from sqlalchemy import text
+from sqlalchemy.exc import DatabaseError, OperationalError
 from typing import Any, Dict
-from app.data.database import SessionLocal
-from app.constants import DANGEROUS_KEYWORDS
+from app.data.readonly_db import timed_connection
+from app.constants import (
+    AI_SQL_TIME_BUDGET_S,
+    AI_SQL_FETCH_SIZE,
+    AI_SQL_MAX_ROWS,
+    AI_SQL_MAX_BYTES,
+    AI_SQL_COUNT_LIMIT,
+    AI_SQL_VALIDATED_CACHE,
+)
 
 
 class DatabaseTool:
-    """Tool that allows AI to execute SQL queries directly"""
-
-    def __init__(self):
+    """
+    Tool that allows AI to execute SQL queries directly.
+
+    Las consultas van solo por el engine de solo lectura (app/data/readonly_db.py)
+    con un tiempo máximo por consulta; stats guarda duración e interrupciones.
+
+    Los renglones se leen con fetchmany y se dejan de guardar al llegar a
+    max_rows o max_bytes (JSON); el resultado es columnar: columnas una vez
+    y después listas de valores, con truncated y total_rows (se siguen
+    contando sin guardarlos hasta AI_SQL_COUNT_LIMIT o el tiempo límite).
+
+    Que la consulta sea de solo lectura lo decide el authorizer de SQLite
+    del engine, no una lista de palabras: validate_sql solo la compila antes
+    para dar un error claro y recuerda las que ya pasaron.
+    """
+
+    def __init__(
+        self,
+        budget_s=AI_SQL_TIME_BUDGET_S,
+        max_rows=AI_SQL_MAX_ROWS,
+        max_bytes=AI_SQL_MAX_BYTES
+    ):
         self.allowed_operations = ['SELECT']  # Only read operations for safety
+        self.budget_s = budget_s
+        self.max_rows = max_rows
+        self.max_bytes = max_bytes
+        self.stats = {
+            "queries": 0, "errors": 0, "interrupted": 0, "total_ms": 0.0, "max_ms": 0.0,
+            "validated_hits": 0, "validated_misses": 0, "rejected": 0,
+        }
+
+        self._validated = OrderedDict()
+        self._validated_lock = threading.Lock()
 
 
     def validate_sql(self, sql: str) -> tuple[bool, str]:
         """
         Validate SQL query for security
         Returns (is_valid, error_message)
+
+        Compila la consulta con EXPLAIN (sin ejecutarla) bajo el authorizer
+        de solo lectura. Las válidas se guardan normalizadas en un LRU de
+        AI_SQL_VALIDATED_CACHE: repetirlas no las vuelve a compilar. El
+        authorizer sigue activo al ejecutar, la caché solo ahorra trabajo.
         """
+        key = self._normalize(sql)
 
-        sql_upper = sql.upper().strip()
+        with self._validated_lock:
+            if key in self._validated:
+                self._validated.move_to_end(key)
+                self.stats["validated_hits"] += 1
+                return True, ""
+            self.stats["validated_misses"] += 1
 
-        # Only allow SELECT
-        if not sql_upper.startswith('SELECT'):
-            return False, "Solo se permiten consultas SELECT"
+        is_valid, error_msg = self._check_readonly(sql)
+        if not is_valid:
+            self.stats["rejected"] += 1
+            return False, error_msg
+
+        with self._validated_lock:
+            self._validated[key] = True
+            self._validated.move_to_end(key)
+            while len(self._validated) > AI_SQL_VALIDATED_CACHE:
+                self._validated.popitem(last=False)
+        return True, ""
 
-        # Block dangerous keywords (whole words only for SQL words)
-        for keyword in DANGEROUS_KEYWORDS:
-            if keyword.isalpha():
-                # SQL words: match whole word only (CREATE != CREATED_AT)
-                if re.search(r'\b' + keyword + r'\b', sql_upper):
-                    return False, f"Palabra clave peligrosa detectada: {keyword}"
-            else:
-                # Special chars (--  ;--  /*  */): match as substring
-                if keyword in sql_upper:
-                    return False, f"Palabra clave peligrosa detectada: {keyword}"
+    @staticmethod
+    def _normalize(sql):
+        # Solo es la llave de la caché: la consulta se ejecuta tal cual
+        return " ".join(sql.split()).rstrip("; ")
 
-        # Must have FROM clause
-        if 'FROM' not in sql_upper:
-            return False, "La consulta debe tener una cláusula FROM"
+    def _check_readonly(self, sql):
+        connection = None
+        try:
+            with timed_connection(self.budget_s) as connection:
+                connection.execute(text(f"EXPLAIN {sql}")).close()
+                if not connection.selected:
+                    return False, "Solo se permiten consultas SELECT"
+            return True, ""
+        except DatabaseError as e:
+            if connection is not None and connection.denied:
+                return False, self._denied_message(connection.denied)
+            return False, str(e)
+        except Exception as e:
+            return False, str(e)
 
-        return True, ""
+    @staticmethod
+    def _denied_message(denied):
+        actions = ", ".join(dict.fromkeys(denied))
+        return f"Operación no permitida ({actions}): solo se permiten consultas de lectura"
 
-    def execute_sql(self, sql: str) -> Dict[str, Any]:
+    def execute_sql(self, sql: str, budget_s: float = None) -> Dict[str, Any]:
         """
         Execute SQL query and return results
+
+        budget_s acota el tiempo de esta consulta (sin pasar de self.budget_s).
         """
+        budget_s = min(budget_s, self.budget_s) if budget_s else self.budget_s
         # Validate first
         is_valid, error_msg = self.validate_sql(sql)
         if not is_valid:
@@ -55,33 +125,96 @@ class DatabaseTool:
                 "query": sql
             }
 
-        db = SessionLocal()
+        started = time.perf_counter()
+        connection = None
         try:
-            # Execute query
-            result = db.execute(text(sql))
-
-            # Fetch results
-            rows = result.fetchall()
-
-            # Convert to list of dicts
-            if rows:
-                columns = result.keys()
-                data = [dict(zip(columns, row)) for row in rows]
-            else:
-                data = []
+            with timed_connection(budget_s) as connection:
+                # Execute query
+                result = connection.execute(text(sql))
+                columns = list(result.keys())
+
+                # Fetch results (hasta max_rows / max_bytes)
+                rows, leftover = self._fetch_rows(result)
+                truncated = leftover > 0
+                total_rows, exact = len(rows), True
+                if truncated:
+                    total_rows, exact = self._count_rest(connection, result, len(rows) + leftover)
 
             return {
                 "success": True,
-                "data": data,
-                "row_count": len(data),
+                "columns": columns,
+                "rows": rows,
+                "row_count": len(rows),
+                "truncated": truncated,
+                "total_rows": total_rows,
+                "total_rows_exact": exact,
                 "query": sql
             }
 
+        except DatabaseError as e:
+            if connection is not None and connection.interrupted:
+                self.stats["interrupted"] += 1
+                error = f"La consulta tardó más de {budget_s:.1f} s y se canceló; usa filtros o agregados más simples"
+            elif connection is not None and connection.denied:
+                self.stats["rejected"] += 1
+                error = self._denied_message(connection.denied)
+            else:
+                self.stats["errors"] += 1
+                error = str(e)
+            return {
+                "success": False,
+                "error": error,
+                "query": sql
+            }
         except Exception as e:
+            self.stats["errors"] += 1
             return {
                 "success": False,
                 "error": str(e),
                 "query": sql
             }
         finally:
-            db.close()
\ No newline at end of file
+            self._record(started)
+
+    def _fetch_rows(self, result):
+        """
+        Regresa (rows, leftover); nunca guarda más de max_rows renglones.
+
+        leftover son los renglones ya leídos del chunk actual que no se
+        guardaron (0 si el resultado cupo completo).
+        """
+        rows = []
+        size = 0
+
+        while True:
+            chunk = result.fetchmany(min(AI_SQL_FETCH_SIZE, self.max_rows - len(rows) + 1))
+            if not chunk:
+                return rows, 0
+
+            for i, row in enumerate(chunk):
+                values = list(row)
+                size += len(json.dumps(values, ensure_ascii=False, default=str)) + 1
+                if len(rows) >= self.max_rows or size > self.max_bytes:
+                    return rows, len(chunk) - i
+                rows.append(values)
+
+    def _count_rest(self, connection, result, counted):
+        """Cuenta (sin guardar) lo que quedó fuera; counted ya incluye lo leído. (total, exacto)."""
+        total = counted
+        try:
+            while total < AI_SQL_COUNT_LIMIT:
+                chunk = result.fetchmany(AI_SQL_FETCH_SIZE * 10)
+                if not chunk:
+                    return total, True
+                total += len(chunk)
+        except OperationalError:
+            if not connection.interrupted:
+                raise
+        return total, False
+
+    def _record(self, started):
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        self.stats["queries"] += 1
+        self.stats["total_ms"] += elapsed_ms
+        self.stats["max_ms"] = max(self.stats["max_ms"], elapsed_ms)
+        print(f"[SQL IA] {elapsed_ms:.0f} ms (interrumpidas: {self.stats['interrupted']}/{self.stats['queries']})")
\ No newline at end of file
@@ -0,0 +1,182 @@
+"""
+Cliente de Anthropic con respuestas fijas para probar el asistente sin red.
+
+Implementa lo que usa AIAssistantMCP: messages.create() y messages.stream()
+(con los eventos "content_block_start" y "text" y get_final_message()). Se
+activa con la variable de entorno TORTILLERIA_FAKE_AI=1 o con
+ai_assistant_mcp.use_client(FakeAnthropicClient()).
+
+Cada respuesta del guion es un texto, ("sql", consulta) o un mensaje
+grabado de la API (dict de message.model_dump(), ver from_fixture); al
+terminarse el guion se repite la última. Por defecto hace una consulta y
+luego contesta.
+
+Si la respuesta no trae `usage` se calcula (~4 caracteres por token) y se
+imita la caché de prompts: el prefijo tools -> system hasta el último
+cache_control se escribe en la caché la primera vez y se lee las
+siguientes (si pasa de CACHE_MIN_TOKENS).
+
+Para simular la red:
+    client.first_token_delay = 1.5   # segundos antes del primer evento
+    client.token_delay = 0.03        # segundos entre fragmentos de texto
+"""
+
+import hashlib
+import itertools
+import json
+import threading
+import time
+from types import SimpleNamespace
+
+
+DEFAULT_SCRIPT = [
+    ("sql", "SELECT COUNT(*) AS ventas, COALESCE(SUM(total), 0) AS total FROM sales"),
+    "Respuesta de prueba: revisé la tabla de ventas y este es el resumen de los datos.",
+]
+
+
+CACHE_MIN_TOKENS = 1024
+
+
+def _block(data):
+    return data if not isinstance(data, dict) else SimpleNamespace(**data)
+
+
+class FakeMessageStream:
+
+    def __init__(self, client, message):
+        self._client = client
+        self._message = message
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def __iter__(self):
+        time.sleep(self._client.first_token_delay)
+
+        for index, block in enumerate(self._message.content):
+            yield SimpleNamespace(type="content_block_start", index=index, content_block=block)
+            if block.type == "text":
+                for chunk in self._client.chunks(block.text):
+                    time.sleep(self._client.token_delay)
+                    yield SimpleNamespace(type="text", text=chunk)
+
+        yield SimpleNamespace(type="message_stop", message=self._message)
+
+    def get_final_message(self):
+        return self._message
+
+
+class FakeMessages:
+
+    def __init__(self, client):
+        self._client = client
+
+    def create(self, **kwargs):
+        # Sin streaming se espera a que "se genere" toda la respuesta
+        stream = FakeMessageStream(self._client, self._client.next_message(kwargs))
+        for _event in stream:
+            pass
+        return stream.get_final_message()
+
+    def stream(self, **kwargs):
+        return FakeMessageStream(self._client, self._client.next_message(kwargs))
+
+
+class FakeAnthropicClient:
+
+    def __init__(self, script=None, first_token_delay=0.0, token_delay=0.0, chunk_size=4):
+        self.script = list(script or DEFAULT_SCRIPT)
+        self.first_token_delay = first_token_delay
+        self.token_delay = token_delay
+        self.chunk_size = chunk_size
+
+        self.requests = []
+        self._turn = 0
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._cached_prefixes = set()
+        self.messages = FakeMessages(self)
+
+    @classmethod
+    def from_fixture(cls, path, **kwargs):
+        """Cliente que repite las respuestas grabadas en `path` (lista JSON)"""
+        with open(path, encoding="utf-8") as f:
+            return cls(script=json.load(f), **kwargs)
+
+    def next_message(self, request):
+        with self._lock:
+            self.requests.append(request)
+            step = self.script[min(self._turn, len(self.script) - 1)]
+            self._turn += 1
+            tool_id = f"toolu_fake_{next(self._ids)}"
+
+        # Las preguntas de verificación (sin tools) siempre contestan texto
+        if "tools" not in request and not isinstance(step, str):
+            step = "ok"
+
+        usage = None
+        if isinstance(step, dict):
+            content = [_block(block) for block in step["content"]]
+            stop_reason = step["stop_reason"]
+            usage = step.get("usage")
+        elif isinstance(step, str):
+            content = [SimpleNamespace(type="text", text=step)]
+            stop_reason = "end_turn"
+        else:
+            _kind, query = step
+            content = [SimpleNamespace(type="tool_use", id=tool_id, name="execute_sql", input={"query": query})]
+            stop_reason = "tool_use"
+
+        if usage is None:
+            usage = self._usage(request, content)
+        return SimpleNamespace(role="assistant", content=content, stop_reason=stop_reason, usage=_block(usage))
+
+    def _usage(self, request, content):
+        def tokens(value):
+            return len(json.dumps(value, ensure_ascii=False, default=str)) // 4
+
+        system = request.get("system", "")
+        system = system if isinstance(system, list) else [{"type": "text", "text": system}]
+        prefix = [request.get("tools", [])] + [[block] for block in system]
+
+        # Hasta el último cache_control del prefijo
+        cut = 0
+        for index, part in enumerate(prefix, start=1):
+            if any("cache_control" in item for item in part):
+                cut = index
+        cached = prefix[:cut]
+        cached_tokens = tokens(cached) if cached else 0
+        rest_tokens = tokens(prefix[cut:]) + tokens(request.get("messages", []))
+
+        usage = {
+            "input_tokens": rest_tokens,
+            "cache_read_input_tokens": 0,
+            "cache_creation_input_tokens": 0,
+            "output_tokens": sum(tokens(getattr(block, "text", getattr(block, "input", ""))) for block in content),
+        }
+        if cached_tokens < CACHE_MIN_TOKENS:
+            usage["input_tokens"] += cached_tokens
+            return usage
+
+        key = hashlib.sha1(json.dumps(cached, sort_keys=True, default=str).encode()).hexdigest()
+        with self._lock:
+            hit = key in self._cached_prefixes
+            self._cached_prefixes.add(key)
+        usage["cache_read_input_tokens" if hit else "cache_creation_input_tokens"] = cached_tokens
+        return usage
+
+    def chunks(self, text):
+        words = text.split(" ")
+        for start in range(0, len(words), self.chunk_size):
+            piece = " ".join(words[start:start + self.chunk_size])
+            yield piece if start == 0 else " " + piece
+
+    def reset(self):
+        """Regresa al inicio del guion (la caché de prompts se conserva)"""
+        with self._lock:
+            self._turn = 0
+            self.requests.clear()
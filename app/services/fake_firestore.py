@@ -0,0 +1,157 @@
+"""
+Cliente Firestore en memoria para probar la sincronización sin red.
+
+Implementa lo que usan FirestoreService y el listener: collection(),
+document().set/update/get, batch() y on_snapshot(). Se activa con la
+variable de entorno TORTILLERIA_FAKE_FIRESTORE=1 o con
+firestore_service.use_client(FakeFirestoreClient()).
+
+Para simular red lenta o caída:
+    client.latency = 0.5     # segundos por commit
+    client.fail_next = 3     # los siguientes 3 commits fallan
+"""
+
+import copy
+import threading
+import time
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+
+class FakeNotFound(Exception):
+    pass
+
+
+class FakeDocumentSnapshot:
+
+    def __init__(self, doc_id, data, update_time=None):
+        self.id = doc_id
+        self.exists = data is not None
+        self.update_time = update_time
+        self._data = copy.deepcopy(data)
+
+    def to_dict(self):
+        return copy.deepcopy(self._data)
+
+
+class FakeDocumentReference:
+
+    def __init__(self, client, collection, doc_id):
+        self._client = client
+        self.collection_name = collection
+        self.id = doc_id
+
+    def set(self, data):
+        batch = self._client.batch()
+        batch.set(self, data)
+        batch.commit()
+
+    def update(self, data):
+        batch = self._client.batch()
+        batch.update(self, data)
+        batch.commit()
+
+    def get(self):
+        key = (self.collection_name, self.id)
+        return FakeDocumentSnapshot(self.id, self._client.documents.get(key), self._client.update_times.get(key))
+
+
+class FakeCollectionReference:
+
+    def __init__(self, client, name):
+        self._client = client
+        self.name = name
+
+    def document(self, doc_id):
+        return FakeDocumentReference(self._client, self.name, str(doc_id))
+
+    def on_snapshot(self, callback):
+        """Como Firestore: el primer snapshot trae toda la colección como ADDED."""
+        self._client._subscribe(self.name, callback)
+
+
+class FakeWriteBatch:
+
+    def __init__(self, client):
+        self._client = client
+        self._writes = []
+
+    def set(self, doc_ref, data):
+        self._writes.append(("set", doc_ref, copy.deepcopy(data)))
+
+    def update(self, doc_ref, data):
+        self._writes.append(("update", doc_ref, copy.deepcopy(data)))
+
+    def commit(self):
+        self._client._commit(self._writes)
+
+
+class FakeFirestoreClient:
+
+    def __init__(self, latency=0.0):
+        self.latency = latency
+        self.fail_next = 0
+        self.documents = {}
+        self.update_times = {}
+        self.commits = []
+        self.listeners = []
+        self._lock = threading.Lock()
+
+    def collection(self, name):
+        return FakeCollectionReference(self, name)
+
+    def batch(self):
+        return FakeWriteBatch(self)
+
+    def _commit(self, writes):
+        if self.latency:
+            time.sleep(self.latency)
+
+        with self._lock:
+            if self.fail_next > 0:
+                self.fail_next -= 1
+                raise ConnectionError("fake firestore: sin conexión")
+
+            # Atómico como Firestore: si un update no encuentra el documento no se aplica nada
+            for op, doc_ref, _ in writes:
+                key = (doc_ref.collection_name, doc_ref.id)
+                if op == "update" and key not in self.documents:
+                    raise FakeNotFound(f"No document to update: {key[0]}/{key[1]}")
+
+            now = datetime.now(timezone.utc)
+            changes = []
+            for op, doc_ref, data in writes:
+                key = (doc_ref.collection_name, doc_ref.id)
+                change_type = "MODIFIED" if key in self.documents else "ADDED"
+                if op == "set":
+                    self.documents[key] = data
+                else:
+                    self.documents[key].update(data)
+                self.update_times[key] = now
+                changes.append((key, change_type))
+
+            self.commits.append([(op, doc_ref.collection_name, doc_ref.id, data) for op, doc_ref, data in writes])
+            listeners = list(self.listeners)
+
+        self._notify(listeners, changes)
+
+    def _subscribe(self, collection, callback):
+        with self._lock:
+            self.listeners.append((collection, callback))
+            changes = [(key, "ADDED") for key in self.documents if key[0] == collection]
+        self._notify([(collection, callback)], changes)
+
+    def _notify(self, listeners, changes):
+        read_time = datetime.now(timezone.utc)
+        for collection, callback in listeners:
+            events = [
+                SimpleNamespace(
+                    type=SimpleNamespace(name=change_type),
+                    document=FakeDocumentSnapshot(
+                        doc_id, self.documents.get((name, doc_id)), self.update_times.get((name, doc_id))
+                    ),
+                )
+                for (name, doc_id), change_type in changes
+                if name == collection
+            ]
+            callback(None, events, read_time)
@@ -1,14 +1,53 @@
+"""
+Sincronización incremental de pedidos desde Firestore (app móvil).
+
+El callback de on_snapshot corre en un hilo de Firestore y solo junta los
+cambios (todos los del snapshot, el último estado de cada documento gana).
+Un solo worker del task_runner los aplica en UNA transacción; las vistas se
+enteran por el change_bus al hacer commit y, ya en el hilo de Tkinter, los
+toasts se agrupan (FIRESTORE_NOTIFY_DEBOUNCE_MS).
+
+El read_time del último snapshot aplicado se guarda en sync_state; al
+reiniciar, el snapshot inicial trae toda la colección como ADDED y los
+documentos con update_time anterior a ese read_time se ignoran.
+
+Si todavía no hay read_time guardado (primer inicio con el listener) no se
+sabe qué documentos de Firestore están viejos, así que los ADDED del
+snapshot inicial no se aplican: solo se guarda su read_time como punto de
+partida. Un campo que falta en el documento (p. ej. amount_paid) no se
+toca en el pedido local.
+"""
+
+import threading
+from datetime import datetime
+
 from app.services.firestore_service import firestore_service
+from app.services.task_runner import task_runner
 from app.data.providers.orders import order_provider
+from app.data.providers.sync_state import sync_state_provider
 from app.gui.components.toast import Toast
-from app.constants import ORDERS_COLLECTION, ORDER_STATUSES_COMPLETE
+from app.constants import (
+    ORDERS_COLLECTION,
+    FIRESTORE_ORDERS_READ_TIME_KEY,
+    FIRESTORE_NOTIFY_DEBOUNCE_MS,
+)
 
 
 class FirestoreOrderListener:
 
     def __init__(self):
         self._app = None
-        self.on_order_changed = None
+
+        self._lock = threading.Lock()
+        self._pending = {}
+        self._read_time = None
+        self._last_read_time = None
+        self._baseline = False
+        self._applying = False
+
+        self._notify_after = None
+        self._completed = []
+        self.stats = {"snapshots": 0, "changes": 0, "skipped": 0, "applied": 0, "transactions": 0}
 
     def start(self, app):
         self._app = app
@@ -16,56 +55,138 @@ class FirestoreOrderListener:
         if not firestore_service.available:
             return
 
+        saved = sync_state_provider.get(FIRESTORE_ORDERS_READ_TIME_KEY)
+        self._last_read_time = datetime.fromisoformat(saved) if saved else None
+        self._baseline = saved is None
+
         collection_ref = firestore_service._db.collection(ORDERS_COLLECTION)
         collection_ref.on_snapshot(self._on_snapshot)
 
+    # --- Hilo de Firestore: solo juntar cambios ---
+
     def _on_snapshot(
         self,
         _snapshot,
         changes,
-        _read_time
+        read_time
     ):
-        modified = next(
-            (c for c in changes if c.type.name == "MODIFIED"),
-            None
+        with self._lock:
+            self.stats["snapshots"] += 1
+            baseline, self._baseline = self._baseline, False
+
+            for change in changes:
+                self.stats["changes"] += 1
+                document = change.document
+                update_time = getattr(document, "update_time", None)
+
+                # REMOVED: el pedido local se conserva
+                if change.type.name == "REMOVED":
+                    self.stats["skipped"] += 1
+                    continue
+
+                # Sin read_time guardado: el snapshot inicial solo marca el punto de partida
+                if baseline and change.type.name == "ADDED":
+                    self.stats["skipped"] += 1
+                    continue
+
+                # Ya aplicado antes de reiniciar
+                if self._last_read_time and update_time and update_time <= self._last_read_time:
+                    self.stats["skipped"] += 1
+                    continue
+
+                data = document.to_dict() or {}
+                data.setdefault("order_id", int(document.id) if document.id.isdigit() else None)
+                self._pending[document.id] = data
+
+            self._read_time = read_time
+            # En el snapshot inicial se guarda el read_time aunque no haya cambios
+            if self._applying or not (self._pending or baseline):
+                return
+            self._applying = True
+
+        task_runner.submit(
+            self._app.root, self._apply_pending,
+            on_done=self._on_applied,
+            on_error=self._on_apply_error
         )
 
-        if not modified:
-            return
+    # --- Worker del task_runner: una transacción por tanda ---
 
-        data = modified.document.to_dict()
-        order_id = data.get("order_id")
-        status = data.get("status")
+    def _apply_pending(self):
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            read_time = self._read_time
 
-        amount_paid = data.get("amount_paid", 0)
-        self._app.root.after(0, self._handle_order_modified, order_id, status, amount_paid)
+        ok, result = order_provider.apply_remote_changes(
+            [
+                (data.get("order_id"), data.get("status"), data.get("amount_paid"))
+                for data in pending.values()
+            ],
+            read_time
+        )
 
-    def _handle_order_modified(
-        self,
-        order_id,
-        status,
-        amount_paid
-    ):
-        if status == ORDER_STATUSES_COMPLETE:
-            order_provider.update_status(order_id, ORDER_STATUSES_COMPLETE)
+        if not ok:
+            # Regresar lo no aplicado (sin pisar cambios más nuevos)
+            with self._lock:
+                self._pending = {**pending, **self._pending}
+            raise RuntimeError(result)
+
+        return len(pending), result, read_time
 
-        order_provider.sync_payment(order_id, amount_paid)
-        self._notify_change()
+    # --- Hilo de Tkinter ---
 
-        if status == ORDER_STATUSES_COMPLETE:
+    def _on_applied(self, result):
+        applied, completed, read_time = result
+
+        with self._lock:
+            self.stats["applied"] += applied
+            self.stats["transactions"] += 1
+            if read_time is not None:
+                self._last_read_time = read_time
+
+            more = bool(self._pending)
+            self._applying = more
+
+        if more:
+            task_runner.submit(
+                self._app.root, self._apply_pending,
+                on_done=self._on_applied,
+                on_error=self._on_apply_error
+            )
+
+        if completed:
+            self._completed.extend(completed)
+            self._schedule_notify()
+
+    def _on_apply_error(self, error):
+        # Se reintenta con el siguiente snapshot
+        with self._lock:
+            self._applying = False
+        print(f"[Firestore] Error aplicando cambios: {error}")
+
+    def _schedule_notify(self):
+        if self._notify_after is None:
+            self._notify_after = self._app.root.after(FIRESTORE_NOTIFY_DEBOUNCE_MS, self._flush_notify)
+
+    def _flush_notify(self):
+        self._notify_after = None
+        completed, self._completed = self._completed, []
+
+        if len(completed) == 1:
+            order_id = completed[0]
             Toast(
                 self._app.root,
                 f"Pedido #{order_id} completado desde móvil",
                 on_action=lambda: self._go_to_order(order_id),
                 action_text="Ver pedido",
             )
-
-    def _notify_change(self):
-        try:
-            if self.on_order_changed:
-                self.on_order_changed()
-        except Exception:
-            self.on_order_changed = None
+        elif completed:
+            Toast(
+                self._app.root,
+                f"{len(completed)} pedidos completados desde móvil",
+                on_action=lambda: self._go_to_order(completed[-1]),
+                action_text="Ver último",
+            )
 
     def _go_to_order(self, order_id):
         self._app.navigation.change_view("sales_admin", "sales_menu")
@@ -74,9 +195,8 @@ class FirestoreOrderListener:
     def _select_order(self, order_id):
         content = self._app.content
 
-        if hasattr(content, "notebook") and hasattr(content, "tab_pedidos"):
-            content.notebook.select(content.tab_pedidos)
-            content.orders_list.detail_order.show_order_details(order_id)
+        if hasattr(content, "show_orders_tab"):
+            content.show_orders_tab().detail_order.show_order_details(order_id)
 
 
 firestore_listener = FirestoreOrderListener()
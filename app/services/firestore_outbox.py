@@ -0,0 +1,265 @@
+"""
+Outbox persistente para sincronizar con Firestore.
+
+Los providers no hablan con la red: enqueue() guarda la escritura en la
+tabla firestore_outbox dentro de la MISMA transacción que el cambio en SQL
+(recibe la sesión del llamador), así el commit del POS regresa en
+milisegundos y nada se pierde si no hay internet o se cierra la app.
+
+Un hilo despachador (start/stop) despierta tras cada commit que encoló algo
+y cada FIRESTORE_OUTBOX_POLL_S para reintentos:
+
+- junta todas las escrituras pendientes del mismo documento en una sola
+  (set + updates -> set; updates -> update con los campos combinados)
+- las envía en batches de Firestore
+- si falla, reintenta ese documento con backoff exponencial; después de
+  FIRESTORE_OUTBOX_ISOLATE_AFTER fallos va en su propio batch para que un
+  documento problemático no frene a los demás
+- tras FIRESTORE_OUTBOX_MAX_ATTEMPTS fallos sus renglones se marcan
+  fallidos (failed_at): ya no se reintentan ni cuentan como pendientes, y
+  el pedido deja de estar "ocupado" para los cambios que llegan del móvil.
+  Se avisa en el log y failed_count() dice cuántos hay.
+"""
+
+import json
+import threading
+from datetime import timedelta
+from sqlalchemy import event, func, delete, update
+
+from app.models import FirestoreOutbox as OutboxRow
+from app.data.database import SessionLocal, get_db
+from app.constants import (
+    mexico_now,
+    FIRESTORE_OUTBOX_BATCH_SIZE,
+    FIRESTORE_OUTBOX_POLL_S,
+    FIRESTORE_OUTBOX_BACKOFF_BASE_S,
+    FIRESTORE_OUTBOX_BACKOFF_MAX_S,
+    FIRESTORE_OUTBOX_ISOLATE_AFTER,
+    FIRESTORE_OUTBOX_MAX_ATTEMPTS,
+)
+
+
+OP_SET = "set"
+OP_UPDATE = "update"
+
+
+def coalesce(ops):
+    """[(op, data)] en orden -> (op, data) equivalente para un documento."""
+    op, data = ops[0][0], dict(ops[0][1])
+    for next_op, next_data in ops[1:]:
+        if next_op == OP_SET:
+            op, data = OP_SET, dict(next_data)
+        else:
+            data.update(next_data)
+    return op, data
+
+
+class FirestoreOutbox:
+
+    def __init__(self):
+        self._service = None
+        self._thread = None
+        self._wake = threading.Event()
+        self._stopping = False
+        self.stats = {"sent": 0, "batches": 0, "coalesced": 0, "failed": 0, "dead": 0}
+
+    # --- Encolar (dentro de la transacción del llamador) ---
+
+    def enqueue(self, db, collection, document_id, op, data):
+        """Agrega una escritura pendiente. No hace commit."""
+        db.add(OutboxRow(
+            collection=collection,
+            document_id=str(document_id),
+            op=op,
+            payload=json.dumps(data),
+        ))
+        db.info["firestore_outbox"] = True
+
+    def wake(self):
+        self._wake.set()
+
+    # --- Despachador ---
+
+    def start(self, service):
+        """Arranca el hilo despachador; `service` expone available y commit_batch(writes)."""
+        self._service = service
+        if not service.available or self._thread:
+            return
+
+        self._stopping = False
+        self._thread = threading.Thread(target=self._run, name="firestore-outbox", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout=2):
+        self._stopping = True
+        self._wake.set()
+        if self._thread:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _run(self):
+        while not self._stopping:
+            try:
+                while self.dispatch_once() and not self._stopping:
+                    pass
+            except Exception as e:
+                print(f"[Firestore] Error en outbox: {e}")
+
+            self._wake.wait(self._next_wait())
+            self._wake.clear()
+
+    def _next_wait(self):
+        """Segundos hasta el siguiente reintento (máximo FIRESTORE_OUTBOX_POLL_S)."""
+        db = get_db()
+        try:
+            next_attempt = db.query(func.min(OutboxRow.next_attempt_at)).filter(
+                OutboxRow.attempts > 0,
+                OutboxRow.failed_at.is_(None)
+            ).scalar()
+        finally:
+            db.close()
+
+        if next_attempt is None:
+            return FIRESTORE_OUTBOX_POLL_S
+
+        wait = (next_attempt - mexico_now().replace(tzinfo=None)).total_seconds()
+        return min(max(wait, 0.05), FIRESTORE_OUTBOX_POLL_S)
+
+    def dispatch_once(self):
+        """Envía los documentos que ya tocan; devuelve cuántos se enviaron."""
+        now = mexico_now()
+        db = get_db()
+
+        try:
+            # Documentos sin backoff pendiente, los más viejos primero
+            documents = db.query(
+                OutboxRow.collection,
+                OutboxRow.document_id,
+                func.max(OutboxRow.attempts),
+            ).filter(
+                OutboxRow.failed_at.is_(None)
+            ).group_by(
+                OutboxRow.collection, OutboxRow.document_id
+            ).having(
+                func.max(OutboxRow.next_attempt_at) <= now
+            ).order_by(
+                func.min(OutboxRow.id)
+            ).limit(FIRESTORE_OUTBOX_BATCH_SIZE).all()
+
+            if not documents:
+                return 0
+
+            attempts = {(c, d): a for c, d, a in documents}
+            rows = db.query(
+                OutboxRow.id,
+                OutboxRow.collection,
+                OutboxRow.document_id,
+                OutboxRow.op,
+                OutboxRow.payload,
+            ).filter(
+                OutboxRow.document_id.in_({d for _, d, _ in documents}),
+                OutboxRow.failed_at.is_(None)
+            ).order_by(OutboxRow.id).all()
+        finally:
+            db.close()
+
+        pending = {}
+        for row_id, collection, document_id, op, payload in rows:
+            if (collection, document_id) not in attempts:
+                continue
+            ids, ops = pending.setdefault((collection, document_id), ([], []))
+            ids.append(row_id)
+            ops.append((op, json.loads(payload)))
+
+        healthy, isolated = [], []
+        for doc, (ids, ops) in pending.items():
+            op, data = coalesce(ops)
+            write = (doc, ids, op, data, attempts[doc])
+            if attempts[doc] >= FIRESTORE_OUTBOX_ISOLATE_AFTER:
+                isolated.append([write])
+            else:
+                healthy.append(write)
+
+        sent = 0
+        for batch in ([healthy] if healthy else []) + isolated:
+            sent += self._send(batch)
+        return sent
+
+    def _send(self, batch):
+        ids = [row_id for _, row_ids, _, _, _ in batch for row_id in row_ids]
+        writes = [(collection, document_id, op, data) for (collection, document_id), _, op, data, _ in batch]
+
+        try:
+            self._service.commit_batch(writes)
+        except Exception as e:
+            print(f"[Firestore] Error enviando {len(batch)} documento(s), se reintentará: {e}")
+            self.stats["failed"] += len(batch)
+            self._backoff(batch, e)
+            return 0
+
+        db = get_db()
+        try:
+            # Solo los renglones enviados: lo que se encoló mientras tanto sigue pendiente
+            db.execute(delete(OutboxRow).where(OutboxRow.id.in_(ids)))
+            db.commit()
+        finally:
+            db.close()
+
+        self.stats["sent"] += len(batch)
+        self.stats["batches"] += 1
+        self.stats["coalesced"] += len(ids) - len(batch)
+        return len(batch)
+
+    def _backoff(self, batch, error):
+        now = mexico_now()
+        dead = []
+        db = get_db()
+        try:
+            for (collection, document_id), ids, _, _, attempts in batch:
+                attempts += 1
+                delay = min(FIRESTORE_OUTBOX_BACKOFF_BASE_S * 2 ** (attempts - 1), FIRESTORE_OUTBOX_BACKOFF_MAX_S)
+                failed = attempts >= FIRESTORE_OUTBOX_MAX_ATTEMPTS
+                if failed:
+                    dead.append(f"{collection}/{document_id}")
+
+                db.execute(update(OutboxRow).where(OutboxRow.id.in_(ids)).values(
+                    attempts=attempts,
+                    next_attempt_at=now + timedelta(seconds=delay),
+                    last_error=str(error)[:500],
+                    failed_at=now if failed else None,
+                ))
+            db.commit()
+        finally:
+            db.close()
+
+        if dead:
+            self.stats["dead"] += len(dead)
+            print(
+                f"[Firestore] {', '.join(dead)}: {FIRESTORE_OUTBOX_MAX_ATTEMPTS} intentos fallidos, "
+                f"ya no se reintenta: {error}"
+            )
+
+    def pending_count(self):
+        """Escrituras por enviar (sin las marcadas como fallidas)."""
+        db = get_db()
+        try:
+            return db.query(func.count(OutboxRow.id)).filter(OutboxRow.failed_at.is_(None)).scalar() or 0
+        finally:
+            db.close()
+
+    def failed_count(self):
+        """Escrituras que se dejaron de reintentar (failed_at)."""
+        db = get_db()
+        try:
+            return db.query(func.count(OutboxRow.id)).filter(OutboxRow.failed_at.isnot(None)).scalar() or 0
+        finally:
+            db.close()
+
+
+firestore_outbox = FirestoreOutbox()
+
+
+@event.listens_for(SessionLocal, "after_commit")
+def _wake_after_commit(session):
+    if session.info.pop("firestore_outbox", False):
+        firestore_outbox.wake()
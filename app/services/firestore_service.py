@@ -5,7 +5,10 @@ from app.constants import (
     ORDERS_COLLECTION,
     ORDER_STATUSES_PENDING,
     SERVICE_ACCOUNT_PATH,
+    FIRESTORE_USE_FAKE,
 )
+from app.services.fake_firestore import FakeFirestoreClient
+from app.services.firestore_outbox import firestore_outbox, OP_SET, OP_UPDATE
 
 
 class FirestoreService:
@@ -17,6 +20,10 @@ class FirestoreService:
 
     def _initialize(self):
 
+        if FIRESTORE_USE_FAKE:
+            self.use_client(FakeFirestoreClient())
+            return
+
         if not os.path.exists(SERVICE_ACCOUNT_PATH):
             return
 
@@ -30,8 +37,16 @@ class FirestoreService:
         except Exception as e:
             print(f"[Firestore] Error in initialization: {e}")
 
+    def use_client(self, client):
+        """Usa otro cliente (p. ej. FakeFirestoreClient para probar sin red)."""
+        self._db = client
+        self.available = True
+
+    # --- Escrituras: se encolan en el outbox dentro de la transacción de `db` ---
+
     def add_order(
         self,
+        db,
         order_id,
         customer_name,
         items,
@@ -43,35 +58,31 @@ class FirestoreService:
         if not self.available:
             return
 
-        try:
-            doc_ref = self._db.collection(ORDERS_COLLECTION).document(str(order_id))
-            doc_ref.set(
-                {
-                    "order_id": order_id,
-                    "customer_name": customer_name,
-                    "items": [
-                        {
-                            "product_id": item["id"],
-                            "name": item["name"],
-                            "price": item["price"],
-                            "quantity": item["quantity"],
-                            "subtotal": item["subtotal"],
-                        }
-                        for item in items
-                    ],
-                    "total": total,
-                    "amount_paid": amount_paid,
-                    "status": ORDER_STATUSES_PENDING,
-                    "created_at": created_at,
-                }
-            )
-            return doc_ref.id
-
-        except Exception as e:
-            print(f"[Firestore] Error in sync order #{order_id}: {e}")
+        firestore_outbox.enqueue(
+            db, ORDERS_COLLECTION, order_id, OP_SET,
+            {
+                "order_id": order_id,
+                "customer_name": customer_name,
+                "items": [
+                    {
+                        "product_id": item["id"],
+                        "name": item["name"],
+                        "price": item["price"],
+                        "quantity": item["quantity"],
+                        "subtotal": item["subtotal"],
+                    }
+                    for item in items
+                ],
+                "total": total,
+                "amount_paid": amount_paid,
+                "status": ORDER_STATUSES_PENDING,
+                "created_at": created_at,
+            }
+        )
 
     def update_order_status(
         self,
+        db,
         order_id,
         status
     ):
@@ -79,30 +90,34 @@ class FirestoreService:
         if not self.available:
             return
 
-        try:
-            self._db.collection(ORDERS_COLLECTION).\
-                document(str(order_id)).\
-                update(
-                    {
-                        "status": status
-                    }
-                )
-        except Exception as e:
-            print(f"[Firestore] Error in update order #{order_id}: {e}")
-
+        firestore_outbox.enqueue(
+            db, ORDERS_COLLECTION, order_id, OP_UPDATE,
+            {"status": status}
+        )
 
-    def sync_payment(self, order_id, amount_paid):
+    def sync_payment(self, db, order_id, amount_paid):
         if not self.available:
             return
 
-        try:
-            self._db.collection(ORDERS_COLLECTION).\
-                document(str(order_id)).\
-                update(
-                    {"amount_paid": amount_paid}
-                )
-        except Exception as e:
-            print(f"[Firestore] Error in sync payment #{order_id}: {e}")
+        firestore_outbox.enqueue(
+            db, ORDERS_COLLECTION, order_id, OP_UPDATE,
+            {"amount_paid": amount_paid}
+        )
+
+    # --- Red (solo desde el hilo del outbox) ---
+
+    def commit_batch(self, writes):
+        """writes: [(collection, document_id, op, data)] en un solo batch atómico."""
+        batch = self._db.batch()
+
+        for collection, document_id, op, data in writes:
+            doc_ref = self._db.collection(collection).document(document_id)
+            if op == OP_SET:
+                batch.set(doc_ref, data)
+            else:
+                batch.update(doc_ref, data)
+
+        batch.commit()
 
 
 firestore_service = FirestoreService()
@@ -0,0 +1,234 @@
+"""
+Respuestas locales para las preguntas más comunes del asistente.
+
+Antes de llamar al LLM, IntentRouter revisa si la pregunta es una de las
+de siempre (ventas de hoy / la semana / el mes, mejor cliente, existencia de
+un insumo, pedidos pendientes) y la contesta con las consultas que ya tienen
+los providers, en milisegundos y sin gastar tokens.
+
+Cada intención es una plantilla de palabras clave: todas sus `requires`
+deben aparecer y las demás palabras de la pregunta deben ser relleno
+(FILLER) o parte de su vocabulario. Si sobra cualquier otra palabra
+("¿cuánto vendí hoy de tortilla?") la pregunta es más específica de lo que
+sabe contestar y se va al LLM.
+
+stats lleva aciertos, tiempos locales y el tiempo promedio del LLM, con lo
+que se estima el ahorro.
+"""
+
+import re
+import threading
+import time
+import unicodedata
+from datetime import timedelta
+
+from app.constants import (
+    mexico_now,
+    ROLLUP_CHANNEL_SALE,
+    ROLLUP_CHANNEL_ORDER,
+)
+from app.data.providers.sales import sale_provider
+from app.data.providers.orders import order_provider
+from app.data.providers.rollups import rollup_provider
+from app.data.providers.supplies import supply_provider
+from app.data.report_queries import report_queries
+
+
+# Palabras que no cambian el sentido de la pregunta (ya sin acentos)
+FILLER = {
+    "a", "al", "actual", "actualmente", "ahora", "cual", "cuales", "cuanta", "cuantas",
+    "cuanto", "cuantos", "dame", "de", "del", "dime", "el", "en", "es", "esta", "estan", "este",
+    "favor", "fue", "hay", "he", "hemos", "la", "las", "lo", "los", "me", "mi", "mis",
+    "muestrame", "por", "que", "quien", "saber", "se", "son", "su", "tengo", "tenemos",
+    "total", "un", "una", "van", "ver", "y", "llevo", "llevamos", "quiero",
+}
+
+SALES_WORDS = r"vend\w*|ventas?|ingresos?|gener\w*|factur\w*|dinero"
+STOCK_WORDS = r"stock|existencias?|inventario|quedan?|tengo|tenemos|hay"
+
+PERIODS = ("hoy", "semana", "mes")
+
+
+def normalize(text):
+    """Minúsculas, sin acentos ni signos"""
+    text = unicodedata.normalize("NFKD", text.lower())
+    text = "".join(c for c in text if not unicodedata.combining(c))
+    return re.sub(r"[^a-z0-9ñ ]+", " ", text).split()
+
+
+def money(value):
+    return f"${value:,.2f}"
+
+
+class Intent:
+
+    def __init__(self, name, requires, handler, vocabulary=()):
+        self.name = name
+        self.requires = [re.compile(pattern) for pattern in requires]
+        self.vocabulary = set(vocabulary)
+        self.handler = handler
+
+    def match(self, words):
+        """Palabras que usó la plantilla, o None si no aplica"""
+        used = set()
+        for pattern in self.requires:
+            found = [w for w in words if pattern.fullmatch(w)]
+            if not found:
+                return None
+            used.update(found)
+
+        leftover = [w for w in words if w not in used and w not in FILLER and w not in self.vocabulary]
+        return None if leftover else used
+
+
+class IntentRouter:
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.stats = {
+            "questions": 0, "hits": 0, "local_ms": 0.0,
+            "llm_calls": 0, "llm_ms": 0.0, "by_intent": {},
+        }
+        self.stock_intent = Intent("existencia", [STOCK_WORDS], self._stock)
+        self.intents = [
+            Intent("ventas", [SALES_WORDS, r"hoy|semana|mes"], self._sales),
+            Intent(
+                "mejor_cliente", [r"clientes?", r"mejor(es)?|top|principal|mas"], self._top_customer,
+                vocabulary={"compra", "compro", "gasta", "gasto", "pide", "pidio"}
+            ),
+            Intent(
+                "pedidos_pendientes", [r"pedidos?|ordenes?|encargos?", r"pendientes?|entregar|abiertos?"],
+                self._pending_orders, vocabulary={"sin", "aun", "todavia"}
+            ),
+        ]
+
+    def answer(self, question):
+        """Respuesta con la forma de AIAssistantMCP.ask, o None si la debe contestar el LLM"""
+        started = time.perf_counter()
+        words = normalize(question)
+
+        result = None
+        try:
+            result = self._stock(words)
+            if result is None:
+                for intent in self.intents:
+                    if intent.match(words) is not None:
+                        result = (intent.name, intent.handler(words))
+                        break
+        except Exception as e:
+            # Si la consulta local falla, que conteste el LLM
+            print(f"[IA] Respuesta local falló: {e}")
+            result = None
+
+        with self._lock:
+            self.stats["questions"] += 1
+            if result is None:
+                return None
+
+            name, response = result
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            self.stats["hits"] += 1
+            self.stats["local_ms"] += elapsed_ms
+            self.stats["by_intent"][name] = self.stats["by_intent"].get(name, 0) + 1
+            self._log(name, elapsed_ms)
+
+        return {
+            "success": True,
+            "response": response,
+            "sql_queries": [],
+            "tool_timings": [],
+            "intent": name,
+        }
+
+    def record_llm(self, elapsed_ms):
+        """Tiempo de una pregunta que contestó el LLM (para estimar el ahorro)"""
+        with self._lock:
+            self.stats["llm_calls"] += 1
+            self.stats["llm_ms"] += elapsed_ms
+
+    def hit_rate(self):
+        questions = self.stats["questions"]
+        return self.stats["hits"] / questions if questions else 0.0
+
+    def saved_ms(self):
+        """Ahorro estimado: aciertos x tiempo promedio del LLM - tiempo local"""
+        if not self.stats["llm_calls"]:
+            return 0.0
+        avg_llm_ms = self.stats["llm_ms"] / self.stats["llm_calls"]
+        return self.stats["hits"] * avg_llm_ms - self.stats["local_ms"]
+
+    def _log(self, name, elapsed_ms):
+        print(
+            f"[IA] Respuesta local ({name}) en {elapsed_ms:.1f} ms | aciertos "
+            f"{self.stats['hits']}/{self.stats['questions']} ({self.hit_rate():.0%}), "
+            f"ahorro estimado {self.saved_ms() / 1000:.1f} s"
+        )
+
+    # --- Respuestas ---
+
+    def _sales(self, words):
+        today = mexico_now().date()
+        period = next(w for w in words if w in PERIODS)
+
+        if period == "hoy":
+            tickets, total = sale_provider.get_today()
+            orders, orders_total = order_provider.get_today()
+            label = "Hoy"
+        else:
+            start = today - timedelta(days=today.weekday()) if period == "semana" else today.replace(day=1)
+            label = "Esta semana" if period == "semana" else "Este mes"
+            tickets, total, _ = rollup_provider.get_totals(ROLLUP_CHANNEL_SALE, start, today)
+            orders, orders_total, _ = rollup_provider.get_totals(ROLLUP_CHANNEL_ORDER, start, today)
+
+        return (
+            f"{label} llevas {money(total + orders_total)} en total:\n"
+            f"• Mostrador: {money(total)} en {tickets} ventas\n"
+            f"• Pedidos: {money(orders_total)} en {orders} pedidos"
+        )
+
+    def _top_customer(self, _words):
+        by_customer = report_queries.customers_tab()["by_customer"]
+        if not by_customer:
+            return "Todavía no hay pedidos de clientes registrados."
+
+        _id, name, category, orders, total = by_customer[0]
+        return (
+            f"Tu mejor cliente es {name} ({category}): {orders} pedidos por {money(total)} en total."
+        )
+
+    def _pending_orders(self, _words):
+        orders = order_provider.get_pending()
+        if not orders:
+            return "No hay pedidos pendientes."
+
+        total = sum(order.total or 0 for order in orders)
+        balance = sum((order.total or 0) - (order.amount_paid or 0) for order in orders)
+        oldest = min(order.date for order in orders)
+        return (
+            f"Hay {len(orders)} pedidos pendientes por {money(total)} "
+            f"(por cobrar: {money(balance)}). El más antiguo es del {oldest:%d/%m/%Y}."
+        )
+
+    def _stock(self, words):
+        """Existencia de un insumo cuyo nombre aparece en la pregunta"""
+        if not any(re.fullmatch(STOCK_WORDS, w) for w in words):
+            return None
+
+        text = f" {' '.join(words)} "
+        supplies = [
+            (normalize(s["supply_name"]), s) for s in supply_provider.get_all_supplies()
+        ]
+        # El nombre más largo que aparece completo ("feca de maiz" antes que "maiz")
+        named = [(name, s) for name, s in supplies if name and f" {' '.join(name)} " in text]
+        if not named:
+            return None
+        name, supply = max(named, key=lambda item: len(item[0]))
+
+        if self.stock_intent.match([w for w in words if w not in name]) is None:
+            return None
+
+        stock = supply_provider.get_current_stock(supply["id"])
+        return self.stock_intent.name, f"Tienes {stock:,.2f} {supply['unit']} de {supply['supply_name']} en existencia."
+
+
+intent_router = IntentRouter()
@@ -0,0 +1,143 @@
+"""
+Caché de resultados de reportes.
+
+get(section, params, tables, loader): el resultado se guarda con la llave
+(section, params) y la versión de datos de `tables` (contadores de escritura
+del change_bus). Mientras nadie escriba en esas tablas se devuelve el mismo
+objeto sin consultar; si una escritura llega durante la carga, el resultado
+no se guarda (ya nació viejo).
+
+closed(section, last_closed, loader): agregados de periodos ya cerrados
+(días o meses pasados, llaves ISO 'YYYY-MM' / 'YYYY-MM-DD'). Se calculan una
+vez y se guardan en disco (REPORT_CACHE_FILE); solo se vuelve a consultar lo
+que cerró después. Si una transacción escribe en un día ya cerrado
+(rollups: forget_closed_on_commit) los periodos afectados se olvidan al hacer
+commit.
+"""
+
+import json
+import os
+import threading
+from sqlalchemy import event
+
+from app.constants import REPORT_CACHE_FILE
+from app.data.database import SessionLocal, data_path
+from app.services.change_bus import change_bus
+
+
+class ReportCache:
+
+    def __init__(self, path=None):
+        self.path = path or data_path(REPORT_CACHE_FILE)
+        self._lock = threading.Lock()
+        self._entries = {}
+        self._closed = None
+        self.stats = {"hits": 0, "misses": 0, "closed_hits": 0, "closed_misses": 0}
+
+    # --- Por versión de datos (memoria) ---
+
+    def get(self, section, params, tables, loader):
+        key = (section, params)
+        version = change_bus.version(tables)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == version:
+                self.stats["hits"] += 1
+                return entry[1]
+            self.stats["misses"] += 1
+
+        value = loader()
+
+        if change_bus.version(tables) == version:
+            with self._lock:
+                self._entries[key] = (version, value)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    # --- Periodos cerrados (disco) ---
+
+    def closed(self, section, last_closed, loader):
+        """
+        {periodo: valor} de todos los periodos cerrados hasta last_closed.
+        loader(after) devuelve solo los periodos posteriores a `after`
+        (None = todos) y hasta last_closed.
+        """
+        with self._lock:
+            store = self._load().setdefault(section, {"through": None, "periods": {}})
+            through = store["through"]
+            if through is not None and through >= last_closed:
+                self.stats["closed_hits"] += 1
+                return dict(store["periods"])
+            self.stats["closed_misses"] += 1
+
+        new_periods = loader(through)
+
+        with self._lock:
+            # Otro hilo pudo olvidar la sección mientras se consultaba
+            if self._load().get(section) is store:
+                store["periods"].update(new_periods)
+                store["through"] = last_closed
+                self._save()
+            return {**store["periods"], **new_periods}
+
+    def forget_closed_on_commit(self, db, day):
+        """Registra una escritura en un día cerrado; se olvida al hacer commit."""
+        pending = db.info.get("report_cache_forget")
+        if pending is None or day < pending:
+            db.info["report_cache_forget"] = day
+
+    def forget_closed(self, day=None):
+        """Olvida los periodos que incluyen `day` y los posteriores (None = todo)."""
+        with self._lock:
+            data = self._load()
+            if day is None:
+                data.clear()
+            else:
+                iso = day.isoformat()
+                for section in list(data):
+                    through = data[section]["through"]
+                    # Sin `through` puede haber una carga en curso: también se descarta
+                    if through is None or iso[:len(through)] <= through:
+                        del data[section]
+            self._save()
+
+    def _load(self):
+        if self._closed is None:
+            try:
+                with open(self.path, encoding="utf-8") as f:
+                    self._closed = json.load(f)
+            except (OSError, ValueError):
+                self._closed = {}
+        return self._closed
+
+    def _save(self):
+        tmp_path = f"{self.path}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self._closed, f)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"[Reportes] No se pudo guardar la caché de periodos cerrados: {e}")
+
+    def hit_rate(self):
+        total = self.stats["hits"] + self.stats["misses"]
+        return self.stats["hits"] / total if total else 0.0
+
+
+report_cache = ReportCache()
+
+
+@event.listens_for(SessionLocal, "after_commit")
+def _forget_after_commit(session):
+    day = session.info.pop("report_cache_forget", None)
+    if day is not None:
+        report_cache.forget_closed(day)
+
+
+@event.listens_for(SessionLocal, "after_rollback")
+def _discard_after_rollback(session):
+    session.info.pop("report_cache_forget", None)
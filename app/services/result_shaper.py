@@ -0,0 +1,143 @@
+"""
+Da forma a los resultados de SQL antes de mandarlos al modelo.
+
+En lugar de JSON (llaves, comillas y nombres de columna) el resultado va
+como tabla de texto: encabezado una vez y un renglón por línea separado
+por "|". Los decimales se redondean (AI_RESULT_DECIMALS, o 3 cifras
+significativas si el valor es menor a 1) y las fechas pierden segundos y
+microsegundos ("2026-01-15 00:00:00" -> "2026-01-15").
+
+Si hay más de AI_RESULT_SUMMARY_ROWS renglones solo van los primeros
+AI_RESULT_TOP_N (en el orden de la consulta) más un resumen por columna:
+mínimo, máximo, suma y promedio de las numéricas, rango de las fechas y
+valores distintos de las de texto.
+
+stats compara los tokens estimados (~4 caracteres por token) contra el
+JSON de diccionarios por renglón que se mandaba antes.
+"""
+
+import json
+import re
+import threading
+from datetime import date, datetime
+
+from app.constants import AI_RESULT_DECIMALS, AI_RESULT_SUMMARY_ROWS, AI_RESULT_TOP_N
+
+
+_DATETIME_RE = re.compile(
+    r"(\d{4}-\d{2}-\d{2})(?:[ T](\d{2}:\d{2})(?::\d{2}(?:\.\d+)?)?(?:Z|[+-]\d{2}:?\d{2})?)?"
+)
+
+
+def estimate_tokens(text):
+    return len(text) // 4 + 1
+
+
+def short_datetime(text):
+    """Fecha ISO sin segundos (y sin hora si es medianoche); None si no es fecha"""
+    match = _DATETIME_RE.fullmatch(text)
+    if not match:
+        return None
+    day, hour = match.groups()
+    return day if hour in (None, "00:00") else f"{day} {hour}"
+
+
+def format_number(value):
+    if isinstance(value, int) or value.is_integer():
+        return str(int(value))
+    if abs(value) < 1:
+        return f"{value:.3g}"
+    return f"{value:.{AI_RESULT_DECIMALS}f}".rstrip("0").rstrip(".")
+
+
+def format_cell(value):
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "1" if value else "0"
+    if isinstance(value, (int, float)):
+        return format_number(value)
+    if isinstance(value, datetime):
+        return short_datetime(value.isoformat(sep=" "))
+    if isinstance(value, date):
+        return value.isoformat()
+
+    text = str(value)
+    return short_datetime(text) or text.replace("|", "/").replace("\n", " ")
+
+
+class ResultShaper:
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.stats = {"queries": 0, "raw_tokens": 0, "shaped_tokens": 0, "summarized": 0}
+
+    def shape(self, result):
+        """Contenido del tool_result para un resultado exitoso de DatabaseTool.execute_sql"""
+        columns = result["columns"]
+        rows = result["rows"]
+        summarize = len(rows) > AI_RESULT_SUMMARY_ROWS
+
+        lines = []
+        if result["truncated"] or summarize:
+            total = result["total_rows"] if result["total_rows_exact"] else f">={result['total_rows']}"
+            recortado = " (recortado)" if result["truncated"] else ""
+            lines.append(f"renglones: {len(rows)} de {total}{recortado}")
+
+        lines.append("|".join(columns))
+        shown = rows[:AI_RESULT_TOP_N] if summarize else rows
+        lines.extend("|".join(format_cell(value) for value in row) for row in shown)
+
+        if summarize:
+            lines.append(f"… {len(rows) - len(shown)} renglones más no mostrados")
+            lines.append(f"resumen de {len(rows)} renglones: " + "; ".join(self._summary(columns, rows)))
+
+        content = "\n".join(lines)
+        if result["truncated"]:
+            content += (
+                f"\n\n⚠️ RESULTADO RECORTADO: solo se muestran {result['row_count']} renglones. "
+                "Si necesitas el total usa agregados (COUNT, SUM, GROUP BY) en lugar de listar renglones."
+            )
+
+        self._record(columns, rows, content, summarize)
+        return content
+
+    def _summary(self, columns, rows):
+        parts = []
+        for i, column in enumerate(columns):
+            values = [row[i] for row in rows if row[i] is not None]
+            if not values:
+                parts.append(f"{column} vacía")
+            elif all(isinstance(v, (int, float)) and not isinstance(v, bool) for v in values):
+                total = sum(values)
+                parts.append(
+                    f"{column} min={format_number(min(values))} max={format_number(max(values))} "
+                    f"suma={format_number(total)} prom={format_number(total / len(values))}"
+                )
+            else:
+                texts = [format_cell(v) for v in values]
+                if all(_DATETIME_RE.fullmatch(str(v)) or isinstance(v, date) for v in values):
+                    parts.append(f"{column} {min(texts)} … {max(texts)}")
+                else:
+                    parts.append(f"{column} {len(set(texts))} distintos")
+        return parts
+
+    def _record(self, columns, rows, content, summarize):
+        # Lo que costaba antes: lista de diccionarios en JSON
+        raw = json.dumps([dict(zip(columns, row)) for row in rows], ensure_ascii=False, default=str)
+        raw_tokens, shaped_tokens = estimate_tokens(raw), estimate_tokens(content)
+
+        with self._lock:
+            self.stats["queries"] += 1
+            self.stats["raw_tokens"] += raw_tokens
+            self.stats["shaped_tokens"] += shaped_tokens
+            self.stats["summarized"] += summarize
+
+        saved = 1 - shaped_tokens / raw_tokens if raw_tokens else 0
+        print(f"[IA] Resultado: ~{raw_tokens} -> ~{shaped_tokens} tokens ({saved:.0%} menos)")
+
+    def saved_tokens(self):
+        return self.stats["raw_tokens"] - self.stats["shaped_tokens"]
+
+
+result_shaper = ResultShaper()
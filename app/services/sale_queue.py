@@ -0,0 +1,114 @@
+"""
+Cola de ventas para mostrador con mucho movimiento.
+
+submit() regresa al instante con un Future; un hilo junta las ventas que
+lleguen en SALE_QUEUE_FLUSH_MS (hasta SALE_QUEUE_BATCH_SIZE) y las guarda
+en UNA transacción con sale_provider.save_many(). Cada venta conserva la
+hora en que se cobró, no la del commit.
+
+Si la transacción del grupo falla, se reintenta venta por venta para que
+una venta mala no tumbe a las demás. Las ventas encoladas ya se mostraron
+como cobradas, así que stop() espera sin límite de tiempo a que se guarde
+todo lo pendiente antes de cerrar.
+"""
+
+import queue
+import threading
+import time
+from concurrent.futures import Future
+
+from app.data.providers.sales import sale_provider
+from app.constants import mexico_now, SALE_QUEUE_BATCH_SIZE, SALE_QUEUE_FLUSH_MS
+
+
+class SaleQueue:
+
+    def __init__(self):
+        self._queue = queue.Queue()
+        self._thread = None
+        self._lock = threading.Lock()
+        self.stats = {"sales": 0, "transactions": 0, "failed": 0}
+
+    def submit(self, items, total, customer_id):
+        """Encola una venta; el Future trae el id de la venta o la excepción."""
+        future = Future()
+        sale = {
+            'items': [dict(item) for item in items],
+            'total': total,
+            'customer_id': customer_id,
+            'date': mexico_now(),
+        }
+        self._ensure_started()
+        self._queue.put((sale, future))
+        return future
+
+    def _ensure_started(self):
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="sale-queue", daemon=True)
+                self._thread.start()
+
+    def stop(self):
+        """Guarda todas las ventas encoladas; regresa cuando ya están en la DB."""
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread:
+            pending = self._queue.qsize()
+            if pending:
+                print(f"[Ventas] Guardando {pending} venta(s) pendiente(s) antes de cerrar")
+            self._queue.put(None)
+            thread.join()
+
+        # Lo que llegó después del aviso de cierre se guarda aquí mismo
+        leftover = []
+        while True:
+            try:
+                entry = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if entry is not None:
+                leftover.append(entry)
+        for start in range(0, len(leftover), SALE_QUEUE_BATCH_SIZE):
+            self._flush(leftover[start:start + SALE_QUEUE_BATCH_SIZE])
+
+    def _run(self):
+        stopping = False
+        while not stopping:
+            entry = self._queue.get()
+            if entry is None:
+                break
+
+            batch = [entry]
+            deadline = time.monotonic() + SALE_QUEUE_FLUSH_MS / 1000
+            while len(batch) < SALE_QUEUE_BATCH_SIZE:
+                try:
+                    entry = self._queue.get(timeout=max(deadline - time.monotonic(), 0))
+                except queue.Empty:
+                    break
+                if entry is None:
+                    stopping = True
+                    break
+                batch.append(entry)
+
+            self._flush(batch)
+
+    def _flush(self, batch):
+        ok, result = sale_provider.save_many([sale for sale, _ in batch])
+        self.stats["transactions"] += 1
+
+        if ok:
+            self.stats["sales"] += len(batch)
+            for (_, future), sale_id in zip(batch, result):
+                future.set_result(sale_id)
+            return
+
+        if len(batch) > 1:
+            for entry in batch:
+                self._flush([entry])
+            return
+
+        self.stats["failed"] += 1
+        batch[0][1].set_exception(RuntimeError(result))
+
+
+sale_queue = SaleQueue()
@@ -0,0 +1,150 @@
+"""
+Ejecutor en segundo plano para consultas a la DB.
+
+Las consultas corren en un pool de hilos acotado y el resultado se entrega
+en el hilo de Tkinter: los hilos solo dejan el resultado en una cola, y el
+event loop la vacía con root.after() (ver docs/EVENT_LOOP_TKINTER.md).
+
+Cada tarea pertenece a un widget ("owner"). Si el widget ya no existe o la
+tarea se canceló (cambio de vista, o una petición más nueva con la misma
+key), el resultado se descarta sin tocar la UI.
+"""
+
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from app.constants import TASK_RUNNER_MAX_WORKERS, TASK_RUNNER_POLL_MS
+
+
+class Task:
+
+    def __init__(self, owner, key, on_done, on_error):
+        self.owner = owner
+        self.owner_path = str(owner)
+        self.key = key
+        self.on_done = on_done
+        self.on_error = on_error
+        self.cancelled = False
+        self.future = None
+
+    def cancel(self):
+        self.cancelled = True
+        if self.future:
+            self.future.cancel()
+
+
+class TaskRunner:
+
+    def __init__(self, max_workers=TASK_RUNNER_MAX_WORKERS):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="db-worker")
+        self._results = queue.Queue()
+        self._lock = threading.Lock()
+        self._pending = set()
+        self._latest = {}
+        self._root = None
+
+    def start(self, root):
+        """Empieza a entregar resultados en el event loop de `root`."""
+        self._root = root
+        self._poll()
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def submit(self, owner, fn, *args, on_done=None, on_error=None, key=None, **kwargs):
+        """
+        Ejecuta fn(*args, **kwargs) en un hilo del pool.
+
+        on_done(result) / on_error(exception) se llaman en el hilo de Tkinter.
+        Con `key`, una nueva tarea del mismo owner cancela la anterior
+        (ej: cambiar de página rápido solo pinta la última).
+        """
+        task = Task(owner, key, on_done, on_error)
+
+        with self._lock:
+            if key is not None:
+                previous = self._latest.get((task.owner_path, key))
+                if previous:
+                    previous.cancel()
+                    self._pending.discard(previous)
+                self._latest[(task.owner_path, key)] = task
+            self._pending.add(task)
+
+        task.future = self._executor.submit(self._run, task, fn, args, kwargs)
+        return task
+
+    def post(self, fn, *args):
+        """
+        Llama fn(*args) en el hilo de Tkinter (se puede llamar desde cualquier hilo).
+
+        Lo que se publica antes de start() espera en la cola hasta el primer poll.
+        """
+        # Sin owner: se entrega a nombre de la raíz que haya al momento de entregar
+        task = Task(None, None, lambda _result: fn(*args), None)
+        self._results.put((task, None, None))
+
+    def cancel_for(self, widget):
+        """Cancela las tareas del widget y de todos sus hijos."""
+        if widget is None:
+            return
+
+        path = str(widget)
+        with self._lock:
+            for task in list(self._pending):
+                if task.owner_path == path or task.owner_path.startswith(path + "."):
+                    task.cancel()
+                    self._forget(task)
+
+    # --- Internos ---
+
+    def _run(self, task, fn, args, kwargs):
+        if task.cancelled:
+            return
+        try:
+            self._results.put((task, fn(*args, **kwargs), None))
+        except Exception as e:
+            self._results.put((task, None, e))
+
+    def _forget(self, task):
+        self._pending.discard(task)
+        if task.key is not None and self._latest.get((task.owner_path, task.key)) is task:
+            del self._latest[(task.owner_path, task.key)]
+
+    def _poll(self):
+        try:
+            while True:
+                task, result, error = self._results.get_nowait()
+                self._deliver(task, result, error)
+        except queue.Empty:
+            pass
+        finally:
+            self._root.after(TASK_RUNNER_POLL_MS, self._poll)
+
+    def _deliver(self, task, result, error):
+        with self._lock:
+            self._forget(task)
+
+        if task.cancelled:
+            return
+
+        owner = task.owner if task.owner is not None else self._root
+        try:
+            if not owner.winfo_exists():
+                return
+        except Exception:
+            return
+
+        try:
+            if error is not None:
+                if task.on_error:
+                    task.on_error(error)
+                else:
+                    print(f"[TaskRunner] Error en tarea de {task.owner_path}: {error}")
+            elif task.on_done:
+                task.on_done(result)
+        except Exception as e:
+            print(f"[TaskRunner] Error entregando resultado a {task.owner_path}: {e}")
+
+
+task_runner = TaskRunner()
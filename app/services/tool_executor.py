@@ -0,0 +1,79 @@
+"""
+Ejecución en paralelo de las herramientas que pide el asistente en un turno.
+
+Cuando Claude regresa varios bloques tool_use en una misma respuesta son
+independientes entre sí: se ejecutan a la vez en un pool del tamaño del
+engine de solo lectura (AI_SQL_POOL_SIZE), así ningún hilo espera conexión.
+
+Todo el turno tiene una fecha límite (AI_TOOL_TURN_BUDGET_S): cada llamada
+recibe como presupuesto lo que le queda al turno, y las que no terminan a
+tiempo regresan sin resultado. Los resultados salen en el mismo orden que
+los bloques, con su tiempo en ms.
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+
+from app.constants import AI_SQL_POOL_SIZE, AI_TOOL_TURN_BUDGET_S
+
+
+# Margen para que SQLite interrumpa la consulta al llegar a la fecha límite
+_INTERRUPT_GRACE_S = 0.5
+
+
+class ToolExecutor:
+
+    def __init__(self, max_workers=AI_SQL_POOL_SIZE):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="ai-tool")
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def run(self, calls, turn_budget_s=AI_TOOL_TURN_BUDGET_S, on_done=None):
+        """
+        calls: lista de (tool_use_id, fn); fn(budget_s) recibe los segundos
+        que le quedan al turno.
+
+        Regresa [(tool_use_id, result, elapsed_ms)] en el orden de calls;
+        result es None si la llamada no terminó a tiempo. on_done(tool_use_id,
+        elapsed_ms) se llama desde el hilo de cada llamada al terminar.
+        """
+        deadline = time.monotonic() + turn_budget_s
+        submitted = time.perf_counter()
+        lock = threading.Lock()
+        timings = {}
+
+        def run_one(tool_use_id, fn):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+
+            started = time.perf_counter()
+            result = fn(remaining)
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            with lock:
+                timings[tool_use_id] = elapsed_ms
+            if on_done:
+                on_done(tool_use_id, elapsed_ms)
+            return result
+
+        futures = [self._executor.submit(run_one, tool_use_id, fn) for tool_use_id, fn in calls]
+        wait(futures, timeout=max(deadline - time.monotonic(), 0) + _INTERRUPT_GRACE_S)
+
+        results = []
+        for (tool_use_id, _fn), future in zip(calls, futures):
+            if future.done() and not future.cancelled():
+                result = future.result()
+            else:
+                # Sigue corriendo (o ni empezó): su resultado ya no se espera
+                future.cancel()
+                result = None
+
+            with lock:
+                elapsed_ms = timings.get(tool_use_id, (time.perf_counter() - submitted) * 1000)
+            results.append((tool_use_id, result, elapsed_ms))
+        return results
+
+
+tool_executor = ToolExecutor()
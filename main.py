@@ -5,8 +5,17 @@ from app.gui.navigation import Navigation
 from app.data.providers.inventory import inventory_provider
 from app.data.providers.customers import customer_provider
 from app.data.providers.supplies import supply_provider
+from app.data.providers.rollups import rollup_provider
 from app.services.firestore_listener import firestore_listener
+from app.services.firestore_service import firestore_service
+from app.services.firestore_outbox import firestore_outbox
+from app.services.task_runner import task_runner
+from app.services.sale_queue import sale_queue
+from app.services.tool_executor import tool_executor
 from app.bootstrap import init
+from app.data.database import engine
+from app.data.sqlite_tuning import checkpoint
+from app.data.readonly_db import readonly_engine
 
 
 class TortilleriaApp:
@@ -30,11 +39,17 @@ class TortilleriaApp:
         self.content_container = ttk.Frame(main_container)
         self.content_container.pack(side=LEFT, fill=BOTH, expand=YES)
 
+        # Resultados de consultas en segundo plano
+        task_runner.start(root)
+
         # Default View Products
         self.navigation.change_view("sales")
 
         firestore_listener.start(self)
 
+        # Envío a Firestore de lo pendiente en el outbox
+        firestore_outbox.start(firestore_service)
+
 
 def main():
 
@@ -50,9 +65,20 @@ def main():
     # Initialize default supplies (Luz CFE, GAS NIETO)
     supply_provider.ensure_default_supplies()
 
+    # Fill daily rollups on databases created before they existed
+    rollup_provider.ensure_built()
+
     root = ttk.Window(themename="flatly")
     TortilleriaApp(root)
     root.mainloop()
+    sale_queue.stop()
+    task_runner.shutdown()
+    tool_executor.shutdown()
+    firestore_outbox.stop()
+
+    # Dejar la DB completa en un solo archivo (vaciar el -wal)
+    readonly_engine.dispose()
+    checkpoint(engine)
 
 
 if __name__ == "__main__":
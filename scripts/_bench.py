@@ -0,0 +1,63 @@
+"""
+Utilidades comunes de los benchmarks de scripts/.
+
+Cada benchmark trabaja en una carpeta temporal: se cambia a ella ANTES de
+importar la app (database.py y readonly_db.py toman la ruta de la DB del
+directorio actual), así nunca se toca tortilleria.db.
+
+Uso desde un script:
+    import _bench
+    tmp = _bench.use_temp_dir()
+    _bench.seed_database()          # opcional: datos de seed_data.py
+"""
+
+import atexit
+import contextlib
+import io
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def use_temp_dir(prefix="tortilleria-bench-"):
+    """Cambia a una carpeta temporal nueva (se borra al salir) y deja la raíz del repo en sys.path."""
+    tmp = tempfile.mkdtemp(prefix=prefix)
+    os.chdir(tmp)
+    atexit.register(shutil.rmtree, tmp, ignore_errors=True)
+    if ROOT not in sys.path:
+        sys.path.insert(0, ROOT)
+    return tmp
+
+
+def create_schema():
+    from app.data.database import Base, engine
+    import app.models  # noqa: F401
+    Base.metadata.create_all(bind=engine)
+
+
+def seed_database():
+    """Crea las tablas y carga los 6 meses de seed_data.py (sin su salida)."""
+    create_schema()
+    import seed_data
+    with contextlib.redirect_stdout(io.StringIO()):
+        seed_data.main()
+
+
+def mean_ms(fn, repeat=20):
+    """Tiempo promedio de fn() en ms."""
+    started = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - started) / repeat * 1000
+
+
+def table(headers, rows):
+    """Imprime una tabla alineada en texto."""
+    widths = [max(len(str(v)) for v in column) for column in zip(headers, *rows)]
+    for row in [headers, *rows]:
+        print("  ".join(str(v).ljust(w) for v, w in zip(row, widths)).rstrip())
@@ -0,0 +1,210 @@
+"""
+Doble de widgets de ttkbootstrap para los benchmarks de la GUI.
+
+Aquí no hay servidor X, así que los benchmarks de vistas no pueden crear
+widgets reales. install() pone este módulo en sys.modules["ttkbootstrap"]
+(las constantes son las de ttkbootstrap) ANTES de importar la vista; los
+widgets no dibujan nada, solo cuentan lo que costaría en Tk:
+
+    ops["create"]     widgets creados
+    ops["destroy"]    widgets destruidos
+    ops["config"]     configure / pack_configure
+    ops["tk_calls"]   llamadas a Treeview (column, heading, insert, move)
+
+Los tiempos medidos con este doble son solo del lado de Python.
+"""
+
+import sys
+
+
+ops = {"create": 0, "destroy": 0, "config": 0, "tk_calls": 0}
+_idle = []
+
+
+def reset():
+    for key in ops:
+        ops[key] = 0
+
+
+def run_idle():
+    """Corre los after_idle pendientes, como lo haría el event loop."""
+    while _idle:
+        _idle.pop(0)()
+
+
+class Widget:
+    def __init__(self, master=None, **kwargs):
+        self.master = master
+        self.kw = kwargs
+        self.children_ = []
+        if isinstance(master, Widget):
+            master.children_.append(self)
+        ops["create"] += 1
+
+    def pack(self, **kwargs):
+        pass
+
+    def pack_forget(self):
+        pass
+
+    def pack_configure(self, **kwargs):
+        ops["config"] += 1
+
+    def configure(self, **kwargs):
+        ops["config"] += 1
+        self.kw.update(kwargs)
+
+    config = configure
+
+    def bind(self, *args, **kwargs):
+        pass
+
+    def bind_all(self, *args, **kwargs):
+        pass
+
+    def unbind_all(self, *args):
+        pass
+
+    def after_idle(self, fn):
+        _idle.append(fn)
+        return len(_idle)
+
+    def winfo_children(self):
+        return list(self.children_)
+
+    def winfo_exists(self):
+        return True
+
+    def destroy(self):
+        for child in list(self.children_):
+            child.destroy()
+        ops["destroy"] += 1
+        if isinstance(self.master, Widget) and self in self.master.children_:
+            self.master.children_.remove(self)
+
+    def __str__(self):
+        return f".w{id(self)}"
+
+
+class Frame(Widget):
+    pass
+
+
+class Label(Widget):
+    pass
+
+
+class Labelframe(Widget):
+    pass
+
+
+class Button(Widget):
+    pass
+
+
+class Entry(Widget):
+    pass
+
+
+class Separator(Widget):
+    pass
+
+
+class Scrollbar(Widget):
+    def set(self, *args):
+        pass
+
+
+class Canvas(Widget):
+    """Canvas con scroll simulado: scroll_to(top) mueve la vista y avisa como Tk."""
+
+    def __init__(self, master=None, **kwargs):
+        super().__init__(master, **kwargs)
+        self.items = {}
+        self.top = 0
+        self.height = 700
+        self._yscroll = None
+
+    def configure(self, **kwargs):
+        super().configure(**kwargs)
+        if "yscrollcommand" in kwargs:
+            self._yscroll = kwargs["yscrollcommand"]
+
+    config = configure
+
+    def create_window(self, x, y, **kwargs):
+        item = len(self.items) + 1
+        self.items[item] = dict(kwargs, x=x, y=y)
+        return item
+
+    def coords(self, item, x, y):
+        self.items[item].update(x=x, y=y)
+
+    def itemconfigure(self, item, **kwargs):
+        self.items[item].update(kwargs)
+
+    itemconfig = itemconfigure
+
+    def bbox(self, *args):
+        return None
+
+    def canvasy(self, y):
+        return self.top + y
+
+    def winfo_height(self):
+        return self.height
+
+    def yview(self, *args):
+        pass
+
+    def yview_moveto(self, fraction):
+        self.scroll_to(0)
+
+    def scroll_to(self, top):
+        self.top = top
+        if self._yscroll:
+            self._yscroll(0, 1)
+
+
+class Treeview(Widget):
+    def __init__(self, master=None, **kwargs):
+        super().__init__(master, **kwargs)
+        self.items = []
+        self.columns = {}
+
+    def column(self, column, **kwargs):
+        ops["tk_calls"] += 1
+        self.columns[column] = kwargs
+
+    def heading(self, column, **kwargs):
+        ops["tk_calls"] += 1
+
+    def insert(self, parent, index, iid=None, values=()):
+        ops["tk_calls"] += 1
+        self.items.append(iid)
+        return iid
+
+    def move(self, iid, parent, index):
+        ops["tk_calls"] += 1
+        self.items.remove(iid)
+        self.items.insert(index, iid)
+
+    def yview(self, *args):
+        pass
+
+
+class _Font:
+    def measure(self, text):
+        return 7 * len(text)
+
+
+def install():
+    """Reemplaza ttkbootstrap (y nametofont) por este doble; llamar antes de importar vistas."""
+    import ttkbootstrap.constants as constants
+    from tkinter import font
+
+    module = sys.modules[__name__]
+    module.constants = constants
+    sys.modules["ttkbootstrap"] = module
+    font.nametofont = lambda name: _Font()
+    return module
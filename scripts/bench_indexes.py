@@ -0,0 +1,119 @@
+"""
+Benchmark de los índices de fechas y llaves foráneas (revisión 3b9d6f1c2a47).
+
+Arma dos DB temporales con el esquema de los modelos y los mismos datos
+sintéticos (por defecto 1M ventas, 2M renglones de detalle y 200k
+pedidos), una sin los índices de esa revisión y otra con ellos, y mide las
+consultas de los providers que los usan.
+
+Uso: python scripts/bench_indexes.py [--sales 1000000] [--repeat 20]
+"""
+
+import argparse
+import os
+import random
+import sqlite3
+from datetime import datetime, timedelta
+
+import _bench
+
+
+# Índices que agregó la revisión 3b9d6f1c2a47
+QUERY_INDEXES = (
+    "ix_cash_cuts_closed_at", "ix_order_details_order_id", "ix_order_refunds_order_id",
+    "ix_orders_customer_id_date", "ix_orders_date", "ix_orders_status_completed_at",
+    "ix_sales_date", "ix_sales_detail_sale_id",
+    "ix_supply_purchases_supplier_id", "ix_supply_purchases_supply_id_purchase_date",
+)
+
+QUERIES = {
+    "get_today sales range": (
+        "SELECT COUNT(id), COALESCE(SUM(total), 0) FROM sales WHERE date >= ? AND date < ?",
+        ("2025-06-01 00:00:00", "2025-06-02 00:00:00"),
+    ),
+    "sales page, date filter + ORDER BY": (
+        "SELECT id, date, total FROM sales WHERE date >= ? AND date < ? ORDER BY date DESC LIMIT 40",
+        ("2025-05-01", "2025-06-01"),
+    ),
+    "cash cut completed orders today": (
+        "SELECT COUNT(id), COALESCE(SUM(total), 0) FROM orders "
+        "WHERE status = 'completado' AND completed_at >= ? AND completed_at < ?",
+        ("2025-06-01", "2025-06-02"),
+    ),
+    "sale detail lines by sale_id": (
+        "SELECT * FROM sales_detail WHERE sale_id = ?",
+        (500000,),
+    ),
+    "orders by customer, newest first": (
+        "SELECT id, date FROM orders WHERE customer_id = ? ORDER BY date DESC",
+        (7,),
+    ),
+}
+
+
+def build(path, sales, with_indexes):
+    from sqlalchemy.dialects import sqlite
+    from sqlalchemy.schema import CreateIndex, CreateTable
+    from app.data.database import Base
+    import app.models  # noqa: F401
+
+    dialect = sqlite.dialect()
+    connection = sqlite3.connect(path)
+    for table in Base.metadata.sorted_tables:
+        connection.execute(str(CreateTable(table).compile(dialect=dialect)))
+        for index in table.indexes:
+            if with_indexes or index.name not in QUERY_INDEXES:
+                connection.execute(str(CreateIndex(index).compile(dialect=dialect)))
+
+    random.seed(1)
+    start = datetime(2024, 1, 1)
+    orders = sales // 5
+    connection.execute("INSERT INTO customers (id, customer_name) VALUES (1, 'Mostrador')")
+    connection.executemany(
+        "INSERT INTO sales (id, date, total, customer_id) VALUES (?, ?, ?, 1)",
+        ((i, (start + timedelta(minutes=i)).isoformat(" "), random.random() * 200) for i in range(1, sales + 1))
+    )
+    connection.executemany(
+        "INSERT INTO sales_detail (sale_id, product_id, quantity, unit_price, subtotal) VALUES (?, 1, 1, 20, 20)",
+        ((random.randint(1, sales),) for _ in range(2 * sales))
+    )
+
+    def order(i):
+        date = start + timedelta(minutes=10 * i)
+        status = random.choice(["pendiente", "completado", "cancelado"])
+        completed_at = (date + timedelta(hours=1)).isoformat(" ") if status == "completado" else None
+        return i, date.isoformat(" "), random.randint(1, 50), status, completed_at
+
+    connection.executemany(
+        "INSERT INTO orders (id, date, total, customer_id, status, completed_at) VALUES (?, ?, 100, ?, ?, ?)",
+        (order(i) for i in range(1, orders + 1))
+    )
+    connection.commit()
+    connection.execute("ANALYZE")
+    connection.commit()
+    return connection
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sales", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    tmp = _bench.use_temp_dir()
+    print(f"{args.sales} ventas, {2 * args.sales} renglones, {args.sales // 5} pedidos; promedio de {args.repeat}")
+
+    results = {}
+    for label, with_indexes in (("antes", False), ("después", True)):
+        connection = build(os.path.join(tmp, f"{label}.db"), args.sales, with_indexes)
+        for name, (sql, params) in QUERIES.items():
+            plan = " | ".join(row[-1] for row in connection.execute("EXPLAIN QUERY PLAN " + sql, params))
+            ms = _bench.mean_ms(lambda: connection.execute(sql, params).fetchall(), args.repeat)
+            results.setdefault(name, []).append(f"{ms:.2f} ms ({plan})")
+        connection.close()
+
+    _bench.table(["consulta", "antes", "después"], [[name, *values] for name, values in results.items()])
+
+
+if __name__ == "__main__":
+    main()
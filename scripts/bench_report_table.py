@@ -0,0 +1,107 @@
+"""
+Benchmark de las tablas de reportes: BaseReportTab.create_table antes (un
+Frame por renglón y un Label por celda) contra ReportTable (un solo
+Treeview).
+
+Sin servidor X los widgets son el doble de _fake_tk.py: se cuentan widgets
+y llamadas al Treeview y el tiempo es solo del lado de Python. La versión
+anterior de report_base se lee del historial de git (OLD_REVISION).
+
+También revisa el orden de ReportTable: los montos se ordenan como número
+(ascendente y descendente) y una columna con tipos mezclados no truena.
+
+Uso: python scripts/bench_report_table.py [--sizes 15 300 2000]
+"""
+
+import argparse
+import random
+import subprocess
+import time
+import types
+
+import _bench
+import _fake_tk
+
+
+REPORT_BASE = "app/gui/reports/components/report_base.py"
+OLD_REVISION = "817c0c5^"
+
+COLUMNS = [
+    {"text": "#", "width": 50},
+    {"text": "Cliente", "stretch": True},
+    {"text": "Categoria", "width": 120},
+    {"text": "Pedidos", "width": 90},
+    {"text": "Total", "width": 140},
+]
+HEADERS = [("#", 5), ("Cliente", 25), ("Categoria", 12), ("Pedidos", 8), ("Total", 12)]
+MONEY_COLS = {4}
+
+
+def load_old():
+    source = subprocess.run(
+        ["git", "show", f"{OLD_REVISION}:{REPORT_BASE}"],
+        cwd=_bench.ROOT, capture_output=True, text=True, check=True
+    ).stdout
+    module = types.ModuleType("report_base_old")
+    exec(compile(source, f"{OLD_REVISION}:{REPORT_BASE}", "exec"), module.__dict__)
+    return module
+
+
+def timed(fn):
+    _fake_tk.reset()
+    parent = _fake_tk.Frame()
+    started = time.perf_counter()
+    result = fn(parent)
+    elapsed = (time.perf_counter() - started) * 1000
+    # Sin contar el Frame padre
+    return result, elapsed, _fake_tk.ops["create"] - 1, _fake_tk.ops["tk_calls"]
+
+
+def check_sort(table, rows):
+    totals = sorted(row[4] for row in rows)
+
+    table.sort_by(4)
+    assert [table.rows[int(iid)][4] for iid in table.view.items] == totals
+    table.sort_by(4)
+    assert [table.rows[int(iid)][4] for iid in table.view.items] == totals[::-1]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[15, 300, 2000])
+    args = parser.parse_args()
+
+    _bench.use_temp_dir()
+    _fake_tk.install()
+    from app.gui.components.report_table import ReportTable
+    old_create_table = load_old().BaseReportTab.create_table
+
+    random.seed(1)
+    results = []
+    for n in args.sizes:
+        rows = [
+            [i + 1, f"Cliente {i}", "Mayoreo", random.randint(1, 90), random.random() * 10000]
+            for i in range(n)
+        ]
+        old_rows = [row[:4] + [f"${row[4]:,.2f}"] for row in rows]
+
+        _, old_ms, old_widgets, _ = timed(lambda parent: old_create_table(None, parent, HEADERS, old_rows, MONEY_COLS))
+        table, new_ms, new_widgets, calls = timed(lambda parent: ReportTable(parent, COLUMNS, rows, money_cols=MONEY_COLS))
+
+        check_sort(table, rows)
+
+        results.append([n, old_widgets, f"{old_ms:.2f}", new_widgets, calls, f"{new_ms:.2f}"])
+
+    print(f"Tabla de {len(COLUMNS)} columnas (widgets de _fake_tk)")
+    _bench.table(
+        ["renglones", "antes widgets", "antes ms", "ReportTable widgets", "llamadas Treeview", "ms"],
+        results
+    )
+
+    mixed = ReportTable(_fake_tk.Frame(), [{"text": "a"}], [[1], ["N/A"], [None], [3]])
+    mixed.sort_by(0)
+    print("Montos ordenados como número; columna con tipos mezclados:", [mixed._display[int(i)][0] for i in mixed.view.items])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""
+Benchmark del guardado de ventas: save() con ORM (como era antes), save()
+con INSERT en bloque y la cola agrupada (sale_queue).
+
+Usa una DB temporal cargada con seed_data.py y guarda --carts carritos de 4
+productos con cada método. Al final revisa que save_many() guarde los
+renglones de cada venta en su venta.
+
+Uso: python scripts/bench_sale_save.py [--carts 2000]
+"""
+
+import argparse
+import random
+import time
+
+import _bench
+
+
+def orm_save(items, total, customer_id):
+    """SaleProvider.save antes del INSERT en bloque: un objeto ORM por renglón."""
+    from app.constants import ROLLUP_CHANNEL_SALE
+    from app.data.database import get_db
+    from app.data.providers.rollups import rollup_provider
+    from app.models import Sale, SaleDetail
+
+    db = get_db()
+    try:
+        sale = Sale(total=total, customer_id=customer_id)
+        db.add(sale)
+        db.flush()
+        for item in items:
+            db.add(SaleDetail(
+                sale_id=sale.id, product_id=item['id'], quantity=item['quantity'],
+                unit_price=item['price'], subtotal=item['subtotal']
+            ))
+        rollup_provider.record(
+            db, ROLLUP_CHANNEL_SALE, sale.date, total,
+            [(item['id'], item['quantity'], item['subtotal']) for item in items]
+        )
+        db.commit()
+        return True, sale.id
+    finally:
+        db.close()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--carts", type=int, default=2000)
+    args = parser.parse_args()
+
+    _bench.use_temp_dir()
+    _bench.seed_database()
+
+    from app.data.database import get_db
+    from app.data.providers.customers import customer_provider
+    from app.data.providers.sales import sale_provider
+    from app.models import Product, Sale, SaleDetail
+    from app.services.sale_queue import SaleQueue
+
+    db = get_db()
+    product_ids = [product_id for (product_id,) in db.query(Product.id)]
+    db.close()
+    customer_id = customer_provider.get_all()[0].id
+
+    random.seed(1)
+    carts = []
+    for _ in range(args.carts):
+        items = []
+        for product_id in random.sample(product_ids, min(4, len(product_ids))):
+            quantity = random.randint(1, 3)
+            items.append({'id': product_id, 'quantity': quantity, 'price': 20.0, 'subtotal': 20.0 * quantity})
+        carts.append((items, sum(item['subtotal'] for item in items)))
+
+    def queued():
+        sale_queue = SaleQueue()
+        futures = [sale_queue.submit(items, total, customer_id) for items, total in carts]
+        sale_queue.stop()
+        for future in futures:
+            future.result()
+        return sale_queue.stats["transactions"]
+
+    rows = []
+    for name, fn in (
+        ("save() con ORM (antes)", lambda: [orm_save(items, total, customer_id) for items, total in carts]),
+        ("save() en bloque", lambda: [sale_provider.save(items, total, customer_id) for items, total in carts]),
+        ("cola agrupada", queued),
+    ):
+        started = time.perf_counter()
+        result = fn()
+        elapsed = time.perf_counter() - started
+        transactions = result if isinstance(result, int) else len(result)
+        rows.append([name, f"{args.carts / elapsed:.0f}", f"{elapsed * 1000 / args.carts:.2f}", transactions])
+
+    print(f"{args.carts} carritos de 4 productos sobre la DB de seed_data.py")
+    _bench.table(["método", "ventas/s", "ms/venta", "transacciones"], rows)
+
+    # Cada venta de save_many conserva sus renglones
+    ok, sale_ids = sale_provider.save_many([{'items': items, 'total': total, 'customer_id': customer_id} for items, total in carts[:3]])
+    assert ok
+    db = get_db()
+    for sale_id, (items, total) in zip(sale_ids, carts[:3]):
+        lines = db.query(SaleDetail.product_id, SaleDetail.quantity).filter(SaleDetail.sale_id == sale_id).all()
+        assert sorted(lines) == sorted((item['id'], item['quantity']) for item in items)
+        assert db.get(Sale, sale_id).total == total
+    db.close()
+    print("save_many: renglones y totales correctos")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+"""
+Benchmark del carrito del punto de venta: ShoppingCar.refresh_shopping_car
+antes (destruye y vuelve a crear todos los renglones) y ahora (un renglón
+por producto, solo se reconfiguran las etiquetas que cambiaron).
+
+Sin servidor X los widgets son el doble de _fake_tk.py: se cuentan widgets
+creados / destruidos / configurados por operación y el tiempo es solo del
+lado de Python. La versión anterior se lee del historial de git
+(OLD_REVISION).
+
+Con un carrito de 40 productos se hacen --ops operaciones al azar (agregar,
+sumar uno, restar uno). Al final las dos versiones deben dejar el mismo
+carrito y los renglones nuevos deben mostrar las cantidades correctas.
+
+Uso: python scripts/bench_shopping_car.py [--ops 200]
+"""
+
+import argparse
+import random
+import subprocess
+import time
+import types
+
+import _bench
+import _fake_tk
+
+
+SHOPPING_CAR = "app/gui/sales/pos/sales/shopping_car.py"
+OLD_REVISION = "c67d34c^"
+CART_SIZE = 40
+
+
+class Content:
+    """Lo que ShoppingCar usa de la vista de ventas."""
+
+    def __init__(self):
+        self.shopping_cart = []
+        self.car = None
+
+    def charge(self):
+        pass
+
+    def clean_shopping_car(self):
+        pass
+
+    def get_total(self):
+        return sum(item['subtotal'] for item in self.shopping_cart)
+
+    def delete_product_from_car(self, index):
+        self.shopping_cart.pop(index)
+        self.car.refresh_shopping_car()
+
+
+def load_old():
+    source = subprocess.run(
+        ["git", "show", f"{OLD_REVISION}:{SHOPPING_CAR}"],
+        cwd=_bench.ROOT, capture_output=True, text=True, check=True
+    ).stdout
+    module = types.ModuleType("shopping_car_old")
+    exec(compile(source, f"{OLD_REVISION}:{SHOPPING_CAR}", "exec"), module.__dict__)
+    return module
+
+
+def line(product):
+    return {'id': product['id'], 'name': product['name'], 'price': product['price'], 'quantity': 1, 'subtotal': product['price']}
+
+
+def drive(module, ops_count):
+    random.seed(1)
+    content = Content()
+    car = content.car = module.ShoppingCar(None, None, content)
+    _fake_tk.run_idle()
+
+    products = [{'id': i, 'name': f"Producto {i}", 'price': 10.0 + i} for i in range(60)]
+    content.shopping_cart.extend(line(product) for product in products[:CART_SIZE])
+    car.refresh_shopping_car()
+    _fake_tk.run_idle()
+
+    _fake_tk.reset()
+    started = time.perf_counter()
+    for n in range(ops_count):
+        product = random.choice(products)
+        found = next((item for item in content.shopping_cart if item['id'] == product['id']), None)
+
+        if found is None:
+            content.shopping_cart.append(line(product))
+        elif n % 3 == 2:
+            found['quantity'] -= 1
+            if found['quantity'] <= 0:
+                content.shopping_cart.remove(found)
+            else:
+                found['subtotal'] = found['quantity'] * found['price']
+        else:
+            found['quantity'] += 1
+            found['subtotal'] = found['quantity'] * found['price']
+
+        car.refresh_shopping_car()
+        _fake_tk.run_idle()
+    elapsed = time.perf_counter() - started
+
+    state = [(item['id'], item['quantity']) for item in content.shopping_cart]
+    return elapsed, dict(_fake_tk.ops), state, car
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--ops", type=int, default=200)
+    args = parser.parse_args()
+
+    _bench.use_temp_dir()
+    _fake_tk.install()
+    from app.gui.sales.pos.sales import shopping_car
+
+    results = {}
+    rows = []
+    for name, module in (("antes (reconstruye)", load_old()), ("ahora (por renglón)", shopping_car)):
+        elapsed, ops, state, car = drive(module, args.ops)
+        results[name] = (state, car)
+        rows.append([
+            name,
+            f"{elapsed * 1e6 / args.ops:.1f}",
+            f"{ops['create'] / args.ops:.1f}",
+            f"{ops['destroy'] / args.ops:.1f}",
+            f"{ops['config'] / args.ops:.1f}",
+        ])
+
+    print(f"Carrito de {CART_SIZE} productos, {args.ops} operaciones al azar (widgets de _fake_tk)")
+    _bench.table(["versión", "us/op", "creados/op", "destruidos/op", "configurados/op"], rows)
+
+    (old_state, _), (new_state, car) = results.values()
+    assert old_state == new_state
+    assert list(car.lines) == [product_id for product_id, _ in new_state]
+    for product_id, quantity in new_state:
+        assert car.lines[product_id]['values']['quantity'] == quantity
+    print(f"Mismo carrito final ({len(new_state)} renglones) y cantidades correctas en cada renglón")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+Benchmark de la validación de SQL del asistente: la lista de palabras
+peligrosas (como era antes) contra el authorizer de SQLite con LRU
+(DatabaseTool.validate_sql).
+
+Usa una DB temporal cargada con seed_data.py y las consultas de
+tests/sql_fuzz.py (válidas e inválidas, con repeticiones como las del
+asistente). Por método: latencia p50 / p99, falsos aceptados y falsos
+rechazados. Al final el costo de un acierto del LRU.
+
+Uso: python scripts/bench_sql_validate.py [--valid 3000] [--invalid 1000]
+"""
+
+import argparse
+import contextlib
+import io
+import re
+import time
+
+import _bench
+
+
+# Lista que usaba validate_sql antes del authorizer
+DANGEROUS_KEYWORDS = [
+    "DROP", "DELETE", "INSERT", "UPDATE", "ALTER",
+    "CREATE", "TRUNCATE", "EXEC", "EXECUTE",
+    "--", ";--", "/*", "*/", "UNION"
+]
+
+
+def keyword_validate(sql):
+    """validate_sql antes del authorizer: prefijo SELECT y lista de palabras."""
+    sql_upper = sql.upper().strip()
+    if not sql_upper.startswith('SELECT'):
+        return False
+    for keyword in DANGEROUS_KEYWORDS:
+        if keyword.isalpha():
+            if re.search(r'\b' + keyword + r'\b', sql_upper):
+                return False
+        elif keyword in sql_upper:
+            return False
+    return 'FROM' in sql_upper
+
+
+def run(queries, check):
+    latencies = []
+    false_accept = false_reject = 0
+    for sql, ok in queries:
+        started = time.perf_counter()
+        accepted = check(sql)
+        latencies.append((time.perf_counter() - started) * 1e6)
+        false_accept += accepted and not ok
+        false_reject += ok and not accepted
+
+    latencies.sort()
+    return [
+        f"{latencies[len(latencies) // 2]:.1f}",
+        f"{latencies[int(len(latencies) * 0.99)]:.1f}",
+        f"{sum(latencies) / 1000:.0f}",
+        false_accept,
+        false_reject,
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--valid", type=int, default=3000)
+    parser.add_argument("--invalid", type=int, default=1000)
+    args = parser.parse_args()
+
+    _bench.use_temp_dir()
+    _bench.seed_database()
+
+    from app.services.db_tool import DatabaseTool
+    from tests.sql_fuzz import SqlFuzzer
+
+    queries = SqlFuzzer(seed=20).mix(valid=args.valid, invalid=args.invalid)
+    tool = DatabaseTool()
+
+    def authorizer_validate(sql):
+        with contextlib.redirect_stdout(io.StringIO()):
+            return tool.validate_sql(sql)[0]
+
+    rows = [
+        ["palabras (antes)"] + run(queries, keyword_validate),
+        ["authorizer + LRU"] + run(queries, authorizer_validate),
+    ]
+
+    print(f"{len(queries)} consultas ({args.valid} válidas, {args.invalid} inválidas, con repeticiones)")
+    _bench.table(["método", "p50 us", "p99 us", "total ms", "falsos aceptados", "falsos rechazados"], rows)
+
+    hits, misses = tool.stats["validated_hits"], tool.stats["validated_misses"]
+    print(f"LRU: {hits} aciertos / {hits + misses} ({hits / (hits + misses):.0%})")
+
+    sql = next(sql for sql, ok in queries if ok)
+    print(f"acierto del LRU: {_bench.mean_ms(lambda: tool.validate_sql(sql), repeat=10000) * 1000:.2f} us")
+
+
+if __name__ == "__main__":
+    main()
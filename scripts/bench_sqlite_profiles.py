@@ -0,0 +1,112 @@
+"""
+Benchmark de los perfiles de PRAGMAs de SQLite (DB_TUNING_PROFILES).
+
+Para cada perfil (y la configuración por defecto de SQLite como base) arma
+una DB temporal con --sales ventas y durante --seconds segundos corre un
+hilo que cobra como SaleProvider.save (venta + 3 renglones por commit)
+junto con 3 hilos que leen el COUNT/AVG de los reportes. Imprime cobros y
+lecturas por segundo.
+
+Uso: python scripts/bench_sqlite_profiles.py [--sales 300000] [--seconds 6]
+"""
+
+import argparse
+import os
+import random
+import threading
+import time
+from datetime import datetime, timedelta
+
+import _bench
+
+
+def run(path, profile, sales, seconds):
+    from sqlalchemy import create_engine, func
+    from sqlalchemy.orm import sessionmaker
+    from app.data.database import Base
+    from app.data.sqlite_tuning import apply_sqlite_tuning, checkpoint
+    from app.models import Sale, SaleDetail
+
+    engine = create_engine(f"sqlite:///{path}", connect_args={"check_same_thread": False, "timeout": 30})
+    if profile:
+        apply_sqlite_tuning(engine, profile)
+    Base.metadata.create_all(engine)
+
+    start = datetime(2025, 1, 1)
+    with engine.begin() as connection:
+        connection.exec_driver_sql("INSERT INTO customers (id, customer_name) VALUES (1, 'Mostrador')")
+        connection.exec_driver_sql(
+            "INSERT INTO sales (date, total, customer_id) VALUES (?, ?, 1)",
+            [((start + timedelta(minutes=i)).isoformat(" "), random.random() * 100) for i in range(sales)]
+        )
+
+    Session = sessionmaker(bind=engine)
+    stop = time.perf_counter() + seconds
+    counts = {"checkouts": 0, "reads": 0, "errors": 0}
+
+    def writer():
+        while time.perf_counter() < stop:
+            db = Session()
+            try:
+                sale = Sale(total=60, customer_id=1)
+                db.add(sale)
+                db.flush()
+                for _ in range(3):
+                    db.add(SaleDetail(sale_id=sale.id, product_id=1, quantity=1, unit_price=20, subtotal=20))
+                db.commit()
+                counts["checkouts"] += 1
+            except Exception:
+                db.rollback()
+                counts["errors"] += 1
+            finally:
+                db.close()
+
+    def reader():
+        while time.perf_counter() < stop:
+            db = Session()
+            try:
+                db.query(func.count(Sale.id), func.avg(Sale.total)).first()
+                counts["reads"] += 1
+            except Exception:
+                counts["errors"] += 1
+            finally:
+                db.close()
+
+    threads = [threading.Thread(target=writer)] + [threading.Thread(target=reader) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    if profile:
+        checkpoint(engine)
+    engine.dispose()
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sales", type=int, default=300_000)
+    parser.add_argument("--seconds", type=float, default=6)
+    args = parser.parse_args()
+
+    tmp = _bench.use_temp_dir()
+    from app.constants import DB_TUNING_PROFILES
+
+    rows = []
+    for profile in (None, *DB_TUNING_PROFILES):
+        random.seed(1)
+        counts = run(os.path.join(tmp, f"{profile or 'base'}.db"), profile, args.sales, args.seconds)
+        rows.append([
+            profile or "base (rollback journal)",
+            f"{counts['checkouts'] / args.seconds:.1f}",
+            f"{counts['reads'] / args.seconds:.1f}",
+            counts["errors"],
+        ])
+
+    print(f"{args.sales} ventas, 1 hilo cobrando + 3 leyendo durante {args.seconds:g} s")
+    _bench.table(["perfil", "cobros/s", "lecturas/s", "errores"], rows)
+
+
+if __name__ == "__main__":
+    main()
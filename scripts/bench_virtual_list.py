@@ -0,0 +1,120 @@
+"""
+Benchmark de VirtualList: widgets creados por OrdersList, SupplyGrid y
+ProductsPanel con 50 / 500 / 5000 elementos.
+
+Sin servidor X los widgets son el doble de _fake_tk.py, así que se cuentan
+widgets (no se mide el pintado de Tk). Las tarjetas son las reales
+(OrderCard, SupplyCard, ProductCard):
+
+- antes: una tarjeta completa por elemento en cada refresh, o sea
+  elementos x widgets por tarjeta.
+- VirtualList: lista de 900x700 px, primer pintado más un scroll completo
+  hasta el final. Después de cada paso se revisa que cada tarjeta visible
+  muestre el elemento de su índice.
+
+Uso: python scripts/bench_virtual_list.py [--sizes 50 500 5000]
+"""
+
+import argparse
+from datetime import datetime
+from types import SimpleNamespace
+
+import _bench
+import _fake_tk
+
+
+SCROLL_STEP = 60
+
+
+def order_item(i):
+    return SimpleNamespace(
+        id=i, status="pendiente", total=100.0 + i, amount_paid=0,
+        date=datetime(2026, 1, 1), customer_id=1,
+    )
+
+
+def supply_item(i):
+    return {'id': i, 'supply_name': f"Insumo {i}", 'unit': "kg", 'supplier_name': "Proveedor", 'is_default': i % 7 == 0}
+
+
+def product_item(i):
+    return (i, None, f"Producto {i}", 20.0)
+
+
+class Panel:
+    """Lo que ProductCard le pide a ProductsPanel."""
+
+    def product_state(self, product_id, default_price):
+        return {'price_var': None, 'qty_var': None, 'editing': False}
+
+
+def views():
+    from app.gui.sales.admin_sales.orders.orders_list import OrderCard
+    from app.gui.supplies.grid.supply_grid import SupplyCard, SupplyGrid
+    from app.gui.sales.pos.orders.products_panel import ProductCard
+
+    panel = Panel()
+    return [
+        ("OrdersList", lambda parent: OrderCard(parent, {}, lambda order: None),
+         OrderCard.HEIGHT, 1, order_item, "order"),
+        ("SupplyGrid", lambda parent: SupplyCard(parent, lambda i: None, lambda s: None),
+         SupplyCard.HEIGHT, SupplyGrid.CARDS_PER_ROW, supply_item, "supply_data"),
+        ("ProductsPanel", lambda parent: ProductCard(parent, panel),
+         ProductCard.HEIGHT, 1, product_item, "product"),
+    ]
+
+
+def widgets_per_card(factory):
+    _fake_tk.reset()
+    factory(_fake_tk.Frame())
+    return _fake_tk.ops["create"]
+
+
+def scroll_through(view_list, row_height, attribute):
+    """Scroll de arriba a abajo; cada tarjeta visible debe mostrar su elemento."""
+    canvas = view_list.canvas
+    bottom = max(view_list._rows() * row_height - canvas.height, 0)
+
+    for top in range(0, bottom + SCROLL_STEP, SCROLL_STEP):
+        canvas.scroll_to(min(top, bottom))
+        _fake_tk.run_idle()
+        for index, (_, card) in view_list._slots.items():
+            assert getattr(card, attribute) is view_list.items[index], (index, getattr(card, attribute))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[50, 500, 5000])
+    args = parser.parse_args()
+
+    _bench.use_temp_dir()
+    _fake_tk.install()
+    from app.gui.components.virtual_list import VirtualList
+
+    rows = []
+    for name, factory, row_height, columns, make_item, attribute in views():
+        per_card = widgets_per_card(factory)
+
+        for n in args.sizes:
+            view_list = VirtualList(None, row_factory=factory, row_height=row_height, columns=columns)
+            view_list._on_configure(SimpleNamespace(width=900))
+            _fake_tk.run_idle()
+
+            _fake_tk.reset()
+            view_list.set_items([make_item(i) for i in range(n)])
+            _fake_tk.run_idle()
+            first_paint = _fake_tk.ops["create"]
+
+            scroll_through(view_list, row_height, attribute)
+            rows.append([
+                name, n, n * per_card, first_paint, _fake_tk.ops["create"],
+                view_list.stats["created"],
+            ])
+
+    print("Widgets creados (lista de 900x700 px, scroll completo)")
+    _bench.table(["vista", "elementos", "antes", "primer pintado", "tras scroll", "tarjetas"], rows)
+    print("Cada tarjeta visible mostró el elemento de su índice en todo el scroll")
+
+
+if __name__ == "__main__":
+    main()
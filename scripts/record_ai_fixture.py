@@ -0,0 +1,115 @@
+"""
+Graba las respuestas de la API de Anthropic para tests/test_ai_assistant.py.
+
+Hace las mismas dos preguntas que la prueba con el cliente real, sobre una
+DB temporal cargada con seed_data.py, y guarda cada mensaje de la API
+(message.model_dump(), con su `usage` real: tokens de entrada, escritos y
+leídos de la caché de prompts y de salida) en el fixture. Volver a grabarlo
+cuando cambien TOOLS, SYSTEM o las preguntas.
+
+Uso: ANTHROPIC_API_KEY=sk-ant-... python scripts/record_ai_fixture.py [--out ruta.json]
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+
+import _bench
+
+
+FIXTURE = os.path.join(_bench.ROOT, "tests", "fixtures", "anthropic_top_products.json")
+
+# Las mismas de tests/test_ai_assistant.py (intent_router no las contesta)
+QUESTIONS = ["¿Cuáles son los productos más vendidos?", "¿Qué productos me dejan más dinero?"]
+
+
+class RecordingStream:
+
+    def __init__(self, stream, recorded):
+        self._stream = stream
+        self._recorded = recorded
+
+    def __enter__(self):
+        self._inner = self._stream.__enter__()
+        return self
+
+    def __exit__(self, *exc):
+        return self._stream.__exit__(*exc)
+
+    def __iter__(self):
+        return iter(self._inner)
+
+    def get_final_message(self):
+        message = self._inner.get_final_message()
+        self._recorded.append(message.model_dump(mode="json", exclude_none=True))
+        return message
+
+
+class RecordingMessages:
+
+    def __init__(self, messages, recorded):
+        self._messages = messages
+        self._recorded = recorded
+
+    def create(self, **kwargs):
+        message = self._messages.create(**kwargs)
+        self._recorded.append(message.model_dump(mode="json", exclude_none=True))
+        return message
+
+    def stream(self, **kwargs):
+        return RecordingStream(self._messages.stream(**kwargs), self._recorded)
+
+
+class RecordingClient:
+    """Cliente real de Anthropic que guarda cada mensaje que regresa."""
+
+    def __init__(self, client):
+        self.recorded = []
+        self.messages = RecordingMessages(client.messages, self.recorded)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--out", default=FIXTURE)
+    args = parser.parse_args()
+
+    key = os.environ.get("ANTHROPIC_API_KEY")
+    if not key:
+        raise SystemExit("Falta ANTHROPIC_API_KEY")
+
+    out = os.path.abspath(args.out)
+    _bench.use_temp_dir()
+    _bench.seed_database()
+
+    from anthropic import Anthropic
+    from app.services.ai_assistant_mcp import AIAssistantMCP
+
+    client = RecordingClient(Anthropic(api_key=key))
+    assistant = AIAssistantMCP()
+    assistant.use_client(client)
+
+    for question in QUESTIONS:
+        with contextlib.redirect_stdout(io.StringIO()):
+            result = assistant.ask(question, on_event=lambda kind, value=None: None)
+        if not result["success"]:
+            raise SystemExit(f"{question}: {result['response']}")
+        print(f"{question} -> {len(result['sql_queries'])} consultas")
+
+    with open(out, "w", encoding="utf-8", newline="\n") as f:
+        json.dump(client.recorded, f, ensure_ascii=False, indent=2)
+        f.write("\n")
+
+    for message in client.recorded:
+        usage = message["usage"]
+        print(
+            f"{message['stop_reason']:9} entrada {usage['input_tokens']:5} "
+            f"caché escritos {usage.get('cache_creation_input_tokens', 0):5} "
+            f"leídos {usage.get('cache_read_input_tokens', 0):5} salida {usage['output_tokens']}"
+        )
+    print(f"{len(client.recorded)} mensajes en {out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,6 +4,7 @@ Genera 6 meses de datos realistas (Aug 2025 - Feb 2026).
 Lee datos base desde CSVs en app/data/default/.
 
 Uso: python seed_data.py
+     python seed_data.py --rollups   (solo recalcula daily_rollups)
 """
 
 import csv
@@ -21,6 +22,7 @@ from app.models import (
     Sale, SaleDetail, Order, OrderDetail
 )
 from app.models.cash_cut import CashCut
+from app.data.providers.rollups import rollup_provider
 
 random.seed(42)
 
@@ -370,6 +372,8 @@ def main():
             db.commit()
             print("\n✅ Datos insertados correctamente.")
 
+            rebuild_rollups()
+
         except Exception as e:
             db.rollback()
             print(f"\n❌ Error: {e}")
@@ -511,6 +515,8 @@ def main_today():
             db.commit()
             print("\nDatos de hoy insertados correctamente.")
 
+            rebuild_rollups()
+
         except Exception as e:
             db.rollback()
             print(f"\nError: {e}")
@@ -646,6 +652,16 @@ def main_cash_cuts_only():
             raise
 
 
+def rebuild_rollups():
+    """Recalcula daily_rollups desde ventas/pedidos (el seed inserta directo, sin providers)."""
+    print("\nRecalculando rollups diarios...")
+    success, result = rollup_provider.rebuild()
+    if success:
+        print(f"  Rollups: {result} dias x canal")
+    else:
+        print(f"  Error: {result}")
+
+
 if __name__ == "__main__":
     if len(sys.argv) > 1 and sys.argv[1] == "--purchases":
         main_purchases_only()
@@ -653,5 +669,7 @@ if __name__ == "__main__":
         main_today()
     elif len(sys.argv) > 1 and sys.argv[1] == "--cash-cuts":
         main_cash_cuts_only()
+    elif len(sys.argv) > 1 and sys.argv[1] == "--rollups":
+        rebuild_rollups()
     else:
         main()
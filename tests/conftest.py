@@ -0,0 +1,42 @@
+"""
+Configuración común de las pruebas.
+
+database.py y readonly_db.py toman la ruta de la DB del directorio actual
+al importarse, así que antes de importar la app se cambia a una carpeta
+temporal: las pruebas nunca tocan tortilleria.db.
+
+seeded_db crea ahí las tablas y carga los datos de seed_data.py (6 meses,
+semilla fija) una sola vez por sesión. Las pruebas que escriben deben
+dejar los datos como los encontraron.
+"""
+
+import atexit
+import contextlib
+import io
+import os
+import shutil
+import sys
+import tempfile
+
+import pytest
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_tmp = tempfile.mkdtemp(prefix="tortilleria-tests-")
+os.chdir(_tmp)
+atexit.register(shutil.rmtree, _tmp, ignore_errors=True)
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+
+@pytest.fixture(scope="session")
+def seeded_db():
+    from app.data.database import Base, engine
+    import app.models  # noqa: F401
+    import seed_data
+
+    Base.metadata.create_all(bind=engine)
+    with contextlib.redirect_stdout(io.StringIO()):
+        seed_data.main()
+    return engine
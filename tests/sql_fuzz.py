@@ -0,0 +1,91 @@
+"""
+Generador de consultas para probar el authorizer de solo lectura
+(DatabaseTool.validate_sql). Lo usan tests/test_sql_authorizer.py y
+scripts/bench_sql_validate.py.
+
+Las tablas y columnas salen de los modelos, así las consultas válidas
+compilan contra la DB de seed_data.py. Con la misma semilla se generan las
+mismas consultas.
+"""
+
+import random
+
+
+def schema():
+    from app.data.database import Base
+    import app.models  # noqa: F401
+    return {table.name: [column.name for column in table.columns] for table in Base.metadata.sorted_tables}
+
+
+class SqlFuzzer:
+
+    # Palabras peligrosas dentro de literales y comentarios: no cambian lo que hace la consulta
+    LITERALS = ["'DELETE FROM sales'", "'drop table x; --'", "'/* nota */'", "'union'", "'update'", "'2026-01-01'"]
+    COMMENTS = ["", " -- comentario\n", " /* DELETE */ ", " /* union */ "]
+
+    def __init__(self, seed=20, tables=None):
+        self.random = random.Random(seed)
+        self.tables = tables or schema()
+        self.names = sorted(self.tables)
+
+    def _table(self):
+        return self.random.choice(self.names)
+
+    def _column(self, table):
+        return self.random.choice(self.tables[table])
+
+    def _literal(self):
+        return self.random.choice(self.LITERALS + [str(self.random.randint(0, 999))])
+
+    def _comment(self):
+        return self.random.choice(self.COMMENTS)
+
+    def valid(self):
+        """Una consulta de solo lectura."""
+        t, t2 = self._table(), self._table()
+        a = self._column(t)
+        return self.random.choice([
+            lambda: f"SELECT {a} FROM {t}{self._comment()} WHERE {self._column(t)} = {self._literal()} LIMIT 5",
+            lambda: f"SELECT COUNT(*), SUM({a}) FROM {t} GROUP BY {self._column(t)}",
+            lambda: f"SELECT x.{a}, y.{self._column(t2)} FROM {t} x JOIN {t2} y ON x.{self._column(t)} = y.{self._column(t2)} LIMIT 5",
+            lambda: f"WITH base AS (SELECT {a} AS v FROM {t}){self._comment()} SELECT v FROM base LIMIT 10",
+            lambda: f"SELECT {a} FROM {t} UNION SELECT {self._column(t2)} FROM {t2} LIMIT 10",
+            lambda: f"WITH RECURSIVE n(i) AS (SELECT 1 UNION ALL SELECT i + 1 FROM n WHERE i < {self.random.randint(2, 30)}) SELECT i FROM n",
+            lambda: f"SELECT {a} AS created_at_updated, {self._literal()} AS nota FROM {t}{self._comment()} ORDER BY 1 DESC LIMIT 3",
+            lambda: f"  select {a}, length({self._literal()}) from {t} where {self._column(t)} is not null limit 1;  ",
+        ])()
+
+    def invalid(self):
+        """Una sentencia que escribe, cambia la conexión o lee fuera de la DB."""
+        t = self._table()
+        a = self._column(t)
+        return self.random.choice([
+            f"DELETE FROM {t}",
+            f"UPDATE {t} SET {a} = {a}",
+            f"INSERT INTO {t} ({a}) SELECT {a} FROM {t}",
+            f"REPLACE INTO {t} ({a}) VALUES (1)",
+            f"WITH x AS (SELECT 1) DELETE FROM {t}",
+            f"{self._comment()}DROP TABLE {t}",
+            f"CREATE TEMP TABLE t{self.random.randint(0, 99)} AS SELECT * FROM {t}",
+            "PRAGMA writable_schema = 1",
+            "ATTACH DATABASE 'otra.db' AS otra",
+            f"SELECT load_extension('x') FROM {t}",
+            f"SELECT {a} FROM {t}; DELETE FROM {t}",
+            "VACUUM",
+        ])
+
+    def mix(self, valid=300, invalid=100, repeat=0.5):
+        """
+        [(sql, es_válida)] en desorden; con probabilidad repeat se repite una
+        de las últimas 50 (el asistente repite consultas recientes).
+        """
+        queries = [(self.valid(), True) for _ in range(valid)]
+        queries += [(self.invalid(), False) for _ in range(invalid)]
+        self.random.shuffle(queries)
+
+        mixed = []
+        for query in queries:
+            mixed.append(query)
+            if self.random.random() < repeat:
+                mixed.append(self.random.choice(mixed[-50:]))
+        return mixed
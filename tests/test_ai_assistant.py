@@ -0,0 +1,108 @@
+"""
+Asistente IA con las respuestas de la API en tests/fixtures/anthropic_*.json
+(formato de message.model_dump(), con su `usage`; se graban con
+scripts/record_ai_fixture.py).
+
+- metrics guarda lo que trae el `usage` de cada respuesta.
+- Cada petición marca cache_control al final de tools y de system, y ese
+  prefijo es idéntico byte a byte entre iteraciones y entre preguntas
+  (si cambia, la caché de prompts deja de servir).
+- Dos preguntas seguidas usan el mismo cliente.
+"""
+
+import json
+import os
+
+import pytest
+
+import app.services.ai_assistant_mcp as assistant_module
+from app import api_key
+from app.services.ai_assistant_mcp import AIAssistantMCP
+from app.services.fake_anthropic import FakeAnthropicClient
+
+
+FIXTURE = os.path.join(os.path.dirname(__file__), "fixtures", "anthropic_top_products.json")
+
+# Las mismas de scripts/record_ai_fixture.py (intent_router no las contesta)
+QUESTIONS = ["¿Cuáles son los productos más vendidos?", "¿Qué productos me dejan más dinero?"]
+
+
+@pytest.fixture
+def recorded():
+    with open(FIXTURE, encoding="utf-8") as f:
+        return json.load(f)
+
+
+@pytest.fixture
+def client():
+    return FakeAnthropicClient.from_fixture(FIXTURE)
+
+
+@pytest.fixture
+def assistant(seeded_db):
+    return AIAssistantMCP()
+
+
+def ask_all(assistant, capsys):
+    results = [assistant.ask(question, on_event=lambda kind, value=None: None) for question in QUESTIONS]
+    capsys.readouterr()
+    return results
+
+
+def test_metrics_come_from_response_usage(assistant, client, recorded, capsys):
+    assistant.use_client(client)
+
+    for result in ask_all(assistant, capsys):
+        assert result["success"], result
+        assert len(result["sql_queries"]) == 1
+
+    calls = list(assistant.metrics)
+    assert len(calls) == len(recorded)
+    for call, message in zip(calls, recorded):
+        usage = message["usage"]
+        assert call["input_tokens"] == usage["input_tokens"]
+        assert call["cache_write_tokens"] == usage["cache_creation_input_tokens"]
+        assert call["cache_read_tokens"] == usage["cache_read_input_tokens"]
+        assert call["output_tokens"] == usage["output_tokens"]
+        assert call["latency_ms"] > 0
+        assert call["ttft_ms"] is not None
+
+    # La segunda pregunta lee el prefijo de la caché
+    second_question = calls[len(calls) // len(QUESTIONS):]
+    assert all(call["cache_read_tokens"] > 0 for call in second_question)
+    assert assistant.cache_hit_rate() > 0
+
+
+def test_requests_keep_cacheable_prefix(assistant, client, capsys):
+    assistant.use_client(client)
+    ask_all(assistant, capsys)
+
+    requests = client.requests
+    assert len(requests) > len(QUESTIONS)
+    for request in requests:
+        assert request["tools"][-1]["cache_control"] == {"type": "ephemeral"}
+        assert request["system"][-1]["cache_control"] == {"type": "ephemeral"}
+
+    prefixes = {
+        json.dumps([request["tools"], request["system"]], ensure_ascii=False)
+        for request in requests
+    }
+    assert len(prefixes) == 1
+    assert len({request["model"] for request in requests}) == 1
+
+
+def test_client_is_reused_while_key_does_not_change(assistant, client, capsys, monkeypatch):
+    created = []
+
+    def make_client(api_key):
+        created.append(api_key)
+        return client
+
+    monkeypatch.setattr(assistant_module, "Anthropic", make_client)
+    monkeypatch.setattr(api_key, "API_KEY", "sk-ant-prueba")
+
+    first, second = ask_all(assistant, capsys)
+
+    assert first["success"] and second["success"]
+    assert created == ["sk-ant-prueba"]
+    assert assistant._get_client() is client
@@ -0,0 +1,30 @@
+"""
+Caché del catálogo: lo que regresan los providers se puede compartir entre
+pantallas sin que una modifique lo que ve la otra.
+"""
+
+import pytest
+
+from app.constants import CUSTOMER_CATEGORIES
+from app.data.providers.customers import customer_provider
+
+
+@pytest.fixture(autouse=True)
+def seeded(seeded_db):
+    pass
+
+
+def test_get_all_returns_a_copy():
+    first = customer_provider.get_all()
+    first.clear()
+
+    assert customer_provider.get_all()
+
+
+def test_get_by_category_returns_an_immutable_row():
+    mostrador = customer_provider.get_by_category(CUSTOMER_CATEGORIES["Mostrador"])
+
+    assert mostrador.id
+    assert customer_provider.get_by_category(CUSTOMER_CATEGORIES["Mostrador"]) == mostrador
+    with pytest.raises(AttributeError):
+        mostrador.id = 0
@@ -0,0 +1,101 @@
+"""
+Resultados de DatabaseTool.execute_sql con una tabla grande: se guardan a
+lo más max_rows renglones (y max_bytes en JSON), el resto solo se cuenta y
+la memoria no crece con el tamaño de la tabla.
+"""
+
+import json
+import tracemalloc
+
+import pytest
+from sqlalchemy import text
+
+from app.constants import AI_SQL_COUNT_LIMIT, AI_SQL_MAX_BYTES, AI_SQL_MAX_ROWS
+from app.data.database import engine
+from app.services.db_tool import DatabaseTool
+
+
+BIG_ROWS = 1_000_000
+
+# fetchall de BIG_ROWS renglones pasa de 100 MB
+PEAK_MEMORY_LIMIT = 5 * 1024 * 1024
+
+
+@pytest.fixture(scope="module")
+def big_table(seeded_db):
+    with engine.begin() as connection:
+        connection.execute(text("CREATE TABLE big (id INTEGER PRIMARY KEY, name TEXT, qty INTEGER)"))
+        connection.execute(text(
+            "WITH RECURSIVE n(i) AS (SELECT 1 UNION ALL SELECT i + 1 FROM n WHERE i < :rows) "
+            "INSERT INTO big SELECT i, 'producto ' || (i % 50), i % 7 FROM n"
+        ), {"rows": BIG_ROWS})
+    yield "big"
+
+    with engine.begin() as connection:
+        connection.execute(text("DROP TABLE big"))
+
+
+@pytest.fixture
+def tool():
+    # Holgado para que una máquina lenta no interrumpa el conteo
+    return DatabaseTool(budget_s=30)
+
+
+def test_big_select_is_truncated(big_table, tool):
+    tracemalloc.start()
+    try:
+        result = tool.execute_sql(f"SELECT * FROM {big_table}")
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert result["success"], result.get("error")
+    assert result["columns"] == ["id", "name", "qty"]
+    assert len(result["rows"]) <= AI_SQL_MAX_ROWS
+    assert result["row_count"] == len(result["rows"])
+    assert result["truncated"]
+
+    # Se cuenta hasta AI_SQL_COUNT_LIMIT y el total queda como aproximado
+    assert AI_SQL_COUNT_LIMIT <= result["total_rows"] < BIG_ROWS
+    assert not result["total_rows_exact"]
+
+    assert peak < PEAK_MEMORY_LIMIT, f"pico de {peak / 1e6:.1f} MB"
+
+
+def test_rows_fit_max_bytes(big_table, tool):
+    result = tool.execute_sql(f"SELECT id, printf('%.200c', 'x') AS filler FROM {big_table}")
+
+    assert result["success"], result.get("error")
+    assert result["truncated"]
+    assert len(result["rows"]) < AI_SQL_MAX_ROWS
+    assert sum(len(json.dumps(row)) + 1 for row in result["rows"]) <= AI_SQL_MAX_BYTES
+
+
+def test_bytes_cut_keeps_exact_total(big_table, tool):
+    # Menos renglones que AI_SQL_COUNT_LIMIT: el total debe ser exacto aunque
+    # el límite de bytes corte a la mitad de un fetchmany
+    rows = 250
+    result = tool.execute_sql(f"SELECT id, printf('%.150c', 'x') AS filler FROM {big_table} WHERE id <= {rows}")
+
+    assert result["truncated"]
+    assert 0 < result["row_count"] < AI_SQL_MAX_ROWS
+    assert result["total_rows"] == rows
+    assert result["total_rows_exact"]
+
+
+def test_exact_total_below_count_limit(big_table, tool):
+    result = tool.execute_sql(f"SELECT id FROM {big_table} WHERE id <= 500")
+
+    assert result["truncated"]
+    assert result["row_count"] == AI_SQL_MAX_ROWS
+    assert result["total_rows"] == 500
+    assert result["total_rows_exact"]
+
+
+def test_small_result_is_not_truncated(big_table, tool):
+    result = tool.execute_sql(f"SELECT name, count(*) AS n FROM {big_table} GROUP BY name")
+
+    assert not result["truncated"]
+    assert result["row_count"] == result["total_rows"] == 50
+    assert result["total_rows_exact"]
+    assert sum(row[1] for row in result["rows"]) == BIG_ROWS
@@ -0,0 +1,129 @@
+"""
+Listener de pedidos de Firestore: el primer inicio (sin read_time guardado)
+no aplica el snapshot inicial y un campo que falta no pisa el valor local.
+"""
+
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+
+import app.services.firestore_listener as listener_module
+from app.constants import (
+    ORDERS_COLLECTION,
+    ORDER_STATUSES_PENDING,
+    ORDER_STATUSES_COMPLETE,
+    FIRESTORE_ORDERS_READ_TIME_KEY,
+)
+from app.data.database import get_db
+from app.data.providers.sync_state import sync_state_provider
+from app.models import Order, SyncState
+from app.services.fake_firestore import FakeFirestoreClient
+from app.services.firestore_listener import FirestoreOrderListener
+from app.services.firestore_service import FirestoreService
+
+
+class InlineTaskRunner:
+    """task_runner sin Tkinter: corre la tarea y sus callbacks en el momento."""
+
+    def submit(self, _owner, fn, on_done=None, on_error=None):
+        try:
+            result = fn()
+        except Exception as e:
+            on_error(e)
+        else:
+            on_done(result)
+
+
+@pytest.fixture
+def client(seeded_db, monkeypatch):
+    client = FakeFirestoreClient()
+    service = FirestoreService()
+    service.use_client(client)
+
+    monkeypatch.setattr(listener_module, "firestore_service", service)
+    monkeypatch.setattr(listener_module, "task_runner", InlineTaskRunner())
+    monkeypatch.setattr(listener_module, "Toast", lambda *args, **kwargs: None)
+    yield client
+
+    db = get_db()
+    db.query(SyncState).delete()
+    db.commit()
+    db.close()
+
+
+@pytest.fixture
+def order():
+    """Pedido pendiente con un abono local de 5."""
+    db = get_db()
+    order = db.query(Order).filter(Order.status == ORDER_STATUSES_PENDING).order_by(Order.id).first()
+    original = {"status": order.status, "amount_paid": order.amount_paid}
+    order.amount_paid = 5.0
+    db.commit()
+    order = SimpleNamespace(id=order.id, amount_paid=5.0)
+    db.close()
+    yield order
+
+    db = get_db()
+    db.query(Order).filter(Order.id == order.id).update(original)
+    db.commit()
+    db.close()
+
+
+def start_listener():
+    app = SimpleNamespace(root=SimpleNamespace(after=lambda _ms, _fn: None))
+    listener = FirestoreOrderListener()
+    listener.start(app)
+    return listener
+
+
+def local_order(order_id):
+    db = get_db()
+    try:
+        return db.query(Order.status, Order.amount_paid).filter(Order.id == order_id).one()
+    finally:
+        db.close()
+
+
+def put_remote(client, order_id, data):
+    key = (ORDERS_COLLECTION, str(order_id))
+    client.documents[key] = data
+    client.update_times[key] = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def test_first_run_does_not_apply_initial_snapshot(client, order):
+    # Documento viejo en Firestore (p. ej. una sincronización que falló)
+    put_remote(client, order.id, {"order_id": order.id, "status": ORDER_STATUSES_COMPLETE, "amount_paid": 0})
+
+    listener = start_listener()
+
+    assert local_order(order.id) == (ORDER_STATUSES_PENDING, order.amount_paid)
+    assert listener.stats["skipped"] == 1
+    assert sync_state_provider.get(FIRESTORE_ORDERS_READ_TIME_KEY) is not None
+
+
+def test_changes_after_first_snapshot_are_applied(client, order):
+    # Sin amount_paid: el pago local no se toca
+    put_remote(client, order.id, {"order_id": order.id, "status": ORDER_STATUSES_PENDING})
+    start_listener()
+
+    client.collection(ORDERS_COLLECTION).document(str(order.id)).update({"status": ORDER_STATUSES_COMPLETE})
+
+    assert local_order(order.id) == (ORDER_STATUSES_COMPLETE, order.amount_paid)
+
+
+def test_restart_skips_documents_already_applied(client, order):
+    put_remote(client, order.id, {"order_id": order.id, "status": ORDER_STATUSES_PENDING})
+    start_listener()
+    client.collection(ORDERS_COLLECTION).document(str(order.id)).update({"amount_paid": order.amount_paid + 1})
+
+    # Se regresa el valor local; al reiniciar el documento ya aplicado no se vuelve a aplicar
+    db = get_db()
+    db.query(Order).filter(Order.id == order.id).update({"amount_paid": order.amount_paid})
+    db.commit()
+    db.close()
+
+    listener = start_listener()
+
+    assert local_order(order.id).amount_paid == order.amount_paid
+    assert listener.stats["skipped"] == 1
@@ -0,0 +1,111 @@
+"""
+Outbox de Firestore: un documento que falla siempre termina marcado como
+fallido, deja de reintentarse y ya no bloquea los cambios del móvil.
+"""
+
+import pytest
+
+import app.services.firestore_outbox as outbox_module
+from app.constants import ORDERS_COLLECTION
+from app.data.database import get_db
+from app.data.providers.orders import order_provider
+from app.models import FirestoreOutbox as OutboxRow, Order
+from app.services.fake_firestore import FakeFirestoreClient
+from app.services.firestore_outbox import FirestoreOutbox, OP_SET, OP_UPDATE
+from app.services.firestore_service import FirestoreService
+
+
+# Mayor que FIRESTORE_OUTBOX_ISOLATE_AFTER: antes de marcarse fallido el documento va solo
+MAX_ATTEMPTS = 5
+
+
+@pytest.fixture
+def outbox(seeded_db, monkeypatch):
+    # Reintentos inmediatos para no esperar el backoff
+    monkeypatch.setattr(outbox_module, "FIRESTORE_OUTBOX_BACKOFF_BASE_S", 0)
+    monkeypatch.setattr(outbox_module, "FIRESTORE_OUTBOX_MAX_ATTEMPTS", MAX_ATTEMPTS)
+
+    service = FirestoreService()
+    service.use_client(FakeFirestoreClient())
+    box = FirestoreOutbox()
+    box._service = service
+    yield box
+
+    db = get_db()
+    db.query(OutboxRow).delete()
+    db.commit()
+    db.close()
+
+
+@pytest.fixture
+def order():
+    db = get_db()
+    order = db.query(Order).order_by(Order.id).first()
+    db.close()
+    yield order
+
+    db = get_db()
+    db.query(Order).filter(Order.id == order.id).update(
+        {"status": order.status, "amount_paid": order.amount_paid}
+    )
+    db.commit()
+    db.close()
+
+
+def enqueue(box, document_id, op, data):
+    db = get_db()
+    box.enqueue(db, ORDERS_COLLECTION, document_id, op, data)
+    db.commit()
+    db.close()
+
+
+def amount_paid(order_id):
+    db = get_db()
+    try:
+        return db.query(Order.amount_paid).filter(Order.id == order_id).scalar()
+    finally:
+        db.close()
+
+
+def test_failing_document_is_dead_lettered(outbox, order):
+    # update de un documento que no existe en Firestore: falla siempre
+    enqueue(outbox, order.id, OP_UPDATE, {"amount_paid": 1.0})
+    enqueue(outbox, "otro", OP_SET, {"status": "pendiente"})
+    client = outbox._service._db
+
+    for _ in range(MAX_ATTEMPTS):
+        outbox.dispatch_once()
+
+    assert (ORDERS_COLLECTION, "otro") in client.documents
+    assert outbox.pending_count() == 0
+    assert outbox.failed_count() == 1
+    assert outbox.stats["dead"] == 1
+
+    db = get_db()
+    row = db.query(OutboxRow).one()
+    db.close()
+    assert row.document_id == str(order.id)
+    assert row.attempts == MAX_ATTEMPTS
+    assert row.failed_at is not None
+
+    # Ya no se reintenta
+    commits = len(client.commits)
+    assert outbox.dispatch_once() == 0
+    assert len(client.commits) == commits
+
+
+def test_dead_letter_does_not_block_remote_changes(outbox, order):
+    enqueue(outbox, order.id, OP_UPDATE, {"amount_paid": 1.0})
+    remote_paid = (order.amount_paid or 0) + 1
+
+    # Mientras se reintenta, lo local gana
+    ok, _ = order_provider.apply_remote_changes([(order.id, None, remote_paid)])
+    assert ok
+    assert amount_paid(order.id) == order.amount_paid
+
+    for _ in range(MAX_ATTEMPTS):
+        outbox.dispatch_once()
+
+    ok, _ = order_provider.apply_remote_changes([(order.id, None, remote_paid)])
+    assert ok
+    assert amount_paid(order.id) == remote_paid
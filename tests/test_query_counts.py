@@ -0,0 +1,153 @@
+"""
+Presupuesto de consultas de los paneles de detalle y las páginas
+(DETAIL_QUERY_BUDGETS); los reportes se prueban en test_report_queries.py.
+
+El conteo no debe depender de cuántos renglones haya: se prueba con el
+pedido y la venta con más renglones de los datos de prueba. Si una consulta
+vuelve a hacerse por renglón (N+1) el conteo se pasa del presupuesto y la
+prueba falla.
+"""
+
+import pytest
+from sqlalchemy import func
+
+from app.constants import DETAIL_QUERY_BUDGETS
+from app.data.database import get_db
+from app.data.query_counter import QueryCounter, query_counts
+from app.data.providers.cash_cut import cash_cut_provider
+from app.data.providers.orders import order_provider
+from app.data.providers.refunds import refund_provider
+from app.data.providers.sales import sale_provider
+from app.data.providers.supplies import supply_provider
+from app.models import Order, OrderDetail, OrderRefund, SaleDetail, Supply
+
+
+# Una consulta por página, con o sin cursor
+PAGE_QUERY_BUDGET = 1
+
+REFUNDS = 3
+
+
+def assert_within_budget(counter):
+    assert counter.count <= counter.budget, f"{counter.count} consultas (presupuesto {counter.budget})"
+
+
+def largest(detail_model, parent_column):
+    """Id del encabezado con más renglones de detalle y cuántos tiene."""
+    db = get_db()
+    try:
+        return db.query(parent_column, func.count(detail_model.id)).group_by(
+            parent_column
+        ).order_by(func.count(detail_model.id).desc()).first()
+    finally:
+        db.close()
+
+
+@pytest.fixture
+def order_with_refunds(seeded_db):
+    order_id, lines = largest(OrderDetail, OrderDetail.order_id)
+
+    db = get_db()
+    product_ids = [p for (p,) in db.query(OrderDetail.product_id).filter(OrderDetail.order_id == order_id)]
+    for product_id in product_ids[:REFUNDS]:
+        db.add(OrderRefund(order_id=order_id, product_id=product_id, quantity=1, comments="prueba"))
+    db.commit()
+    db.close()
+    yield order_id, lines
+
+    db = get_db()
+    db.query(OrderRefund).filter(OrderRefund.order_id == order_id).delete()
+    db.commit()
+    db.close()
+
+
+def test_order_detail(order_with_refunds):
+    order_id, lines = order_with_refunds
+    assert lines > 1
+
+    with QueryCounter(budget=DETAIL_QUERY_BUDGETS["order_detail"]) as counter:
+        detail = order_provider.get_detail(order_id)
+
+    assert_within_budget(counter)
+    assert len(detail["details"]) == lines
+    assert len(detail["refunds"]) == REFUNDS
+
+
+def test_order_refunds(order_with_refunds):
+    order_id, _lines = order_with_refunds
+
+    with QueryCounter(budget=DETAIL_QUERY_BUDGETS["order_refunds"]) as counter:
+        refunds = refund_provider.get_by_order(order_id)
+
+    assert_within_budget(counter)
+    assert len(refunds) == REFUNDS
+
+
+def test_sale_detail(seeded_db):
+    sale_id, lines = largest(SaleDetail, SaleDetail.sale_id)
+    assert lines > 1
+
+    with QueryCounter(budget=DETAIL_QUERY_BUDGETS["sale_detail"]) as counter:
+        detail = sale_provider.get_detail(sale_id)
+
+    assert_within_budget(counter)
+    assert len(detail["details"]) == lines
+
+
+def test_missing_detail_stays_within_budget(seeded_db):
+    with QueryCounter(budget=DETAIL_QUERY_BUDGETS["order_detail"]) as counter:
+        assert order_provider.get_detail(10 ** 9) is None
+    assert_within_budget(counter)
+
+
+def first_supply_id():
+    db = get_db()
+    try:
+        return db.query(Supply.id).order_by(Supply.id).first()[0]
+    finally:
+        db.close()
+
+
+@pytest.mark.parametrize("name", ["orders", "sales", "cash_cuts", "supply_purchases"])
+def test_get_page(seeded_db, name):
+    supply_id = first_supply_id()
+
+    def get_purchases_page(limit, **cursor):
+        return supply_provider.get_purchases_page(supply_id, limit, **cursor)
+
+    get_page = {
+        "orders": order_provider.get_page,
+        "sales": sale_provider.get_page,
+        "cash_cuts": cash_cut_provider.get_page,
+        "supply_purchases": get_purchases_page,
+    }[name]
+
+    first = get_page(20)
+
+    cursors = [{}, {"last": True}]
+    if first.rows:
+        cursors += [{"after": first.last}, {"before": first.first}]
+
+    for cursor in cursors:
+        with QueryCounter(budget=PAGE_QUERY_BUDGET) as counter:
+            get_page(20, **cursor)
+        assert_within_budget(counter)
+
+
+def test_order_page_with_filters(seeded_db):
+    with QueryCounter(budget=PAGE_QUERY_BUDGET) as counter:
+        page = order_provider.get_page(20, filters=[Order.status == "pendiente"])
+
+    assert_within_budget(counter)
+    assert all(row.status == "pendiente" for row in page.rows)
+
+
+def test_provider_warns_over_budget(seeded_db, monkeypatch, capsys):
+    # Con presupuesto 0 la consulta de get_detail ya se pasa: el provider debe avisar
+    monkeypatch.setitem(DETAIL_QUERY_BUDGETS, "sale_detail", 0)
+    sale_id, _lines = largest(SaleDetail, SaleDetail.sale_id)
+
+    sale_provider.get_detail(sale_id)
+
+    assert query_counts["sale_detail"] == 1
+    assert "[SQL] sale_detail: 1 consultas (presupuesto 0)" in capsys.readouterr().out
@@ -0,0 +1,82 @@
+"""
+Consultas por render de cada tab de Reportes.
+
+Cada tab debe pedir sus datos en un número fijo de consultas sin importar
+cuántos clientes, pedidos o insumos haya; si alguien regresa un N+1 el
+conteo sube y la prueba falla.
+"""
+
+import pytest
+
+from app.constants import REPORT_QUERY_BUDGETS
+from app.data.query_counter import QueryCounter, query_counts
+from app.data.report_queries import report_queries
+from app.services.report_cache import report_cache
+from app.gui.reports.sales.sales_content import SalesTab
+from app.gui.reports.customers.customers_content import CustomersTab
+from app.gui.reports.supplies.supplies_content import SuppliesTab
+from app.gui.reports.suppliers.suppliers_content import SuppliersTab
+
+
+# Consultas de load_data() sin nada en caché (ventas: + 1 de los meses cerrados)
+TAB_QUERIES = [
+    (SalesTab, "sales", 3),
+    (CustomersTab, "customers", 1),
+    (SuppliesTab, "supplies", 3),
+    (SuppliersTab, "suppliers", 2),
+]
+
+
+@pytest.fixture(autouse=True)
+def empty_cache(seeded_db):
+    report_cache.clear()
+    report_cache.forget_closed()
+    yield
+    report_cache.clear()
+
+
+def load(tab_class):
+    # load_data() no toca widgets: se prueba sin crear la ventana
+    tab = object.__new__(tab_class)
+    with QueryCounter() as counter:
+        data = tab.load_data()
+    return data, counter.count
+
+
+@pytest.mark.parametrize("tab_class, name, expected", TAB_QUERIES)
+def test_tab_queries_per_render(tab_class, name, expected):
+    data, count = load(tab_class)
+
+    assert data
+    assert count == expected
+    assert query_counts[name] == expected
+    assert count <= REPORT_QUERY_BUDGETS[name]
+
+
+def test_sales_closed_months_come_from_disk():
+    load(SalesTab)
+    report_cache.clear()
+
+    _data, count = load(SalesTab)
+    assert count == 2
+
+
+@pytest.mark.parametrize("tab_class, name, expected", TAB_QUERIES)
+def test_cached_render_does_not_query(tab_class, name, expected):
+    first, _count = load(tab_class)
+    second, count = load(tab_class)
+
+    assert count == 0
+    assert second is first
+
+
+@pytest.mark.parametrize("loader, name", [
+    (report_queries.customer_products, "customer_products"),
+    (report_queries.supplier_purchases, "supplier_purchases"),
+])
+def test_dialog_queries(loader, name):
+    with QueryCounter() as counter:
+        rows = loader(1)
+
+    assert rows
+    assert counter.count == 1 == REPORT_QUERY_BUDGETS[name]
@@ -0,0 +1,128 @@
+"""
+Forma de los resultados que se mandan al modelo (result_shaper): ocho
+consultas típicas del asistente contra la DB de seed_data.py se comparan
+con tests/golden/<nombre>.txt.
+
+Si un cambio en el formato es a propósito, se regeneran con:
+    TORTILLERIA_UPDATE_GOLDEN=1 python -m pytest tests/test_result_shaper.py
+"""
+
+import os
+
+import pytest
+
+from app.constants import AI_RESULT_SUMMARY_ROWS, AI_RESULT_TOP_N
+from app.services.db_tool import DatabaseTool
+from app.services.result_shaper import ResultShaper, format_cell, format_number
+
+
+GOLDEN_DIR = os.path.join(os.path.dirname(__file__), "golden")
+UPDATE_GOLDEN = os.environ.get("TORTILLERIA_UPDATE_GOLDEN") == "1"
+
+QUERIES = {
+    "ventas_por_mes": (
+        "SELECT strftime('%Y-%m', date) AS mes, COUNT(*) AS tickets, SUM(total) AS total "
+        "FROM sales GROUP BY mes ORDER BY mes"
+    ),
+    "top_productos": (
+        "SELECT p.name, SUM(d.quantity) AS cantidad, SUM(d.subtotal) AS total "
+        "FROM sales_detail d JOIN products p ON p.id = d.product_id "
+        "GROUP BY p.id ORDER BY total DESC LIMIT 10"
+    ),
+    "ventas_dia": (
+        "SELECT id, date, total, customer_id FROM sales "
+        "WHERE date >= '2026-01-10' AND date < '2026-01-11' ORDER BY date"
+    ),
+    "pedidos_pendientes": (
+        "SELECT id, date, total, amount_paid, status FROM orders "
+        "WHERE status = 'pendiente' ORDER BY date"
+    ),
+    "clientes_gasto": (
+        "SELECT c.customer_name, c.customer_category, COUNT(o.id) AS pedidos, SUM(o.total) AS total, "
+        "AVG(o.total) AS promedio, 1.0 * COUNT(o.id) / (SELECT COUNT(*) FROM orders) AS proporcion "
+        "FROM customers c JOIN orders o ON o.customer_id = c.id GROUP BY c.id ORDER BY total DESC"
+    ),
+    # datetime() deja la hora en 00:00:00: se debe quitar
+    "compras_insumo": (
+        "SELECT datetime(purchase_date) AS fecha, quantity, unit_price, total_price "
+        "FROM supply_purchases WHERE supply_id = 2 ORDER BY purchase_date, id"
+    ),
+    "promedio_ticket": (
+        "SELECT AVG(total) AS ticket_promedio, MIN(total) AS minimo, MAX(total) AS maximo FROM sales"
+    ),
+    "ventas_listado": "SELECT id, date, total FROM sales ORDER BY date",
+}
+
+
+@pytest.fixture(scope="module")
+def tool(seeded_db):
+    return DatabaseTool()
+
+
+@pytest.fixture
+def shaper():
+    return ResultShaper()
+
+
+def shape(tool, shaper, sql, capsys):
+    result = tool.execute_sql(sql)
+    assert result["success"], result.get("error")
+    content = shaper.shape(result)
+    capsys.readouterr()
+    return result, content
+
+
+@pytest.mark.parametrize("name", sorted(QUERIES))
+def test_golden(tool, shaper, name, capsys):
+    _, content = shape(tool, shaper, QUERIES[name], capsys)
+    path = os.path.join(GOLDEN_DIR, f"{name}.txt")
+
+    if UPDATE_GOLDEN:
+        os.makedirs(GOLDEN_DIR, exist_ok=True)
+        with open(path, "w", encoding="utf-8", newline="\n") as f:
+            f.write(content + "\n")
+
+    with open(path, encoding="utf-8") as f:
+        assert content == f.read().rstrip("\n")
+
+
+def test_summary_threshold(tool, shaper, capsys):
+    result, content = shape(tool, shaper, QUERIES["ventas_listado"], capsys)
+    assert result["row_count"] > AI_RESULT_SUMMARY_ROWS
+    lines = content.split("\n")
+    # renglones: ..., encabezado, top-N, "… N renglones más", resumen
+    assert lines[0].startswith(f"renglones: {result['row_count']} de ")
+    assert lines[2 + AI_RESULT_TOP_N].startswith("… ")
+    assert lines[3 + AI_RESULT_TOP_N].startswith(f"resumen de {result['row_count']} renglones: ")
+
+    limit = f"SELECT id, date, total FROM sales ORDER BY date LIMIT {AI_RESULT_SUMMARY_ROWS}"
+    result, content = shape(tool, shaper, limit, capsys)
+    assert content.count("\n") == AI_RESULT_SUMMARY_ROWS
+    assert "resumen" not in content
+    assert shaper.stats["summarized"] == 1
+
+
+@pytest.mark.parametrize("value, expected", [
+    (0.123456, "0.123"),
+    (0.000123456, "0.000123"),
+    (-0.5, "-0.5"),
+    (12.3456, "12.35"),
+    (12.5, "12.5"),
+    (3.0, "3"),
+    (7, "7"),
+])
+def test_format_number(value, expected):
+    assert format_number(value) == expected
+
+
+@pytest.mark.parametrize("value, expected", [
+    ("2026-01-15 00:00:00", "2026-01-15"),
+    ("2026-01-15T00:00:00.123456", "2026-01-15"),
+    ("2026-01-15 08:30:59", "2026-01-15 08:30"),
+    ("2026-01-15 08:30:59+00:00", "2026-01-15 08:30"),
+    ("pendiente", "pendiente"),
+    ("a|b\nc", "a/b c"),
+    (None, ""),
+])
+def test_format_cell(value, expected):
+    assert format_cell(value) == expected
@@ -0,0 +1,63 @@
+"""
+Cola de ventas: al cerrar, stop() no regresa hasta que todas las ventas
+encoladas (que en pantalla ya se cobraron) quedaron guardadas.
+"""
+
+import threading
+import time
+
+import pytest
+
+import app.services.sale_queue as sale_queue_module
+from app.services.sale_queue import SaleQueue
+
+
+class SlowSaleProvider:
+    """save_many lento que solo anota las ventas guardadas."""
+
+    def __init__(self, delay):
+        self.delay = delay
+        self.saved = []
+        self._lock = threading.Lock()
+
+    def save_many(self, sales):
+        time.sleep(self.delay)
+        with self._lock:
+            start = len(self.saved)
+            self.saved.extend(sales)
+        return True, list(range(start + 1, start + len(sales) + 1))
+
+
+@pytest.fixture
+def provider(monkeypatch):
+    provider = SlowSaleProvider(delay=0.05)
+    monkeypatch.setattr(sale_queue_module, "sale_provider", provider)
+    monkeypatch.setattr(sale_queue_module, "SALE_QUEUE_BATCH_SIZE", 2)
+    return provider
+
+
+def submit(sale_queue, count):
+    return [sale_queue.submit([{"id": 1, "quantity": 1}], 10.0 * (i + 1), 1) for i in range(count)]
+
+
+def test_stop_waits_for_every_queued_sale(provider):
+    sale_queue = SaleQueue()
+    futures = submit(sale_queue, 9)
+
+    sale_queue.stop()
+
+    assert all(future.done() for future in futures)
+    assert [future.result() for future in futures] == list(range(1, 10))
+    assert [sale["total"] for sale in provider.saved] == [10.0 * (i + 1) for i in range(9)]
+
+
+def test_stop_saves_sales_queued_after_the_worker_ended(provider):
+    sale_queue = SaleQueue()
+    sale_queue.stop()
+
+    # Venta que quedó en la sale_queue sin hilo que la atienda
+    future = sale_queue_module.Future()
+    sale_queue._queue.put(({"items": [], "total": 5.0, "customer_id": 1}, future))
+    sale_queue.stop()
+
+    assert future.result(timeout=0) == 1
@@ -0,0 +1,108 @@
+"""
+Authorizer de solo lectura del asistente (readonly_db + validate_sql): las
+consultas de sql_fuzz.py que solo leen pasan aunque traigan comentarios,
+CTE o palabras peligrosas en literales; las que escriben, PRAGMA, ATTACH,
+load_extension o varias sentencias se rechazan, tampoco se ejecutan y la
+DB no cambia. Las repetidas salen del LRU sin volver a compilarse.
+"""
+
+import contextlib
+import io
+
+import pytest
+from sqlalchemy import text
+
+import app.services.db_tool as db_tool_module
+from app.data.database import engine
+from app.services.db_tool import DatabaseTool
+from sql_fuzz import SqlFuzzer
+
+
+@pytest.fixture
+def tool(seeded_db):
+    return DatabaseTool()
+
+
+@pytest.fixture(scope="module")
+def queries(seeded_db):
+    return SqlFuzzer(seed=20).mix(valid=300, invalid=100)
+
+
+def quiet(fn, *args):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return fn(*args)
+
+
+def table_counts():
+    with engine.connect() as connection:
+        names = [name for (name,) in connection.execute(text(
+            "SELECT name FROM sqlite_master WHERE type = 'table' AND name NOT LIKE 'sqlite%'"
+        ))]
+        return {name: connection.execute(text(f'SELECT COUNT(*) FROM "{name}"')).scalar() for name in names}
+
+
+def test_fuzzed_queries(tool, queries):
+    wrong = [(sql, ok) for sql, ok in queries if tool.validate_sql(sql)[0] != ok]
+    assert not wrong, wrong[:5]
+
+
+@pytest.mark.parametrize("sql, denied", [
+    ("SELECT id FROM sales -- DELETE FROM sales", None),
+    ("SELECT id FROM sales /* DROP TABLE sales */ LIMIT 1", None),
+    ("SELECT 'DELETE FROM sales; --' AS nota FROM sales LIMIT 1", None),
+    ("SELECT id AS created_at, 'update' AS union_ FROM sales LIMIT 1", None),
+    ("WITH recent AS (SELECT id FROM sales) SELECT COUNT(*) FROM recent", None),
+    ("WITH x AS (SELECT 1) DELETE FROM sales", "DELETE"),
+    ("PRAGMA writable_schema = 1", "PRAGMA"),
+    ("ATTACH DATABASE 'otra.db' AS otra", "ATTACH"),
+    ("SELECT load_extension('x')", "load_extension"),
+    ("SELECT id FROM sales; DELETE FROM sales", ""),
+    ("VACUUM", ""),
+])
+def test_statement(tool, sql, denied):
+    ok, error = tool.validate_sql(sql)
+    assert ok == (denied is None), error
+    if denied:
+        assert denied in error
+
+
+def test_invalid_queries_are_not_executed(tool, queries):
+    before = table_counts()
+
+    invalid = list(dict.fromkeys(sql for sql, ok in queries if not ok))
+    executed = [sql for sql in invalid if quiet(tool.execute_sql, sql)["success"]]
+
+    assert not executed, executed[:5]
+    assert table_counts() == before
+
+
+def test_repeated_queries_hit_the_cache(tool, monkeypatch):
+    sql = "SELECT id, total FROM sales WHERE total > 10 LIMIT 5"
+    assert tool.validate_sql(sql) == (True, "")
+
+    # Acierto: no se vuelve a compilar; da igual el espacio o el ';' final
+    monkeypatch.setattr(tool, "_check_readonly", lambda sql: pytest.fail("se volvió a compilar"))
+    assert tool.validate_sql(sql) == (True, "")
+    assert tool.validate_sql(f"  {sql.replace(' ', chr(10), 1)} ; ") == (True, "")
+    assert tool.stats["validated_hits"] == 2
+    assert tool.stats["validated_misses"] == 1
+
+
+def test_rejected_queries_are_not_cached(tool):
+    sql = "DELETE FROM sales"
+    assert not tool.validate_sql(sql)[0]
+    assert not tool.validate_sql(sql)[0]
+    assert tool.stats["validated_hits"] == 0
+    assert tool.stats["rejected"] == 2
+
+
+def test_cache_is_lru(tool, monkeypatch):
+    monkeypatch.setattr(db_tool_module, "AI_SQL_VALIDATED_CACHE", 2)
+    first, second, third = (f"SELECT id FROM sales LIMIT {n}" for n in (1, 2, 3))
+
+    tool.validate_sql(first)
+    tool.validate_sql(second)
+    tool.validate_sql(first)  # first queda como la más reciente
+    tool.validate_sql(third)  # sale second
+
+    assert list(tool._validated) == [tool._normalize(first), tool._normalize(third)]
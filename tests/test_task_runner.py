@@ -0,0 +1,36 @@
+"""
+task_runner.post: lo publicado antes de start() se entrega en el primer
+poll, en el hilo del event loop.
+"""
+
+from app.services.task_runner import TaskRunner
+
+
+class FakeRoot:
+    """Raíz de Tkinter mínima: after() guarda el callback sin correrlo."""
+
+    def __init__(self):
+        self.scheduled = []
+
+    def after(self, _ms, fn):
+        self.scheduled.append(fn)
+
+    def winfo_exists(self):
+        return True
+
+
+def test_post_before_start_is_delivered():
+    runner = TaskRunner(max_workers=1)
+    delivered = []
+
+    runner.post(delivered.append, "antes de start")
+    assert delivered == []
+
+    root = FakeRoot()
+    runner.start(root)
+    assert delivered == ["antes de start"]
+
+    runner.post(delivered.append, "después")
+    root.scheduled.pop()()
+    assert delivered == ["antes de start", "después"]
+    runner.shutdown()